@@ -0,0 +1,324 @@
+# app/address.py
+"""
+한국 행정구역 주소 파서 + 지역 트리
+
+    codes = address.parse(df["_addr"])     # → DataFrame(_sido, _sgg, _emd, _road) int32, 0 = 모름
+    ref = address.resolve("광주")           # → RegionRef(codes={29})
+    mask = ref.mask(codes)                  # 정수 비교만 (문자열 스캔 없음)
+
+파싱 (로드 시 1번, pandas 문자열 연산으로 벡터화)
+- 유니코드 NFC + 공백 정리
+- 첫 토큰 → 시도 (별칭: 서울/서울시/서울특별시, 강원도/강원특별자치도 …)
+- 그 다음(시도가 없으면 첫) 토큰이 시/군/구로 끝나면 → 시군구 (수원시 팔달구 같은 일반구는 시 단위로)
+- 읍면동: 괄호 안 법정동("(교동)", "(삼덕동2가, …)", "132(중문동)")이 있으면 그것, 없으면
+  읍/면/동/N가 로 끝나는 첫 토큰 (도로명 + 지번을 이어 붙인 주소(_addr)면 지번 쪽 동 이름)
+  숫자 바로 뒤 동("101동", "아이파크102동", "래미안101동")은 아파트 건물 동이라 제외
+- 도로명 + 건물번호 앞의 도로명 ("세종대로 110" → 세종대로) → 도로 코드
+
+건물 키 (road_keys, 식당/카페 중복 병합용)
+- "시군구 코드 + 도로명 + 건물번호" → 시도/시군구를 앞에 붙였는지, 지번/층/호가 뒤에 붙었는지 달라도 같은 값
+- 도로명을 못 찾으면 공백/문장부호 뺀 주소 전체 (형식이 다르면 다른 건물로 봄)
+
+코드
+- 시도: 행정표준코드 앞 2자리 (11 서울 … 50 제주)
+- 시군구 = 시도 * 1000 + 순번, 읍면동 = 시군구 * 1000 + 순번 (프로세스 안에서 등록 순서대로 부여)
+  → 상위 코드 = 하위 코드 // 1000, 크기로 단계 구분 (시도 < 100 ≤ 시군구 < 100000 ≤ 읍면동)
+- 도로: 도로명마다 순번 (행정구역 트리와 별개)
+
+지역 트리 / 키워드 해석 (resolve)
+- 정식 이름/별칭이 같은 노드가 있으면 그 노드들만 (모든 단계에서)
+  "광주" → 광주광역시 (경기도 광주시는 "광주시"), "중구" → 모든 중구
+- 없으면 접미사 뗀 이름이 같은 노드를 모든 단계에서 모아 합침 + (한 단어 키워드면) 같은 이름의 도로
+  "종로" → 종로구 + 종로1가~6가(대구 중구 종로1가 포함) + 종로/종로N길, "강남" → 강남구 + 강남동 + 강남로/강남대로,
+  "강릉" → 강릉시, "성수" → 성수동1가/성수동2가
+  (첫 단계에서 멈추면 부분 문자열 검색보다 결과가 빠짐 → 정확도를 위해 recall 을 잃지 않게)
+- "서울 중구" 처럼 띄어 쓰면 앞 지역 안에서 다음 이름을 찾음
+- KEYWORD_ALIASES: 주소에 없는 여행지 이름 (홍대 → 마포구)
+- 해석 안 되는 키워드는 None → 호출 쪽에서 기존 부분 문자열 검색
+- 트리는 파싱된 주소로 채워짐 (데이터에 나온 시군구/읍면동만 앎)
+"""
+from __future__ import annotations
+
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from app.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+SIDO = "sido"
+SGG = "sgg"
+EMD = "emd"
+ROAD = "road"
+LEVELS = [SIDO, SGG, EMD]  # 행정구역 트리 단계 (도로는 트리 밖)
+CODE_COLS = {SIDO: "_sido", SGG: "_sgg", EMD: "_emd", ROAD: "_road"}
+
+# 시도 코드 → (정식 이름, 별칭들)
+SIDO_NAMES: Dict[int, Tuple[str, List[str]]] = {
+    11: ("서울특별시", ["서울", "서울시"]),
+    26: ("부산광역시", ["부산", "부산시"]),
+    27: ("대구광역시", ["대구", "대구시"]),
+    28: ("인천광역시", ["인천", "인천시"]),
+    29: ("광주광역시", ["광주"]),  # "광주시"는 경기도 광주시
+    30: ("대전광역시", ["대전", "대전시"]),
+    31: ("울산광역시", ["울산", "울산시"]),
+    36: ("세종특별자치시", ["세종", "세종시"]),
+    41: ("경기도", ["경기"]),
+    42: ("강원특별자치도", ["강원", "강원도"]),
+    43: ("충청북도", ["충북"]),
+    44: ("충청남도", ["충남"]),
+    45: ("전북특별자치도", ["전북", "전라북도"]),
+    46: ("전라남도", ["전남"]),
+    47: ("경상북도", ["경북"]),
+    48: ("경상남도", ["경남"]),
+    50: ("제주특별자치도", ["제주", "제주도"]),
+}
+SIDO_BY_NAME: Dict[str, int] = {
+    name: code for code, (full, aliases) in SIDO_NAMES.items() for name in [full] + aliases
+}
+NO_SIDO = 99  # 시도 없이 시군구부터 시작하는 주소의 시군구는 이 가상 부모 아래에 등록
+
+# 주소에 안 나오는 여행지 이름 → 행정구역 이름 (프론트 지역 선택 화면 값)
+KEYWORD_ALIASES = {"홍대": "마포구", "울릉도": "울릉군"}
+
+_SPACES = re.compile(r"\s+")
+_SGG_RE = r"(\S+[시군구])"
+# 읍/면/동/N가 로 끝나는 토큰 (숫자로 시작하거나 숫자 바로 뒤 동인 아파트 건물 동 "101동", "아이파크102동" 제외)
+_EMD_NAME = r"([가-힣][가-힣0-9·.]*?(?:\d+가|[읍면가]|(?<!\d)동))"
+_EMD_RE = r"(?:^|[\s(,])" + _EMD_NAME + r"(?=[\s,)]|$)"
+# 도로명주소 끝 괄호 안 법정동 ("(교동)", "(삼덕동2가, 동성로 SK 리더스뷰)") — 건물 이름보다 우선
+_EMD_PAREN_RE = r"\(\s*" + _EMD_NAME + r"\s*[,)]"
+# 도로명 + 건물번호 ("세종대로 110", "큰장로26길 25-3") — 토큰 단위 ("종로5가" 같은 동 이름은 안 걸림)
+_ROAD_RE = r"(?:^|\s)([가-힣0-9·.]+(?:로|길))\s+(\d+(?:-\d+)?)(?=[\s,(]|$)"
+# 이름 → 접미사 뗀 이름들 (성수동1가 → 성수동 → 성수, 강릉시 → 강릉)
+_STEM_SUFFIXES = [re.compile(p) for p in (r"\d+가$", r"[읍면동]$", r"[시군구]$")]
+# 도로명 → 접미사 뗀 이름들 (큰장로26길 → 큰장로 → 큰장, 강남대로 → 강남)
+_ROAD_SUFFIXES = [re.compile(p) for p in (r"\d+번?길$", r"(?:대로|로|길)$")]
+
+
+def normalize(text) -> str:
+    """NFC + 공백 정리 (결측은 빈 문자열)"""
+    if not isinstance(text, str):
+        return ""
+    return _SPACES.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def _stems(name: str, suffixes=_STEM_SUFFIXES) -> List[str]:
+    out = []
+    cur = name
+    for suffix in suffixes:
+        nxt = suffix.sub("", cur)
+        if nxt != cur and len(nxt) >= 2:
+            out.append(nxt)
+            cur = nxt
+    return out
+
+
+class RegionTree:
+    """시도 → 시군구 → 읍면동 (파싱하면서 채워짐, 스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.names: Dict[int, str] = {code: full for code, (full, _) in SIDO_NAMES.items()}
+        self.children: Dict[int, List[int]] = {}
+        self._codes: Dict[Tuple[int, str], int] = {}
+        self._roads: Dict[str, int] = {}
+        # 단계별 검색 키 → 코드들: 정식 이름/별칭 (_names), 접미사 뗀 이름 (_stems)
+        self._names: Dict[str, Dict[str, set]] = {SIDO: {}, SGG: {}, EMD: {}, ROAD: {}}
+        self._stems: Dict[str, Dict[str, set]] = {SIDO: {}, SGG: {}, EMD: {}, ROAD: {}}
+        for name, code in SIDO_BY_NAME.items():
+            self._names[SIDO].setdefault(name, set()).add(code)
+        self.version = 0
+
+    def intern(self, level: str, parent: int, name: str) -> int:
+        key = (parent, name)
+        code = self._codes.get(key)
+        if code is not None:
+            return code
+        with self._lock:
+            code = self._codes.get(key)
+            if code is None:
+                siblings = self.children.setdefault(parent, [])
+                code = parent * 1000 + len(siblings) + 1
+                siblings.append(code)
+                self.names[code] = name
+                self._names[level].setdefault(name, set()).add(code)
+                for k in _stems(name):
+                    self._stems[level].setdefault(k, set()).add(code)
+                self._codes[key] = code
+                self.version += 1
+        return code
+
+    def intern_road(self, name: str) -> int:
+        """도로명 → 도로 코드 (행정구역과 별개 번호, 1부터)"""
+        code = self._roads.get(name)
+        if code is not None:
+            return code
+        with self._lock:
+            code = self._roads.get(name)
+            if code is None:
+                code = len(self._roads) + 1
+                self._names[ROAD].setdefault(name, set()).add(code)
+                for k in _stems(name, _ROAD_SUFFIXES):
+                    self._stems[ROAD].setdefault(k, set()).add(code)
+                self._roads[name] = code
+                self.version += 1
+        return code
+
+    def lookup(self, level: str, name: str, within: Optional[FrozenSet[int]] = None,
+               stems: bool = False) -> FrozenSet[int]:
+        """정식 이름/별칭이 같은 코드들 (stems=True 면 접미사 뗀 이름이 같은 코드들)"""
+        codes = (self._stems if stems else self._names)[level].get(name, ())
+        if within is not None:
+            codes = [c for c in codes if _ancestor(c, within)]
+        return frozenset(codes)
+
+
+def _ancestor(code: int, parents: FrozenSet[int]) -> bool:
+    # 상위 코드 = 하위 코드 // 1000
+    while code >= 100:
+        code //= 1000
+        if code in parents:
+            return True
+    return False
+
+
+def level_of(code: int) -> str:
+    """행정구역 코드 → 단계 (코드 크기로)"""
+    if code < 100:
+        return SIDO
+    return SGG if code < 100_000 else EMD
+
+
+TREE = RegionTree()
+
+
+@dataclass(frozen=True)
+class RegionRef:
+    codes: FrozenSet[int]                   # 행정구역 코드 (여러 단계가 섞일 수 있음)
+    roads: FrozenSet[int] = frozenset()     # 같은 이름 도로 코드 (행 = 행정구역 ∪ 도로)
+
+    def by_level(self) -> Dict[str, List[int]]:
+        """코드 컬럼 단계 → 코드들 (도로 포함)"""
+        out: Dict[str, List[int]] = {}
+        for code in sorted(self.codes):
+            out.setdefault(level_of(code), []).append(code)
+        if self.roads:
+            out[ROAD] = sorted(self.roads)
+        return out
+
+    def mask(self, codes: pd.DataFrame):
+        """codes(parse 결과) 중 이 지역에 속하는 행 → bool ndarray"""
+        mask = np.zeros(len(codes), dtype=bool)
+        for level, level_codes in self.by_level().items():
+            mask |= np.isin(codes[CODE_COLS[level]].to_numpy(), np.asarray(level_codes, dtype=np.int64))
+        return mask
+
+    def covers(self, other: "RegionRef") -> bool:
+        """other 지역이 이 지역과 겹치는지 (같은 코드이거나 한쪽이 다른 쪽의 상위, 도로는 안 봄)"""
+        return any(
+            a == b or _ancestor(a, frozenset([b])) or _ancestor(b, frozenset([a]))
+            for a in self.codes for b in other.codes
+        )
+
+
+_resolve_cache: Dict[str, Tuple[int, Optional[RegionRef]]] = {}
+RESOLVE_CACHE_SIZE = 10000  # 키워드는 사용자 입력이라 상한
+
+
+def resolve(keyword: Optional[str]) -> Optional[RegionRef]:
+    """키워드 → 지역 코드 집합 (모르는 이름이면 None)"""
+    kw = normalize(keyword)
+    kw = KEYWORD_ALIASES.get(kw, kw)
+    if not kw:
+        return None
+    hit = _resolve_cache.get(kw)
+    if hit is not None and hit[0] == TREE.version:
+        return hit[1]
+
+    ref: Optional[RegionRef] = None
+    within: Optional[FrozenSet[int]] = None
+    start = 0
+    tokens = kw.split(" ")
+    for token in tokens:
+        # 정식 이름/별칭 우선, 없으면 접미사 뗀 이름 — 어느 쪽이든 남은 모든 단계에서 모음
+        stems = False
+        found = [(i, TREE.lookup(LEVELS[i], token, within)) for i in range(start, len(LEVELS))]
+        if not any(codes for _, codes in found):
+            stems = True
+            found = [(i, TREE.lookup(LEVELS[i], token, within, stems=True)) for i in range(start, len(LEVELS))]
+        found = [(i, codes) for i, codes in found if codes]
+        if not found:
+            ref = None
+            break
+        start = found[0][0] + 1
+        within = frozenset().union(*(codes for _, codes in found))
+        roads = TREE.lookup(ROAD, token, stems=True) | TREE.lookup(ROAD, token) if stems and len(tokens) == 1 \
+            else frozenset()
+        ref = RegionRef(within, roads)
+    if len(_resolve_cache) >= RESOLVE_CACHE_SIZE:
+        _resolve_cache.clear()
+    _resolve_cache[kw] = (TREE.version, ref)
+    return ref
+
+
+def parse(addresses) -> pd.DataFrame:
+    """주소 Series/리스트 → 행정구역 코드 DataFrame (_sido, _sgg, _emd), index 유지"""
+    s = pd.Series(addresses) if not isinstance(addresses, pd.Series) else addresses
+    s = (
+        s.astype(object).where(s.notna(), "").astype(str)
+        .str.normalize("NFC").str.replace(_SPACES, " ", regex=True).str.strip()
+    )
+    first = s.str.extract(r"^(\S+)", expand=False)
+    second = s.str.extract(r"^\S+\s+(\S+)", expand=False)
+    emd = s.str.extract(_EMD_PAREN_RE, expand=False).fillna(s.str.extract(_EMD_RE, expand=False))
+    road = s.str.extract(_ROAD_RE)[0]
+
+    sido = first.map(SIDO_BY_NAME).fillna(0).astype(np.int64)
+    # 시도가 있으면 다음 토큰, 없으면 첫 토큰이 시군구 후보
+    sgg_name = second.where(sido > 0, first)
+    sgg_name = sgg_name.where(sgg_name.str.fullmatch(_SGG_RE, na=False), "")
+
+    out = pd.DataFrame(index=s.index)
+    out["_sido"] = sido.to_numpy(dtype=np.int32)
+
+    # 고유 (시도, 시군구), (시군구, 읍면동) 조합만 트리에 등록 → 행에는 정수 코드 매핑
+    sgg_codes = np.zeros(len(s), dtype=np.int32)
+    pairs = pd.DataFrame({"p": np.where(sido > 0, sido, NO_SIDO), "n": sgg_name.fillna("").to_numpy()})
+    keys, uniques = pd.MultiIndex.from_frame(pairs).factorize()
+    lut = np.array([TREE.intern(SGG, int(p), n) if n else 0 for p, n in uniques], dtype=np.int32)
+    if len(lut):
+        sgg_codes = lut[keys]
+    out["_sgg"] = sgg_codes
+
+    emd_codes = np.zeros(len(s), dtype=np.int32)
+    parent = np.where(sgg_codes > 0, sgg_codes, out["_sido"].to_numpy()).astype(np.int64)
+    pairs = pd.DataFrame({"p": parent, "n": emd.fillna("").to_numpy()})
+    keys, uniques = pd.MultiIndex.from_frame(pairs).factorize()
+    lut = np.array([TREE.intern(EMD, int(p), n) if (n and p) else 0 for p, n in uniques], dtype=np.int32)
+    if len(lut):
+        emd_codes = lut[keys]
+    out["_emd"] = emd_codes
+
+    keys, uniques = pd.factorize(road)
+    lut = np.array([TREE.intern_road(n) for n in uniques], dtype=np.int32)
+    out["_road"] = np.where(keys >= 0, lut[keys], 0).astype(np.int32) if len(lut) else np.zeros(len(s), np.int32)
+    return out
+
+
+def road_keys(addresses, codes: pd.DataFrame) -> pd.Series:
+    """주소 + parse() 코드 → 건물 비교 키 Series (결측 주소는 빈 문자열)"""
+    s = pd.Series(addresses) if not isinstance(addresses, pd.Series) else addresses
+    s = s.astype(object).where(s.notna(), "").astype(str)
+    road = s.str.extract(_ROAD_RE)
+    sgg, sido = codes["_sgg"].to_numpy(), codes["_sido"].to_numpy()
+    region = pd.Series(np.where(sgg > 0, sgg, sido), index=s.index)
+    keyed = road[0].notna() & (region > 0)
+    out = pd.Series("", index=s.index, dtype=object)
+    out[keyed] = region[keyed].astype(str) + " " + road.loc[keyed, 0] + " " + road.loc[keyed, 1]
+    out[~keyed] = s[~keyed].str.lower().str.replace(r"[\W_]+", "", regex=True)
+    return out
@@ -0,0 +1,131 @@
+# app/bm25.py
+"""
+관련도 순 전문 검색용 BM25 역색인 (로드 시 1번 빌드)
+
+    index = BM25Index([names, descriptions], weights=[2.0, 1.0])
+    positions, scores = index.search("케이블카 야경", k=80)   # 관련도 높은 순 (같으면 위치 오름차순)
+
+- 토큰: 소문자로 바꾼 뒤 한글 연속 구간은 글자 bigram(1글자면 그대로), 영문/숫자는 단어 단위
+  → 형태소 분석기 없이 조사/붙여쓰기에 덜 민감 ("케이블카를" 도 "케이블카" bigram 3개 중 3개 일치)
+- 필드 가중치: 필드별 tf/문서 길이에 가중치를 곱해 합침 (BM25F 단순형, 이름에 더 큰 가중치)
+- 색인: 용어별 (문서 위치, tf) posting 을 용어 순서로 이어 붙인 배열 + 용어 → 구간
+  (문서마다 파이썬 dict 를 만들지 않고 (용어, 문서) 쌍 전체를 한 번에 묶어서 셈)
+- 질의: 질의 용어 posting 만 점수 계산 → 문서별 합산 → 상위 k 는 heap
+  (k 번째 점수보다 낮은 후보는 numpy 로 먼저 걸러서 heap 에는 k개 안팎만 들어감)
+"""
+from __future__ import annotations
+
+import heapq
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+K1 = float(os.getenv("BM25_K1", "1.2"))
+B = float(os.getenv("BM25_B", "0.75"))
+
+_WORD = re.compile(r"[가-힣]+|[0-9a-z]+")
+
+
+@lru_cache(maxsize=1 << 16)
+def _word_tokens(word: str) -> Tuple[str, ...]:
+    # 같은 단어가 문서마다 반복되니 단어 → bigram 은 캐시
+    if "가" <= word[0] <= "힣" and len(word) > 1:
+        return tuple(word[i:i + 2] for i in range(len(word) - 1))
+    return (word,)
+
+
+def tokens(text) -> List[str]:
+    """문자열 → 토큰 (결측은 빈 리스트)"""
+    if not isinstance(text, str):
+        return []
+    out: List[str] = []
+    for word in _WORD.findall(text.lower()):
+        out.extend(_word_tokens(word))
+    return out
+
+
+class BM25Index:
+    def __init__(self, fields: Sequence[Sequence[str]], weights: Optional[Sequence[float]] = None,
+                 k1: float = K1, b: float = B):
+        weights = list(weights) if weights is not None else [1.0] * len(fields)
+        self.size = len(fields[0]) if fields else 0
+        self.k1 = k1
+
+        # (용어, 문서, 가중치) 쌍 전체 → 용어 코드로 묶어서 (용어, 문서)별 tf 합
+        terms: List[str] = []
+        doc_parts, weight_parts = [], []
+        lengths = np.zeros(self.size, dtype=np.float64)
+        for field, weight in zip(fields, weights):
+            field_tokens = [tokens(t) for t in field]
+            counts = np.fromiter((len(t) for t in field_tokens), dtype=np.int64, count=self.size)
+            lengths += weight * counts
+            terms.extend(t for toks in field_tokens for t in toks)
+            doc_parts.append(np.repeat(np.arange(self.size, dtype=np.int64), counts))
+            weight_parts.append(np.full(int(counts.sum()), weight, dtype=np.float64))
+        codes, vocab = pd.factorize(pd.Series(terms, dtype=object))
+        docs = np.concatenate(doc_parts) if doc_parts else np.empty(0, dtype=np.int64)
+        tf_weights = np.concatenate(weight_parts) if weight_parts else np.empty(0)
+
+        keys, inverse = np.unique(np.asarray(codes, dtype=np.int64) * max(self.size, 1) + docs, return_inverse=True)
+        self.docs = (keys % max(self.size, 1)).astype(np.int32)   # 용어 순서, 같은 용어 안에서는 문서 위치 순
+        self.tfs = np.bincount(inverse, weights=tf_weights, minlength=len(keys)).astype(np.float32)
+        term_of = keys // max(self.size, 1)
+        self.offsets = np.searchsorted(term_of, np.arange(len(vocab) + 1))
+        self.vocab: Dict[str, int] = {t: i for i, t in enumerate(vocab.tolist())}
+
+        df = np.diff(self.offsets)
+        self.idf = np.log(1 + (self.size - df + 0.5) / (df + 0.5))
+        avgdl = lengths.mean() if self.size and lengths.mean() > 0 else 1.0
+        # 문서 길이 보정 k1 * (1 - b + b * dl / avgdl) — 질의마다 다시 계산하지 않게
+        self.norm = (k1 * (1 - b + b * lengths / avgdl)).astype(np.float32)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def nbytes(self) -> int:
+        return self.docs.nbytes + self.tfs.nbytes + self.offsets.nbytes + self.norm.nbytes
+
+    def scores(self, query: str) -> Tuple[np.ndarray, np.ndarray]:
+        """질의 용어가 하나라도 있는 문서 (위치 오름차순, BM25 점수)"""
+        doc_parts, score_parts = [], []
+        for term in dict.fromkeys(tokens(query)):
+            i = self.vocab.get(term)
+            if i is None:
+                continue
+            lo, hi = self.offsets[i], self.offsets[i + 1]
+            docs, tf = self.docs[lo:hi], self.tfs[lo:hi].astype(np.float64)
+            doc_parts.append(docs)
+            score_parts.append(self.idf[i] * tf * (self.k1 + 1) / (tf + self.norm[docs]))
+        if not doc_parts:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        if len(doc_parts) == 1:
+            return doc_parts[0].astype(np.int64), score_parts[0]
+        docs, scores = np.concatenate(doc_parts), np.concatenate(score_parts)
+        if len(docs) * 8 >= self.size:
+            # posting 이 전체 문서 수에 비해 많으면 정렬보다 문서 수 길이 배열에 바로 합산이 빠름
+            dense = np.bincount(docs, weights=scores, minlength=self.size)
+            docs = np.flatnonzero(dense)
+            return docs, dense[docs]
+        docs, inverse = np.unique(docs, return_inverse=True)
+        return docs.astype(np.int64), np.bincount(inverse, weights=scores)
+
+    def search(self, query: str, k: int, allowed: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """관련도 상위 k개 (위치, 점수) — allowed(위치별 bool)가 있으면 그 문서만"""
+        docs, scores = self.scores(query)
+        if allowed is not None:
+            keep = allowed[docs]
+            docs, scores = docs[keep], scores[keep]
+        if len(docs) > k:
+            # k 번째 점수 미만은 heap 에 넣을 필요 없음 (같은 점수는 위치로 가려야 해서 남김)
+            kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+            keep = scores >= kth
+            docs, scores = docs[keep], scores[keep]
+        top = heapq.nlargest(k, zip(scores.tolist(), (-docs).tolist()))
+        return (np.array([-d for _, d in top], dtype=np.int64),
+                np.array([s for s, _ in top], dtype=np.float64))
@@ -0,0 +1,169 @@
+# app/csv_loader.py
+"""
+공용 CSV 로더
+- 파일 앞부분(64KB)만 보고 인코딩 판별 (utf-8-sig / utf-8 / cp949) → 전체 파싱은 1회
+  (청크 스트리밍은 도중에 재시도할 수 없어서 파싱 전에 파일 전체를 엄격 디코딩으로 확인)
+- 헤더만 먼저 읽어 필요한 컬럼만 usecols로 파싱 (컬럼명 앞뒤 공백 대응)
+- 컬럼별 dtype 명시: 반복 값이 많은 컬럼은 category, 주소 같은 긴 문자열은 compact string
+"""
+from __future__ import annotations
+
+import codecs
+import importlib.util
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+SNIFF_BYTES = 64 * 1024
+CHECK_BLOCK_BYTES = 1 << 20
+SNIFF_ENCODINGS = ["utf-8", "cp949"]  # cp949는 euc-kr 상위 호환
+
+# pyarrow가 있으면 Arrow 기반 문자열(파이썬 객체 없이 연속 버퍼), 없으면 object
+COMPACT_STR = "string[pyarrow]" if importlib.util.find_spec("pyarrow") else object
+CATEGORY = "category"
+
+
+def sniff_encoding(path: Path, sample_bytes: int = SNIFF_BYTES) -> str:
+    with open(path, "rb") as f:
+        head = f.read(sample_bytes)
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    for enc in SNIFF_ENCODINGS:
+        try:
+            # final=False: 샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음
+            codecs.getincrementaldecoder(enc)().decode(head, final=False)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    return "cp949"
+
+
+def _fallback(enc: str) -> str:
+    # 앞부분만 보고 판별했으니 뒤쪽에서 깨지면 나머지 후보로 한 번만 재시도
+    return "cp949" if enc.startswith("utf-8") else "utf-8"
+
+
+def decodes_fully(path: Path, enc: str, block_bytes: int = CHECK_BLOCK_BYTES) -> bool:
+    """파일 전체가 enc 로 오류 없이 디코딩되는지 (블록 단위라 메모리는 블록 크기만)"""
+    decoder = codecs.getincrementaldecoder(enc)()
+    try:
+        with open(path, "rb") as f:
+            while True:
+                block = f.read(block_bytes)
+                decoder.decode(block, final=not block)
+                if not block:
+                    return True
+    except UnicodeDecodeError:
+        return False
+
+
+def text_column(s: pd.Series) -> pd.Series:
+    """category/string/object 어느 dtype이든 결측은 ""로, 앞뒤 공백 제거한 문자열로"""
+    return s.astype(object).where(s.notna(), "").astype(str).str.strip()
+
+
+def _resolve_columns(
+    path: Path,
+    columns: List[str],
+    dtypes: Dict[str, object],
+    required: List[str],
+    enc: str,
+) -> Optional[Tuple[List[str], List[str], Dict[str, object]]]:
+    """헤더만 읽어 (strip된 이름, 원본 이름, 원본 이름 기준 dtype) 반환. required 누락이면 None"""
+    try:
+        header = pd.read_csv(path, encoding=enc, nrows=0)
+    except (UnicodeDecodeError, ValueError, OSError):
+        return None
+    raw_by_name = {str(c).strip(): c for c in header.columns}
+    if any(c not in raw_by_name for c in required):
+        return None
+
+    present = [c for c in columns if c in raw_by_name]
+    usecols = [raw_by_name[c] for c in present]
+    dtype = {raw_by_name[c]: dt for c, dt in dtypes.items() if c in raw_by_name}
+    return present, usecols, dtype
+
+
+def read_columns(
+    path: Path,
+    columns: List[str],
+    dtypes: Optional[Dict[str, object]] = None,
+    required: Optional[List[str]] = None,
+    encoding: Optional[str] = None,
+) -> Optional[pd.DataFrame]:
+    """
+    columns 중 파일에 있는 것만 파싱해 반환 (컬럼명은 strip된 이름).
+    required 컬럼이 하나라도 없거나 파싱 실패면 None.
+    """
+    required = columns if required is None else required
+    enc = encoding or sniff_encoding(path)
+    resolved = _resolve_columns(path, columns, dtypes or {}, required, enc)
+    if resolved is None:
+        return None
+    present, usecols, dtype = resolved
+
+    def _parse(encoding: str):
+        return pd.read_csv(
+            path, encoding=encoding, usecols=usecols, dtype=dtype, low_memory=False
+        )
+
+    try:
+        df = _parse(enc)
+    except UnicodeDecodeError:
+        try:
+            df = _parse(_fallback(enc))
+        except (UnicodeDecodeError, ValueError):
+            return None
+    except ValueError:
+        return None
+
+    df = df.rename(columns={raw: name for name, raw in zip(present, usecols)})
+    return df[present]
+
+
+def iter_columns(
+    path: Path,
+    columns: List[str],
+    chunksize: int,
+    dtypes: Optional[Dict[str, object]] = None,
+    required: Optional[List[str]] = None,
+    encoding: Optional[str] = None,
+) -> Optional[Iterator[pd.DataFrame]]:
+    """
+    read_columns 의 청크 버전 (파일 전체를 메모리에 올리지 않음).
+    청크 index는 파일 전체 기준 행 번호로 이어짐. required 누락이면 None.
+    스트리밍 중에는 다른 인코딩으로 재시도할 수 없으므로 먼저 파일 전체를 디코딩해 보고 인코딩 확정
+    (read_columns 와 같은 후보 1번 재시도, 둘 다 깨지면 None — 깨진 글자를 U+FFFD 로 바꿔 넣지 않음).
+    """
+    required = columns if required is None else required
+    enc = encoding or sniff_encoding(path)
+    if not decodes_fully(path, enc):
+        fallback = _fallback(enc)
+        if not decodes_fully(path, fallback):
+            print(f"[CSV] {path}: not decodable as {enc} or {fallback}")
+            return None
+        print(f"[CSV] {path}: not decodable as {enc}, using {fallback}")
+        enc = fallback
+    resolved = _resolve_columns(path, columns, dtypes or {}, required, enc)
+    if resolved is None:
+        return None
+    present, usecols, dtype = resolved
+    rename = {raw: name for name, raw in zip(present, usecols)}
+
+    def _chunks() -> Iterator[pd.DataFrame]:
+        reader = pd.read_csv(
+            path,
+            encoding=enc,
+            usecols=usecols,
+            dtype=dtype,
+            chunksize=chunksize,
+            low_memory=False,
+        )
+        with reader:
+            for chunk in reader:
+                yield chunk.rename(columns=rename)[present]
+
+    return _chunks()
@@ -0,0 +1,255 @@
+# app/datasets.py
+"""
+데이터셋 스토어 (세대 단위 버전 관리)
+- 라우터는 데이터셋 이름별 build 함수를 등록 (테이블/인덱스/캐시를 만들어 반환)
+  depends_on 을 주면 같은 세대의 해당 데이터셋들을 인자로 받아 빌드 (예: 지역별 첫 페이지)
+- Generation: 한 시점의 전체 데이터셋 묶음. 데이터셋마다 once-only 로더 슬롯을 가짐
+    → 동시에 첫 요청이 와도 build는 1번, 실패하면 다음 요청에서 재시도
+- 요청은 시작할 때 current()로 세대를 잡고 끝날 때까지 그 세대만 읽음
+- reload(): 새 세대를 백그라운드에서 전부 빌드한 뒤 참조 하나만 교체 (무중단)
+- warm_up(): 앱 시작 시 스레드 풀에서 현재 세대를 병렬 로드
+- status(): /ready 에서 쓰는 데이터셋별 진행 상태
+- pre-fork 워커(app/prefork.py)는 마스터가 빌드한 세대를 fork 로 물려받아 공유 → delegate_reloads()로
+  워커의 reload 요청/파일 감시를 마스터에 넘김 (마스터가 reload 후 워커를 다시 fork)
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+APP_ROOT = Path(__file__).resolve().parent
+WATCH_DIRS = [APP_ROOT / "data", APP_ROOT.parent]
+WATCH_INTERVAL = float(os.getenv("DATASET_WATCH_INTERVAL", "0") or 0)  # 0이면 파일 감시 안 함
+
+
+class DatasetLoader:
+    """한 세대 안의 데이터셋 하나 (once-only 초기화)"""
+
+    def __init__(self, name: str, build_fn: Callable[[], Any]):
+        self.name = name
+        self._build_fn = build_fn
+        self._lock = threading.Lock()
+        self.value: Any = None
+        self.state = PENDING
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.elapsed: Optional[float] = None
+
+    def ensure(self) -> Any:
+        if self.state == READY:
+            return self.value
+        with self._lock:
+            # 락을 기다리는 동안 다른 스레드가 끝냈을 수 있음
+            if self.state == READY:
+                return self.value
+            self.state = LOADING
+            self.error = None
+            self.started_at = time.time()
+            t0 = time.perf_counter()
+            try:
+                value = self._build_fn()
+            except Exception as e:
+                # 실패하면 다음 ensure()에서 다시 시도
+                self.state = FAILED
+                self.error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                self.elapsed = round(time.perf_counter() - t0, 3)
+            self.value = value
+            self.state = READY
+            return value
+
+    def status(self) -> dict:
+        return {"state": self.state, "elapsed_sec": self.elapsed, "error": self.error}
+
+
+class Generation:
+    def __init__(
+        self,
+        version: int,
+        builders: Dict[str, Callable[..., Any]],
+        depends: Optional[Dict[str, Tuple[str, ...]]] = None,
+    ):
+        self.version = version
+        self.created_at = time.time()
+        depends = depends or {}
+        self._loaders = {
+            name: DatasetLoader(name, self._bind(fn, depends.get(name, ()))) for name, fn in builders.items()
+        }
+
+    def _bind(self, fn: Callable[..., Any], deps: Tuple[str, ...]) -> Callable[[], Any]:
+        if not deps:
+            return fn
+        # 의존 데이터셋은 이 세대 것으로 (reload 중에도 새 세대끼리 묶임)
+        return lambda: fn(*(self.get(d) for d in deps))
+
+    def get(self, name: str) -> Any:
+        return self._loaders[name].ensure()
+
+    def load_all(self, names: Optional[Iterable[str]] = None, max_workers: Optional[int] = None) -> bool:
+        """데이터셋들을 병렬 로드. 전부 성공하면 True"""
+        targets = [self._loaders[n] for n in (names or self._loaders) if n in self._loaders]
+        if not targets:
+            return True
+
+        def _run(loader: DatasetLoader) -> bool:
+            try:
+                loader.ensure()
+                return True
+            except Exception as e:
+                print(f"[DATASETS] gen {self.version} {loader.name} failed:", e)
+                return False
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(targets), thread_name_prefix="dataset") as pool:
+            return all(list(pool.map(_run, targets)))
+
+    def status(self) -> dict:
+        return {
+            "version": self.version,
+            "ready": all(l.state == READY for l in self._loaders.values()),
+            "datasets": {n: l.status() for n, l in self._loaders.items()},
+        }
+
+
+_builders: Dict[str, Callable[..., Any]] = {}
+_depends: Dict[str, Tuple[str, ...]] = {}
+_current: Optional[Generation] = None
+_current_lock = threading.Lock()
+_reload_lock = threading.Lock()
+_reloading: Optional[Generation] = None
+# pre-fork 워커면 reload 를 직접 하지 않고 이 함수로 마스터에 요청 (True = 요청 보냄)
+_delegate: Optional[Callable[[], bool]] = None
+# 세대 교체 후 호출 (pre-fork 마스터: 워커 재 fork 예약)
+_swap_listeners: List[Callable[["Generation"], None]] = []
+
+
+def register(name: str, build_fn: Callable[..., Any], depends_on: Iterable[str] = ()) -> None:
+    _builders[name] = build_fn
+    _depends[name] = tuple(depends_on)
+
+
+def current() -> Generation:
+    global _current
+    gen = _current
+    if gen is None:
+        with _current_lock:
+            if _current is None:
+                _current = Generation(1, dict(_builders), dict(_depends))
+            gen = _current
+    return gen
+
+
+def get(name: str) -> Any:
+    """현재 세대의 데이터셋 (요청 하나 안에서 여러 번 쓸 거면 current()를 잡아두고 쓸 것)"""
+    return current().get(name)
+
+
+def warm_up(names: Optional[Iterable[str]] = None, max_workers: Optional[int] = None) -> bool:
+    gen = current()
+    t0 = time.perf_counter()
+    ok = gen.load_all(names, max_workers)
+    print(f"[WARMUP] gen {gen.version} done in {time.perf_counter() - t0:.2f}s (ok={ok})")
+    return ok
+
+
+def delegate_reloads(request: Optional[Callable[[], bool]]) -> None:
+    """이 프로세스의 reload_in_background/파일 감시를 request 로 대신함 (pre-fork 워커용, None 이면 해제)"""
+    global _delegate
+    _delegate = request
+
+
+def on_swap(listener: Callable[["Generation"], None]) -> None:
+    _swap_listeners.append(listener)
+
+
+def reload() -> Optional[Generation]:
+    """
+    새 세대를 전부 빌드한 뒤 원자적으로 교체. 하나라도 실패하면 기존 세대 유지.
+    이미 reload 중이면 None.
+    """
+    global _current, _reloading
+    if not _reload_lock.acquire(blocking=False):
+        return None
+    try:
+        new_gen = Generation(current().version + 1, dict(_builders), dict(_depends))
+        _reloading = new_gen
+        t0 = time.perf_counter()
+        if not new_gen.load_all():
+            print(f"[DATASETS] gen {new_gen.version} build failed, keeping gen {current().version}")
+            return None
+        # 참조 교체 한 번 → 진행 중인 요청은 이전 세대를 끝까지 사용
+        with _current_lock:
+            _current = new_gen
+        print(f"[DATASETS] swapped to gen {new_gen.version} in {time.perf_counter() - t0:.2f}s")
+        for listener in _swap_listeners:
+            listener(new_gen)
+        return new_gen
+    finally:
+        _reloading = None
+        _reload_lock.release()
+
+
+def reload_in_background() -> bool:
+    """reload를 백그라운드 스레드로 시작. 이미 진행 중이면 False (pre-fork 워커면 마스터에 요청)"""
+    if _delegate is not None:
+        return _delegate()
+    if _reload_lock.locked():
+        return False
+    threading.Thread(target=reload, name="dataset-reload", daemon=True).start()
+    return True
+
+
+def status(names: Optional[Iterable[str]] = None) -> dict:
+    out = current().status()
+    if names:
+        out["datasets"] = {n: s for n, s in out["datasets"].items() if n in names}
+        out["ready"] = all(s["state"] == READY for s in out["datasets"].values())
+    reloading = _reloading
+    if reloading is not None:
+        out["reloading"] = reloading.status()
+    return out
+
+
+# -------------------------
+# 파일 감시 (DATASET_WATCH_INTERVAL > 0)
+# -------------------------
+def _fingerprint() -> List[Tuple[str, int, int]]:
+    from app import snapshot
+
+    paths = [p for d in WATCH_DIRS if d.exists() for p in d.glob("*.csv")]
+    paths.append(snapshot.SNAPSHOT_DIR / snapshot.MANIFEST_NAME)
+    out = []
+    for p in sorted(paths):
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        out.append((str(p), st.st_mtime_ns, st.st_size))
+    return out
+
+
+def start_watcher(interval: float = WATCH_INTERVAL) -> Optional[threading.Thread]:
+    """CSV/스냅샷 manifest가 바뀌면 reload. interval<=0 이거나 pre-fork 워커(마스터가 감시)면 시작 안 함"""
+    if interval <= 0 or _delegate is not None:
+        return None
+
+    def _watch():
+        last = _fingerprint()
+        while True:
+            time.sleep(interval)
+            now = _fingerprint()
+            if now != last:
+                print("[DATASETS] source files changed, reloading")
+                reload()
+                last = now
+
+    t = threading.Thread(target=_watch, name="dataset-watcher", daemon=True)
+    t.start()
+    return t
@@ -0,0 +1,166 @@
+# app/downloads.py
+"""
+데이터셋 다운로드 매니저
+- 영구 캐시 디렉터리(DATASET_CACHE_DIR, 기본 ~/.cache/budgetpilot)에 저장 → 재부팅해도 다시 안 받음
+- <파일>.part 에 이어받기 (HTTP Range), 서버가 Range를 무시하면 처음부터
+- sha256 이 주어지면 완료 후 검증, 틀리면 .part 삭제 후 실패 처리
+- 백그라운드 스레드에서 받고, 끝나면 on_ready 콜백 호출 (예: 데이터셋 reload)
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from app.lazy import lazy_import
+
+requests = lazy_import("requests")
+
+CACHE_DIR = Path(os.getenv("DATASET_CACHE_DIR", "") or Path.home() / ".cache" / "budgetpilot")
+CHUNK_SIZE = 1024 * 1024
+TIMEOUT = 30
+MAX_ATTEMPTS = 5
+
+PENDING = "pending"
+DOWNLOADING = "downloading"
+DONE = "done"
+FAILED = "failed"
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class Download:
+    def __init__(self, url: str, dest: Path, sha256: Optional[str] = None):
+        self.url = url
+        self.dest = dest
+        self.part = dest.with_name(dest.name + ".part")
+        self.sha256 = (sha256 or "").lower() or None
+        self.state = PENDING
+        self.error: Optional[str] = None
+        self.received = 0
+        self.total: Optional[int] = None
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._callbacks: list[Callable[[Path], None]] = []
+
+    @property
+    def ready(self) -> bool:
+        return self.state == DONE
+
+    def _verified(self, path: Path) -> bool:
+        return self.sha256 is None or _sha256(path) == self.sha256
+
+    def _fetch_once(self) -> None:
+        offset = self.part.stat().st_size if self.part.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        with requests.get(self.url, stream=True, timeout=TIMEOUT, headers=headers) as r:
+            if r.status_code == 416:
+                # 이미 끝까지 받은 .part
+                return
+            r.raise_for_status()
+            if offset and r.status_code != 206:
+                # Range 미지원 서버 → 처음부터
+                offset = 0
+            length = r.headers.get("Content-Length")
+            self.total = offset + int(length) if length and length.isdigit() else None
+            self.received = offset
+            with open(self.part, "ab" if offset else "wb") as f:
+                for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        self.received += len(chunk)
+        if self.total is not None and self.received < self.total:
+            # 연결이 조용히 끊긴 경우 → 다음 시도에서 이어받기
+            raise IOError(f"incomplete: {self.received}/{self.total} bytes")
+
+    def cached(self) -> bool:
+        """캐시에 검증된 파일이 이미 있으면 True (네트워크/스레드 없이)"""
+        if self.state == DONE:
+            return True
+        if self.dest.exists() and self._verified(self.dest):
+            self.received = self.total = self.dest.stat().st_size
+            self.state = DONE
+            self._done.set()
+            return True
+        return False
+
+    def run(self) -> bool:
+        """동기 실행 (백그라운드는 start())"""
+        self.dest.parent.mkdir(parents=True, exist_ok=True)
+        if self.cached():
+            return True
+
+        self.state = DOWNLOADING
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            if attempt > 1:
+                time.sleep(min(2 ** attempt, 30))
+            try:
+                self._fetch_once()
+                if not self._verified(self.part):
+                    self.part.unlink(missing_ok=True)
+                    self.error = "sha256 mismatch"
+                    return self._finish(FAILED)
+                self.part.replace(self.dest)
+                return self._finish(DONE)
+            except Exception as e:
+                self.error = f"{type(e).__name__}: {e}"
+                print(f"[DOWNLOAD] {self.dest.name} attempt {attempt} failed: {self.error}")
+        return self._finish(FAILED)
+
+    def _finish(self, state: str) -> bool:
+        self.state = state
+        print(f"[DOWNLOAD] {self.dest.name}: {state}" + (f" ({self.error})" if state == FAILED else ""))
+        if state == DONE:
+            for cb in self._callbacks:
+                try:
+                    cb(self.dest)
+                except Exception as e:
+                    print(f"[DOWNLOAD] {self.dest.name} callback failed:", e)
+        # wait() 는 콜백(예: reload)까지 끝난 뒤 반환
+        self._done.set()
+        return state == DONE
+
+    def start(self, on_ready: Optional[Callable[[Path], None]] = None) -> "Download":
+        if on_ready is not None and on_ready not in self._callbacks:
+            self._callbacks.append(on_ready)
+        if self._thread is None or (self.state == FAILED and not self._thread.is_alive()):
+            # 실패했던 다운로드는 다음 start()에서 .part 부터 다시 이어받기
+            self.state = PENDING
+            self._done.clear()
+            self._thread = threading.Thread(target=self.run, name=f"download-{self.dest.name}", daemon=True)
+            self._thread.start()
+        return self
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        self._done.wait(timeout)
+        return self.ready
+
+    def status(self) -> dict:
+        return {"state": self.state, "received": self.received, "total": self.total, "error": self.error}
+
+
+_downloads: Dict[str, Download] = {}
+_lock = threading.Lock()
+
+
+def get(url: str, filename: str, sha256: Optional[str] = None) -> Download:
+    """URL별로 하나의 Download (이미 캐시에 있으면 start() 즉시 DONE)"""
+    with _lock:
+        dl = _downloads.get(url)
+        if dl is None:
+            dl = Download(url, CACHE_DIR / filename, sha256)
+            _downloads[url] = dl
+        return dl
+
+
+def status() -> dict:
+    return {dl.dest.name: dl.status() for dl in _downloads.values()}
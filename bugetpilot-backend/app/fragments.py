@@ -0,0 +1,68 @@
+# app/fragments.py
+"""
+미리 직렬화한 JSON 조각으로 목록 응답 만들기
+
+    frag = fragments.encode({"name": ...})            # 로드 시 항목마다 1번
+    return fragments.response([frag1, frag2, ...])    # 요청 때는 이어 붙이기만
+
+- encode(): FastAPI 기본 JSONResponse 와 같은 설정(ensure_ascii=False, 공백 없음, NaN 금지)
+  → 조각을 이어 붙인 결과가 기존 응답(response_model 검증 → jsonable_encoder → json.dumps)과 바이트 단위로 같음
+- RawJSONResponse: 바이트를 그대로 보냄 (라우트에 response_model 이 있어도 Response 는 검증/재직렬화 안 함)
+- 식당 id(rest-N)처럼 응답 안 순번으로 정해지는 값은 with_id() 로 요청 때 앞에 붙임
+- format=ndjson: 같은 조각을 한 줄에 하나씩 스트리밍 (respond())
+  - 조각 generator 를 그대로 흘려보냄 → 서버 메모리는 버퍼 1개, 첫 행은 바로 나감 (time-to-first-byte)
+  - 줄 내용은 JSON 배열 응답의 원소와 같은 바이트
+"""
+import json
+import os
+from typing import Dict, Iterable, Iterator, Optional
+
+from fastapi.responses import Response, StreamingResponse
+
+FORMATS = ("json", "ndjson")
+FORMAT_PATTERN = "^(" + "|".join(FORMATS) + ")$"  # Query(pattern=...) 용
+# 스트리밍 때 이만큼 모아서 보냄 (첫 행은 바로)
+STREAM_CHUNK_BYTES = int(os.getenv("STREAM_CHUNK_BYTES", str(64 * 1024)))
+
+
+def encode(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def with_id(fragment: bytes, id_value: str) -> bytes:
+    """객체 조각 맨 앞에 "id" 키 추가 ({"id": id_value, **obj} 와 같은 바이트, obj 는 비어 있지 않아야 함)"""
+    return b'{"id":' + encode(id_value) + b"," + fragment[1:]
+
+
+def array(fragments: Iterable[bytes]) -> bytes:
+    return b"[" + b",".join(fragments) + b"]"
+
+
+class RawJSONResponse(Response):
+    media_type = "application/json"
+
+
+def response(fragments: Iterable[bytes], headers: Optional[Dict[str, str]] = None) -> RawJSONResponse:
+    return RawJSONResponse(array(fragments), headers=headers)
+
+
+def ndjson_lines(fragments: Iterable[bytes], chunk_bytes: int = STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+    """조각마다 한 줄(조각 + 줄바꿈), chunk_bytes 정도씩 묶어서 보냄 (첫 행은 혼자)"""
+    buf = bytearray()
+    first = True
+    for frag in fragments:
+        buf += frag
+        buf += b"\n"
+        if first or len(buf) >= chunk_bytes:
+            yield bytes(buf)
+            buf.clear()
+            first = False
+    if buf:
+        yield bytes(buf)
+
+
+def respond(fragments: Iterable[bytes], format: str = "json", headers: Optional[Dict[str, str]] = None) -> Response:
+    """format=json → 배열 한 번에 (기존과 같은 바이트), ndjson → 스트리밍 (fragments 는 generator 그대로 넘기기)"""
+    if format == "ndjson":
+        return StreamingResponse(ndjson_lines(fragments), media_type="application/x-ndjson", headers=headers)
+    return response(fragments, headers)
@@ -0,0 +1,224 @@
+# app/fuzzy.py
+"""
+오타에 강한 이름 검색: 자모 분해 + 자모 trigram 역색인 (로드 시 1번 빌드)
+
+    index = FuzzyIndex(names)
+    positions, distances = index.search("스타벅수", limit=20)   # 가까운 순 → "스타벅스 강남점" …
+
+- 정규화: 소문자, 공백/기호 제거, 한글 음절 → 초성/중성/종성 호환 자모 ("벅" → "ㅂㅓㄱ")
+  → "카페"/"카패", "스타벅스"/"스타벅수" 처럼 음절 하나가 틀려도 자모 1~2개 차이
+- 색인: 이름마다 자모 trigram 집합 → trigram 별 이름 위치 posting (전체를 numpy 로 한 번에)
+- 질의: 허용 편집 거리 d (질의 자모 길이에 따라 0~FUZZY_MAX_EDITS)
+  1) 후보: 질의 trigram 중 공유하는 개수 >= (질의 trigram 수 - 3d) 인 이름
+     (편집 1번은 trigram 을 최대 3개 깨뜨림 → 이보다 적게 공유하면 거리 d 안에 못 들어옴)
+  2) 검증: 공유 개수 많은 순으로 최대 FUZZY_VERIFY_MAX 개만, 이름 안 부분 문자열과의 최소 편집 거리
+     (Myers 비트 병렬 알고리즘을 후보 전체에 numpy uint64 로 한 번에, 질의는 자모 64개까지)
+  3) 순위: 편집 거리 → trigram 유사도(공유 / 합집합) → 위치
+- 질의 자모가 3개 미만(받침 없는 한 글자 등)이면 trigram 이 없어서 부분 문자열 일치만 (전체 훑기)
+"""
+from __future__ import annotations
+
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+from app.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+MAX_EDITS = int(os.getenv("FUZZY_MAX_EDITS", "2"))
+VERIFY_MAX = int(os.getenv("FUZZY_VERIFY_MAX", "1000"))
+MAX_PATTERN = 64  # uint64 비트 병렬 한계
+
+_CHO = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONG = ["", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"]
+_SKIP = re.compile(r"[\W_]+")
+
+
+@lru_cache(maxsize=1)
+def _table() -> Dict[int, str]:
+    """한글 음절 11,172자 → 호환 자모 문자열 (str.translate 용, 처음 쓸 때 1번)"""
+    return {
+        0xAC00 + i: _CHO[i // 588] + _JUNG[(i % 588) // 28] + _JONG[i % 28]
+        for i in range(11172)
+    }
+
+
+def jamo(text) -> str:
+    """정규화 + 자모 분해 (결측은 빈 문자열)"""
+    if not isinstance(text, str):
+        return ""
+    return _SKIP.sub("", text.lower()).translate(_table())
+
+
+def _trigram_keys(codes: np.ndarray) -> np.ndarray:
+    # 코드 포인트(21비트) 3개 → int64 키 하나
+    return (codes[:-2].astype(np.int64) << 42) | (codes[1:-1].astype(np.int64) << 21) | codes[2:].astype(np.int64)
+
+
+def _codes(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+
+def max_edits(length: int) -> int:
+    """질의 자모 길이 → 허용 편집 거리 (자모 4개 미만 0, 10개 미만 1, 그 이상 2 — 대략 음절 1개 / 2~3개 / 4개 이상)"""
+    if length < 4:
+        return 0
+    return min(MAX_EDITS, 1 if length < 10 else 2)
+
+
+class FuzzyIndex:
+    def __init__(self, names: Sequence[str]):
+        texts = [jamo(n) for n in names]
+        self.size = len(texts)
+        self.texts = texts
+        lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=self.size)
+        self.offsets = np.zeros(self.size + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.offsets[1:])
+        self.chars = _codes("".join(texts))
+
+        # 모든 이름의 모든 trigram (이름 경계를 넘는 것은 뺌) → (trigram, 이름) 쌍 중복 제거
+        if len(self.chars) >= 3:
+            keys = _trigram_keys(self.chars)
+            doc = np.repeat(np.arange(self.size, dtype=np.int64), lengths)[:-2]
+            keep = np.arange(len(keys)) + 3 <= self.offsets[doc + 1]
+            keys, doc = keys[keep], doc[keep]
+        else:
+            keys, doc = np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        # trigram → 정렬된 용어 번호 (해시로 묶은 뒤 키 순서로 번호를 다시 매김), (용어, 이름) 쌍은 정렬 후 이웃 비교로 중복 제거
+        codes, uniques = pd.factorize(keys)
+        order = np.argsort(uniques)
+        self.terms = np.asarray(uniques)[order]
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        pairs = rank[codes] * max(self.size, 1) + doc
+        pairs.sort()
+        pairs = pairs[np.concatenate(([True], pairs[1:] != pairs[:-1]))] if len(pairs) else pairs
+        self.docs = (pairs % max(self.size, 1)).astype(np.int32)
+        self.term_offsets = np.searchsorted(pairs // max(self.size, 1), np.arange(len(self.terms) + 1))
+        self.gram_counts = np.bincount(self.docs, minlength=self.size).astype(np.int32)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def nbytes(self) -> int:
+        return (self.chars.nbytes + self.offsets.nbytes + self.terms.nbytes + self.docs.nbytes
+                + self.term_offsets.nbytes + self.gram_counts.nbytes)
+
+    def _candidates(self, pattern: str, edits: int, allowed: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """trigram 을 (질의 trigram 수 - 3d)개 이상 공유하는 이름 (위치, 공유 개수)"""
+        if len(self.terms) == 0:
+            # 빈 카탈로그 / 모든 이름이 자모 3개 미만 → 색인에 trigram 이 없음
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        grams = np.unique(_trigram_keys(_codes(pattern)))
+        need = max(1, len(grams) - 3 * edits)
+        idx = np.searchsorted(self.terms, grams)
+        idx = idx[(idx < len(self.terms)) & (self.terms[np.minimum(idx, len(self.terms) - 1)] == grams)]
+        if len(idx) < need:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        lists = sorted((self.docs[self.term_offsets[i]:self.term_offsets[i + 1]] for i in idx.tolist()), key=len)
+        # need 개 이상 공유하려면 가장 짧은 (len - need + 1)개 posting 중 하나에는 반드시 있음 → 거기서만 후보를 뽑고
+        # 나머지(긴 posting)는 후보마다 이분 탐색으로 공유 여부만 셈
+        k = len(lists) - need + 1
+        head = np.concatenate(lists[:k])
+        if len(head) * 8 >= self.size:
+            # 후보가 이름 수에 비해 많으면 정렬보다 이름 수 길이 배열에 바로 세는 게 빠름
+            counts = np.bincount(head, minlength=self.size)
+            docs = np.flatnonzero(counts)
+            counts = counts[docs]
+        else:
+            docs, counts = np.unique(head, return_counts=True)
+        if allowed is not None:
+            keep = allowed[docs]
+            docs, counts = docs[keep], counts[keep]
+        for n, p in enumerate(lists[k:]):
+            # 남은 posting 을 다 공유해도 need 에 못 미치는 후보는 버림
+            alive = counts + (len(lists) - k - n) >= need
+            docs, counts = docs[alive], counts[alive]
+            if len(docs) == 0:
+                break
+            if len(docs) * 16 >= len(p):
+                # 후보가 많으면 posting 을 bool 배열에 찍고 바로 조회 (이분 탐색보다 빠름)
+                mark = np.zeros(self.size, dtype=bool)
+                mark[p] = True
+                counts = counts + mark[docs]
+            else:
+                at = np.minimum(np.searchsorted(p, docs), len(p) - 1)
+                counts = counts + (p[at] == docs)
+        keep = counts >= need
+        return docs[keep].astype(np.int64), counts[keep]
+
+    def _scan(self, pattern: str, allowed: Optional[np.ndarray]) -> np.ndarray:
+        hits = [i for i, t in enumerate(self.texts) if pattern in t]
+        docs = np.asarray(hits, dtype=np.int64)
+        return docs[allowed[docs]] if allowed is not None else docs
+
+    def distances(self, pattern: str, docs: np.ndarray) -> np.ndarray:
+        """pattern 과 각 이름 안 부분 문자열 사이 최소 편집 거리 (Myers 비트 병렬, 후보 전체 한 번에)"""
+        m = len(pattern)
+        if m == 0 or len(docs) == 0:
+            return np.zeros(len(docs), dtype=np.int64)
+        # 질의 글자별 위치 비트마스크 (Peq)
+        peq: Dict[int, int] = {}
+        for i, c in enumerate(pattern):
+            peq[ord(c)] = peq.get(ord(c), 0) | (1 << i)
+        keys = np.array(sorted(peq), dtype=np.uint32)
+        masks = np.array([peq[k] for k in sorted(peq)], dtype=np.uint64)
+
+        starts, ends = self.offsets[docs], self.offsets[docs + 1]
+        width = int((ends - starts).max())
+        col = np.arange(width)
+        pos = starts[:, None] + col[None, :]
+        text = np.where(pos < ends[:, None], self.chars[np.minimum(pos, len(self.chars) - 1)], 0)
+        slot = np.minimum(np.searchsorted(keys, text), len(keys) - 1)
+        eq_all = np.where(keys[slot] == text, masks[slot], np.uint64(0))
+
+        full = np.uint64((1 << m) - 1)
+        high = np.uint64(1 << (m - 1))
+        one = np.uint64(1)
+        pv = np.full(len(docs), full, dtype=np.uint64)
+        mv = np.zeros(len(docs), dtype=np.uint64)
+        score = np.full(len(docs), m, dtype=np.int64)
+        best = score.copy()
+        for j in range(width):
+            eq = eq_all[:, j]
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (~(xh | pv) & full)
+            mh = pv & xh
+            score += (ph & high) != 0
+            score -= (mh & high) != 0
+            # 부분 문자열 검색: 이름 안 어디서 시작해도 비용 0 → 첫 행에 1을 넣지 않음
+            ph = (ph << one) & full
+            mh = (mh << one) & full
+            pv = mh | (~(xv | ph) & full)
+            mv = ph & xv
+            np.minimum(best, score, out=best)
+        return best
+
+    def search(self, query: str, limit: int, allowed: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """가까운 이름 상위 limit개 (위치, 편집 거리) — allowed(위치별 bool)가 있으면 그 이름만"""
+        pattern = jamo(query)[:MAX_PATTERN]
+        if not pattern:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        edits = max_edits(len(pattern))
+        if len(pattern) < 3:
+            docs = self._scan(pattern, allowed)
+            order = np.lexsort((docs, self.offsets[docs + 1] - self.offsets[docs]))[:limit]
+            return docs[order], np.zeros(len(order), dtype=np.int64)
+
+        docs, shared = self._candidates(pattern, edits, allowed)
+        if len(docs) > VERIFY_MAX:
+            # 검증은 공유 trigram 많은 순으로 상한까지만
+            top = np.lexsort((docs, -shared))[:VERIFY_MAX]
+            docs, shared = docs[top], shared[top]
+        dist = self.distances(pattern, docs)
+        keep = dist <= edits
+        docs, shared, dist = docs[keep], shared[keep], dist[keep]
+        n_grams = len(np.unique(_trigram_keys(_codes(pattern))))
+        similarity = shared / (n_grams + self.gram_counts[docs] - shared)
+        order = np.lexsort((docs, -similarity, dist))[:limit]
+        return docs[order], dist[order]
@@ -0,0 +1,41 @@
+# app/geo.py
+"""
+좌표 계산 (NumPy 벡터화)
+- haversine_km: 기준점 1개 ↔ 좌표 배열 거리(km), 좌표가 없으면(NaN) NaN
+- clean: 좌표 없음 표시((0, 0), 범위 밖, 빈 값) → NaN
+- frame_coordinates: DataFrame 위도/경도 컬럼 → float 배열 (컬럼 없으면 None)
+"""
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+from app.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEG = 111.19508  # 위도 1도 (2π·R / 360)
+
+
+def haversine_km(lat: np.ndarray, lng: np.ndarray, lat0: float, lng0: float) -> np.ndarray:
+    lat1 = np.radians(np.asarray(lat, dtype=np.float64))
+    lng1 = np.radians(np.asarray(lng, dtype=np.float64))
+    lat0, lng0 = np.radians(lat0), np.radians(lng0)
+    a = np.sin((lat1 - lat0) / 2) ** 2 + np.cos(lat0) * np.cos(lat1) * np.sin((lng1 - lng0) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def clean(lat, lng) -> Tuple[np.ndarray, np.ndarray]:
+    lat = np.asarray(lat, dtype=np.float64)
+    lng = np.asarray(lng, dtype=np.float64)
+    bad = ~(np.abs(lat) <= 90) | ~(np.abs(lng) <= 180) | ((lat == 0) & (lng == 0))
+    return np.where(bad, np.nan, lat), np.where(bad, np.nan, lng)
+
+
+def frame_coordinates(df: pd.DataFrame, lat_col: str = "위도",
+                      lng_col: str = "경도") -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    # 좌표 컬럼 없는 예전 스냅샷이면 None (distance 정렬/주변 검색 불가)
+    if lat_col not in df.columns or lng_col not in df.columns:
+        return None, None
+    return clean(pd.to_numeric(df[lat_col], errors="coerce"), pd.to_numeric(df[lng_col], errors="coerce"))
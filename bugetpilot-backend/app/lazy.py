@@ -0,0 +1,47 @@
+# app/lazy.py
+"""
+무거운 의존성(pandas/numpy/requests 등)을 처음 속성에 접근할 때 import
+- `pd = lazy_import("pandas")` 로 쓰면 모듈 import 시점에는 비용 0
+- 실제 로드는 데이터셋 빌드/요청 처리에서 pd.xxx 를 처음 쓸 때 1번
+- 어노테이션에 pd.DataFrame 을 쓰는 모듈은 `from __future__ import annotations` 필요
+
+importlib.util.LazyLoader는 3.11에서 스레드 안전하지 않아(warm-up 스레드들이 동시에 첫 접근하면
+반쯤 초기화된 모듈을 봄) 프록시 + 락으로 구현. 실제 import는 importlib.import_module.
+"""
+import importlib
+import importlib.util
+import threading
+from types import ModuleType
+from typing import Any
+
+
+class _LazyModule(ModuleType):
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_lock"] = threading.Lock()
+        self.__dict__["_lazy_module"] = None
+
+    def _lazy_load(self) -> ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with self.__dict__["_lazy_lock"]:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    # 이후 접근은 프록시 dict에서 바로 찾도록 복사 (없는 건 __getattr__로 위임)
+                    for key, value in module.__dict__.items():
+                        self.__dict__.setdefault(key, value)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._lazy_load(), attr)
+
+    def __dir__(self):
+        return dir(self._lazy_load())
+
+
+def lazy_import(name: str) -> ModuleType:
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    return _LazyModule(name)
@@ -1,10 +1,48 @@
 # backend/app/main.py
-from fastapi import FastAPI, Query
+import asyncio
+import hmac
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from typing import Optional
 
+from app import datasets, downloads, fragments, regions
+
+
+# warm-up/readiness 대상 데이터셋 (예: /rooms 만 서빙하는 파드는 WARMUP_DATASETS=rooms). 비우면 전체
+WARMUP_DATASETS = [n.strip() for n in os.getenv("WARMUP_DATASETS", "").split(",") if n.strip()] or None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 데이터셋 병렬 warm-up은 백그라운드로 → 서버는 바로 뜨고 /ready 가 503 → 200 으로 바뀜
+    warmup = asyncio.create_task(asyncio.to_thread(datasets.warm_up, WARMUP_DATASETS))
+    # DATASET_WATCH_INTERVAL 설정 시 CSV/스냅샷 변경 감지 → 새 세대로 교체
+    datasets.start_watcher()
+    yield
+    if not warmup.done():
+        warmup.cancel()
+
+
 # 1) 앱 생성
-app = FastAPI(title="Backend API")
+app = FastAPI(title="Backend API", lifespan=lifespan)
+
+# 지역 샤딩(SERVED_REGIONS): 다른 노드 담당 지역 키워드면 데이터 조회 전에 바로 421
+# (CORS보다 먼저 등록 → CORS 안쪽에서 실행되어 421 응답에도 CORS 헤더가 붙음)
+SHARDED_PATHS = ("/rooms", "/restaurants", "/attractions")
+
+
+@app.middleware("http")
+async def reject_unserved_regions(request: Request, call_next):
+    if request.url.path.rstrip("/") in SHARDED_PATHS:
+        keyword = request.query_params.get("city_keyword")
+        if not regions.is_served(keyword):
+            return JSONResponse(regions.unserved_body(keyword.strip()), status_code=421)
+    return await call_next(request)
+
 
 # 2) CORS 미들웨어 추가 (app 생성 이후)
 app.add_middleware(
@@ -13,9 +51,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # 커서 페이지네이션 (브라우저에서 읽을 수 있게)
 )
 
-from app.routers import rooms, schedule, restaurants, attractions
+from app.routers import rooms, schedule, restaurants, attractions, nearby
 
 # GET /rooms (끝에 슬래시 없음) 명시 등록
 @app.get("/rooms")
@@ -24,8 +63,15 @@ def get_rooms(
     max_price: Optional[int] = Query(None),
     min_rating: Optional[float] = Query(None),
     include_images: Optional[int] = Query(1, ge=0, le=10),
+    sort: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    lat: Optional[float] = Query(None),
+    lng: Optional[float] = Query(None),
+    format: str = Query("json", pattern=fragments.FORMAT_PATTERN),
+    name: Optional[str] = Query(None),
 ):
-    return rooms.list_rooms(city_keyword, max_price, min_rating, include_images)
+    return rooms.list_rooms(city_keyword, max_price, min_rating, include_images, sort, cursor, limit, lat, lng, format, name)
 
 # GET /restaurants 명시 등록
 @app.get("/restaurants")
@@ -33,8 +79,14 @@ def get_restaurants(
     city_keyword: Optional[str] = Query(None),
     max_price: Optional[int] = Query(None),
     limit: int = Query(50, ge=1, le=200),
+    sort: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    lat: Optional[float] = Query(None),
+    lng: Optional[float] = Query(None),
+    format: str = Query("json", pattern=fragments.FORMAT_PATTERN),
+    name: Optional[str] = Query(None),
 ):
-    return restaurants.list_restaurants(city_keyword, max_price, limit)
+    return restaurants.list_restaurants(city_keyword, max_price, limit, sort, cursor, lat, lng, format, name)
 
 # GET /attractions 관광지 데이터
 @app.get("/attractions")
@@ -42,13 +94,20 @@ def get_attractions(
     city_keyword: Optional[str] = Query(None),
     max_price: Optional[int] = Query(None),
     limit: int = Query(80, ge=1, le=200),
+    sort: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    lat: Optional[float] = Query(None),
+    lng: Optional[float] = Query(None),
+    format: str = Query("json", pattern=fragments.FORMAT_PATTERN),
+    q: Optional[str] = Query(None),
 ):
-    return attractions.list_attractions(city_keyword, max_price, limit)
+    return attractions.list_attractions(city_keyword, max_price, limit, sort, cursor, lat, lng, format, q)
 
 app.include_router(rooms.router)
 app.include_router(schedule.router)
 app.include_router(restaurants.router)
 app.include_router(attractions.router)
+app.include_router(nearby.router)
 
 # 3) 라우터 등록
 import hotels  # import는 app 생성 후에
@@ -58,3 +117,34 @@ app.include_router(hotels.router)
 @app.get("/")
 def root():
     return {"ok": True}
+
+
+# 이 노드가 담당하는 지역 (라우팅 계층/프론트에서 샤드 선택용)
+@app.get("/regions")
+def served_regions():
+    served = regions.served_regions()
+    return {"all": served is None, "served": served or regions.configured_regions()}
+
+
+# 로드밸런서 readiness: 모든 데이터셋 warm-up 끝나야 200
+@app.get("/ready")
+def ready():
+    status = datasets.status(WARMUP_DATASETS)
+    if downloads.status():
+        # 백그라운드 다운로드는 readiness에 영향 없음 (그동안 fallback 데이터로 서빙)
+        status["downloads"] = downloads.status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
+
+
+# 데이터셋 무중단 교체: 새 세대를 백그라운드에서 빌드 후 swap (ADMIN_TOKEN 없으면 비활성)
+@app.post("/admin/reload", status_code=202)
+def admin_reload(x_admin_token: Optional[str] = Header(None)):
+    token = os.getenv("ADMIN_TOKEN", "")
+    # 상수 시간 비교 (토큰 앞부분 일치 길이가 응답 시간으로 새지 않게), str 은 ASCII 만 받으므로 bytes 로
+    if not token or not hmac.compare_digest((x_admin_token or "").encode(), token.encode()):
+        raise HTTPException(status_code=403, detail="forbidden")
+    started = datasets.reload_in_background()
+    if not started:
+        raise HTTPException(status_code=409, detail="reload already in progress")
+    return {"started": True, "current_version": datasets.current().version}
+
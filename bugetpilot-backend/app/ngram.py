@@ -0,0 +1,88 @@
+# app/ngram.py
+"""
+주소/이름 부분 문자열 검색용 bigram/trigram 역색인 (로드 시 1번 빌드)
+
+    index = NgramIndex(addresses, titles)   # 필드 여러 개 = 그중 하나라도 포함하면 매치
+    index.search("강릉", limit=80)           # → 매치된 행 위치(파일 순서) 리스트
+
+- 정규화: str.lower() (기존 str.contains(case=False) / key in addr.lower() 와 같은 기준)
+- 키워드 2글자 → bigram posting, 3글자 이상 → 키워드의 모든 trigram posting 교집합
+- 교집합은 후보일 뿐이라 정규화된 원문에 `key in text` 로 확인 → 기존 부분 문자열 결과와 동일
+- posting은 행 위치 오름차순 int32 배열이라 후보도 파일 순서, limit 개 찾으면 바로 멈춤
+- 1글자 키워드는 인덱스 없이 전체 스캔
+"""
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence
+
+from app.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# 정규식 메타문자가 없는 키워드만 인덱스로 처리 (str.contains는 기본 regex=True)
+_REGEX_META = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+def normalize(text) -> str:
+    # 결측(NaN/None)은 str.contains(na=False)처럼 어떤 키워드에도 안 걸리게 빈 문자열
+    return text.lower() if isinstance(text, str) else ""
+
+
+def is_literal(keyword: str) -> bool:
+    return not _REGEX_META.search(keyword)
+
+
+class NgramIndex:
+    def __init__(self, *fields: Sequence[str]):
+        self.fields: List[List[str]] = [[normalize(t) for t in f] for f in fields]
+        self.size = len(self.fields[0]) if self.fields else 0
+        self.postings: Dict[str, np.ndarray] = {}
+
+        grams = defaultdict(list)
+        for pos in range(self.size):
+            seen = set()
+            for field in self.fields:
+                text = field[pos]
+                for n in (2, 3):
+                    for j in range(len(text) - n + 1):
+                        seen.add(text[j:j + n])
+            for g in seen:
+                grams[g].append(pos)
+        self.postings = {g: np.asarray(p, dtype=np.int32) for g, p in grams.items()}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _candidates(self, key: str) -> Optional[np.ndarray]:
+        """키워드의 n-gram posting 교집합 (None = 인덱스로 못 좁힘 → 전체 스캔)"""
+        if len(key) < 2:
+            return None
+        n = 2 if len(key) == 2 else 3
+        lists = []
+        for j in range(len(key) - n + 1):
+            p = self.postings.get(key[j:j + n])
+            if p is None:
+                return np.empty(0, dtype=np.int32)
+            lists.append(p)
+        lists.sort(key=len)
+        out = lists[0]
+        for p in lists[1:]:
+            if len(out) == 0:
+                break
+            out = np.intersect1d(out, p, assume_unique=True)
+        return out
+
+    def search(self, keyword: str, limit: Optional[int] = None) -> List[int]:
+        """keyword 를 (대소문자 무시) 부분 문자열로 포함하는 행 위치, 파일 순서"""
+        key = normalize(keyword)
+        candidates = self._candidates(key)
+        positions = range(self.size) if candidates is None else candidates.tolist()
+        out: List[int] = []
+        for pos in positions:
+            if any(key in field[pos] for field in self.fields):
+                out.append(pos)
+                if limit is not None and len(out) >= limit:
+                    break
+        return out
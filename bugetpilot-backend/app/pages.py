@@ -0,0 +1,113 @@
+# app/pages.py
+"""
+카탈로그 지역별 파티션 + 첫 페이지 미리 만들기 (로드 시 1번)
+
+- 프론트 요청은 거의 다 city_keyword=카탈로그 지역(강릉, 부산 …), limit=80, max_price=예산
+- 지역 파티션: 키워드 검색 결과 앞 PAGE_ROWS(= limit 최대값)행만 가공해 둔 항목 리스트
+- 응답이 max_price 에 따라 달라지는 건 파티션 항목들의 가격과 비교한 결과뿐
+  → 가격 값들을 정렬해 두고 max_price 를 '몇 개 가격 이하인지'(구간)로 바꾸면 구간이 같으면 응답도 같음
+- (variant, 구간) 별 응답 항목 리스트를 미리 만들어 둠 → dict 조회 1번
+  variant: 식당/관광지는 limit (PAGE_LIMITS), 숙소는 include_images (PAGE_IMAGE_COUNTS)
+- 그 외 variant 는 파티션 항목으로 바로 계산 (DataFrame 검색 없음)
+- 페이지는 키워드가 해석된 행정구역(app/address.py)으로 찾음 → 강남/강남구, 제주/제주도 는 같은 페이지
+- 카탈로그 지역이 아닌 키워드는 라우터의 일반 검색 경로
+"""
+import os
+from bisect import bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app import address, regions
+
+PAGE_ROWS = 200  # 목록 API limit 최대값
+PAGE_LIMITS = [int(x) for x in os.getenv("PAGE_LIMITS", "50,80").split(",") if x.strip()]
+PAGE_IMAGE_COUNTS = [1, 3]  # /rooms include_images 기본값, 프론트 값
+# 지역 하나가 미리 만들어 둘 항목 참조 수 상한 (가격 종류 × 항목 수가 큰 지역은 나머지를 요청 때 계산)
+PAGE_MAX_REFS = int(os.getenv("PAGE_MAX_REFS", "200000"))
+
+
+def region_keys() -> List[str]:
+    """미리 만들 지역 키워드 (프론트가 보내는 형태 = strip, 샤딩 중이면 담당 지역만)"""
+    out: List[str] = []
+    for r in regions.served_regions() or regions.configured_regions():
+        key = r.strip()
+        if key and key not in out:
+            out.append(key)
+    return out
+
+
+class RegionPage:
+    """
+    한 지역의 첫 페이지들
+    select(max_price, variant) → 응답 항목 리스트 (라우터의 기존 로직)
+    """
+
+    def __init__(self, prices: Iterable[int], select: Callable[[Optional[int], Any], List[Any]],
+                 variants: Iterable[Any] = ()):
+        self.levels = sorted(set(prices))
+        self._select = select
+        self._pages: Dict[Tuple[Any, int], List[Any]] = {}
+        refs = 0
+        for variant in variants:
+            for bucket in range(len(self.levels) + 1):
+                if refs >= PAGE_MAX_REFS:
+                    return
+                page = select(self._representative(bucket), variant)
+                self._pages[(variant, bucket)] = page
+                refs += len(page)
+
+    def _bucket(self, max_price: Optional[int]) -> int:
+        if max_price is None:
+            return len(self.levels)
+        return bisect_right(self.levels, max_price)
+
+    def _representative(self, bucket: int) -> Optional[int]:
+        # 구간 안의 아무 max_price 나 같은 응답 → 구간 대표값
+        if bucket == len(self.levels):
+            return None
+        if bucket == 0:
+            return self.levels[0] - 1
+        return self.levels[bucket - 1]
+
+    def get(self, max_price: Optional[int], variant: Any) -> List[Any]:
+        page = self._pages.get((variant, self._bucket(max_price)))
+        if page is None:
+            page = self._select(max_price, variant)
+        return page
+
+
+class RegionPages:
+    """키워드 → RegionPage (행정구역으로 해석되는 키워드는 지역 코드로, 아니면 키워드 문자열 그대로)"""
+
+    def __init__(self):
+        self._by_ref: Dict[address.RegionRef, RegionPage] = {}
+        self._by_key: Dict[str, RegionPage] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_ref) + len(self._by_key)
+
+    def add(self, key: str, page: RegionPage) -> None:
+        ref = address.resolve(key)
+        if ref is not None:
+            self._by_ref[ref] = page
+        else:
+            self._by_key[key] = page
+
+    def get(self, keyword: str) -> Optional[RegionPage]:
+        ref = address.resolve(keyword)
+        if ref is not None:
+            return self._by_ref.get(ref)
+        return self._by_key.get(keyword)
+
+    def clear(self) -> None:
+        self._by_ref.clear()
+        self._by_key.clear()
+
+
+def build_pages(make_page: Callable[[str], Optional[RegionPage]]) -> RegionPages:
+    """카탈로그 지역마다 RegionPage"""
+    region_pages = RegionPages()
+    for key in region_keys():
+        page = make_page(key)
+        if page is not None:
+            region_pages.add(key, page)
+    return region_pages
@@ -0,0 +1,186 @@
+# app/paging.py
+"""
+목록 API 서버 정렬 + 커서(keyset) 페이지네이션
+
+    sort_index = SortIndex({"price": prices, "rating": ratings, "reviewCount": reviews}, lat, lng)
+    positions, next_cursor = sort_index.page("price", members, cursor, limit)
+
+- 항목 위치(0..n-1, 파일 순서)마다 정렬 값 → 키별 전역 순서를 로드 시 1번 만들어 둠
+  (값이 같으면 파일 순서, rating/reviewCount 는 큰 값부터, price/distance 는 작은 값부터)
+- 커서 = 마지막으로 보낸 항목의 (정렬 값, 위치) → 다음 페이지는 그 뒤부터 (offset 아님)
+  - 필터 없음: 전역 순서에서 이분 탐색으로 시작점 → 페이지 크기만큼 자르기, O(log n + page)
+  - 키워드/가격 등으로 고른 members: 전역 순위(rank)로 커서 뒤 항목 중 작은 순위 page 개, O(members)
+    (페이지 깊이와 무관)
+- sort 없음 = 파일 순서 (커서 값 = 위치)
+- distance: 요청 좌표에 따라 달라서 미리 못 만듦 → 후보 좌표로 haversine 계산 후 정렬, 좌표 없는 항목은 맨 뒤
+- 커서는 불투명 문자열 (urlsafe base64), 응답 헤더 X-Next-Cursor 로 내려감 (마지막 페이지면 없음)
+"""
+from __future__ import annotations
+
+import base64
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+
+from app import geo
+from app.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+SORT_KEYS = ("price", "rating", "reviewCount", "distance")
+DESCENDING = {"rating", "reviewCount"}
+CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass(frozen=True)
+class Cursor:
+    sort: str          # "" = 파일 순서
+    value: float       # 마지막 항목의 정렬 값 (내부 값: 내림차순 키는 부호 반전)
+    pos: int           # 마지막 항목 위치
+    count: int         # 지금까지 보낸 항목 수 (식당 id 번호 이어 붙이기용)
+
+    def encode(self) -> str:
+        raw = f"{self.sort}|{self.value!r}|{self.pos}|{self.count}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, text: str) -> "Cursor":
+        """잘못된 커서면 ValueError"""
+        try:
+            raw = base64.urlsafe_b64decode(text + "=" * (-len(text) % 4)).decode("utf-8")
+            sort, value, pos, count = raw.split("|")
+            return cls(sort, float(value), int(pos), int(count))
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValueError("invalid cursor") from e
+
+
+def check_sort(sort: Optional[str], cursor: Optional[Cursor], origin: Optional[Tuple[float, float]]) -> str:
+    """요청 파라미터 검사 → 정렬 키 ("" = 파일 순서). 잘못되면 ValueError (라우터에서 400)"""
+    key = sort or ""
+    if key and key not in SORT_KEYS:
+        raise ValueError(f"sort must be one of {', '.join(SORT_KEYS)}")
+    if cursor is not None and cursor.sort != key:
+        raise ValueError("cursor was issued for a different sort")
+    if key == "distance" and origin is None:
+        raise ValueError("sort=distance needs lat and lng")
+    return key
+
+
+def origin_of(lat: Optional[float], lng: Optional[float]) -> Optional[Tuple[float, float]]:
+    return (lat, lng) if lat is not None and lng is not None else None
+
+
+def request_page(sort_index: "SortIndex", sort: Optional[str], cursor: Optional[str], members: Optional[np.ndarray],
+                 limit: int, origin: Optional[Tuple[float, float]] = None) -> Tuple[np.ndarray, Dict[str, str], int]:
+    """
+    라우터용: 파라미터 검사 + page()
+    → (위치들, 응답 헤더(다음 커서), 이 페이지 앞에 보낸 항목 수). 잘못된 요청은 400
+    """
+    try:
+        cur = Cursor.decode(cursor) if cursor else None
+        key = check_sort(sort, cur, origin)
+        positions, next_cursor = sort_index.page(key, members, cur, limit, origin)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    headers = {CURSOR_HEADER: next_cursor.encode()} if next_cursor is not None else {}
+    return positions, headers, (cur.count if cur is not None else 0)
+
+
+class _Order:
+    def __init__(self, keys: np.ndarray):
+        positions = np.arange(len(keys), dtype=np.int64)
+        self.keys = keys
+        self.order = np.lexsort((positions, keys))
+        self.sorted = keys[self.order]
+        self.rank = np.empty(len(keys), dtype=np.int64)
+        self.rank[self.order] = positions
+
+    def start(self, cursor: Optional[Cursor]) -> int:
+        """커서 다음 항목의 전역 순위"""
+        if cursor is None:
+            return 0
+        lo = int(np.searchsorted(self.sorted, cursor.value, side="left"))
+        hi = int(np.searchsorted(self.sorted, cursor.value, side="right"))
+        # 같은 값끼리는 위치 오름차순
+        return lo + int(np.searchsorted(self.order[lo:hi], cursor.pos, side="right"))
+
+
+class SortIndex:
+    def __init__(self, columns: Dict[str, Sequence[float]], lat: Optional[Sequence[float]] = None,
+                 lng: Optional[Sequence[float]] = None):
+        self.size = len(next(iter(columns.values()))) if columns else 0
+        self._orders: Dict[str, _Order] = {}
+        for key, values in columns.items():
+            keys = np.asarray(values, dtype=np.float64)
+            self._orders[key] = _Order(-keys if key in DESCENDING else keys)
+        self.lat = None if lat is None else np.asarray(lat, dtype=np.float64)
+        self.lng = None if lng is None else np.asarray(lng, dtype=np.float64)
+
+    @property
+    def has_coordinates(self) -> bool:
+        return self.lat is not None and bool(np.isfinite(self.lat).any())
+
+    def page(self, sort: str, members: Optional[np.ndarray], cursor: Optional[Cursor], limit: int,
+             origin: Optional[Tuple[float, float]] = None) -> Tuple[np.ndarray, Optional[Cursor]]:
+        """
+        members(조건에 맞는 위치, 오름차순 / None = 전체) 중 cursor 다음 limit 개 위치와 다음 커서
+        """
+        if sort == "distance":
+            if not self.has_coordinates:
+                raise ValueError("sort=distance is not available: no coordinates for this dataset")
+            positions, keys = self._distance_page(members, cursor, limit, origin)
+        elif sort:
+            positions, keys = self._ordered_page(self._orders[sort], members, cursor, limit)
+        else:
+            positions, keys = self._file_page(members, cursor, limit)
+
+        done = (0 if cursor is None else cursor.count) + len(positions)
+        if positions.more:
+            last = len(positions) - 1
+            return positions.values, Cursor(sort, float(keys[last]), int(positions.values[last]), done)
+        return positions.values, None
+
+    def _file_page(self, members, cursor, limit):
+        after = -1 if cursor is None else cursor.pos
+        if members is None:
+            start = after + 1
+            out = np.arange(start, min(start + limit, self.size), dtype=np.int64)
+            return _Page(out, start + limit < self.size), out.astype(np.float64)
+        rest = members[np.searchsorted(members, after, side="right"):]
+        out = rest[:limit]
+        return _Page(out, len(rest) > limit), out.astype(np.float64)
+
+    def _ordered_page(self, order: _Order, members, cursor, limit):
+        start = order.start(cursor)
+        if members is None:
+            out = order.order[start:start + limit]
+            return _Page(out, start + limit < self.size), order.keys[out]
+        ranks = order.rank[members]
+        ranks = ranks[ranks >= start]
+        more = len(ranks) > limit
+        if more:
+            ranks = np.partition(ranks, limit - 1)[:limit]
+        out = order.order[np.sort(ranks)]
+        return _Page(out, more), order.keys[out]
+
+    def _distance_page(self, members, cursor, limit, origin):
+        candidates = np.arange(self.size, dtype=np.int64) if members is None else members
+        dist = geo.haversine_km(self.lat[candidates], self.lng[candidates], origin[0], origin[1])
+        dist = np.where(np.isnan(dist), np.inf, dist)
+        if cursor is not None:
+            keep = (dist > cursor.value) | ((dist == cursor.value) & (candidates > cursor.pos))
+            candidates, dist = candidates[keep], dist[keep]
+        order = np.lexsort((candidates, dist))
+        more = len(order) > limit
+        order = order[:limit]
+        return _Page(candidates[order], more), dist[order]
+
+
+@dataclass
+class _Page:
+    values: np.ndarray
+    more: bool
+
+    def __len__(self) -> int:
+        return len(self.values)
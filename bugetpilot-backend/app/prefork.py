@@ -0,0 +1,169 @@
+# app/prefork.py
+"""
+멀티 워커 pre-fork 서버
+
+    python -m app.prefork --workers 4 --port 8000
+
+- 마스터가 데이터셋을 1번만 로드 (스냅샷이면 숫자 컬럼은 읽기 전용 mmap → 페이지 캐시 공유)
+- gc.freeze()로 로드된 객체를 GC 추적 대상에서 빼서, 워커에서 GC가 돌아도 copy-on-write가 안 일어나게 함
+- 그 다음 소켓을 열고 fork → 워커들은 이미 로드된 세대를 그대로 사용 (warm-up은 no-op)
+- uvicorn --workers 는 spawn 방식이라 워커마다 데이터를 다시 로드함 → 워커 수에 비례해 메모리 증가
+
+데이터 교체는 마스터가 함 (워커가 각자 새 세대를 빌드하면 공유가 깨지고 워커마다 세대가 달라짐)
+- 워커의 /admin/reload·문화 CSV 다운로드 완료 → 마스터에 SIGHUP (워커는 파일 감시도 안 함)
+- 마스터: SIGHUP 또는 자기 파일 감시(DATASET_WATCH_INTERVAL)로 reload → 성공하면 gc.freeze 다시 하고
+  워커를 하나씩 새로 fork 한 뒤 예전 워커에 SIGTERM (롤링, 교체 중 잠깐만 두 세대가 같이 응답)
+"""
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+import uvicorn
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(app, sock: socket.socket, log_level: str) -> None:
+    config = uvicorn.Config(app, log_level=log_level, lifespan="on")
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+
+
+def _request_master_reload() -> bool:
+    os.kill(os.getppid(), signal.SIGHUP)
+    return True
+
+
+def _fork_worker(app, sock: socket.socket, log_level: str) -> int:
+    pid = os.fork()
+    if pid == 0:
+        try:
+            from app import datasets
+
+            # 마스터가 준 세대만 사용: reload 요청/파일 감시는 마스터로
+            signal.signal(signal.SIGHUP, signal.SIG_DFL)
+            datasets.delegate_reloads(_request_master_reload)
+            _run_worker(app, sock, log_level)
+        finally:
+            os._exit(0)
+    return pid
+
+
+def preload(names: Optional[List[str]] = None):
+    """마스터에서 앱 import + 데이터셋 로드 + gc.freeze"""
+    from app import datasets
+    from app.main import app, WARMUP_DATASETS
+
+    ok = datasets.warm_up(names or WARMUP_DATASETS)
+    if not ok:
+        print("[PREFORK] warm-up failed for some datasets; workers will retry lazily")
+    _freeze()
+    print(f"[PREFORK] preloaded, {gc.get_freeze_count()} objects frozen")
+    return app
+
+
+def _freeze() -> None:
+    # reload 뒤에는 예전 세대 객체도 풀어서 정리한 다음 새 세대만 다시 고정
+    gc.unfreeze()
+    gc.collect()
+    gc.freeze()
+
+
+def serve(host: str, port: int, workers: int, log_level: str = "info") -> None:
+    from app import datasets
+
+    app = preload()
+    sock = _bind(host, port)
+
+    children: Dict[int, int] = {}  # pid → slot
+    stopping = False
+    reload_requested = False
+    refork = threading.Event()  # 마스터 세대 교체됨 → 워커 다시 fork (파일 감시/다운로드 스레드에서도 set)
+    datasets.on_swap(lambda gen: refork.set())
+    datasets.start_watcher()
+
+    def _stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _reload(signum, frame):
+        nonlocal reload_requested
+        reload_requested = True
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGHUP, _reload)
+
+    for slot in range(workers):
+        children[_fork_worker(app, sock, log_level)] = slot
+    print(f"[PREFORK] master {os.getpid()} serving on {host}:{port} with workers {sorted(children)}")
+
+    retired = set()  # 롤링 교체로 SIGTERM 보낸 예전 워커 (종료돼도 다시 fork 안 함)
+    while children or retired:
+        if reload_requested and not stopping:
+            reload_requested = False
+            # 워커들은 그동안 예전 세대로 계속 응답, 실패하면 기존 세대 유지
+            datasets.reload()
+        if refork.is_set() and not stopping:
+            refork.clear()
+            _freeze()
+            gen = datasets.current().version
+            for old, slot in list(children.items()):
+                children.pop(old)
+                children[_fork_worker(app, sock, log_level)] = slot
+                retired.add(old)
+                os.kill(old, signal.SIGTERM)
+            print(f"[PREFORK] gen {gen}: workers re-forked {sorted(children)}")
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+        if pid == 0:
+            # SIGHUP/세대 교체를 보려고 짧게 대기하며 폴링
+            time.sleep(0.2)
+            continue
+        retired.discard(pid)
+        slot = children.pop(pid, None)
+        if slot is None or stopping:
+            continue
+        # 워커가 죽으면 같은 슬롯으로 다시 fork (데이터는 마스터에 이미 있음)
+        print(f"[PREFORK] worker {pid} exited ({status}), restarting")
+        time.sleep(0.5)
+        children[_fork_worker(app, sock, log_level)] = slot
+
+    sock.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="데이터셋을 미리 로드하고 fork 하는 멀티 워커 서버")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", "2")))
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args(argv)
+
+    if not hasattr(os, "fork"):
+        sys.exit("pre-fork mode needs os.fork (Linux/macOS)")
+    serve(args.host, args.port, args.workers, args.log_level)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# app/projection.py
+"""
+국내 TM(횡메르카토르) 평면 좌표 ↔ WGS84 위경도 (NumPy 벡터화, 외부 라이브러리/서비스 없음)
+
+    lat, lng = projection.to_wgs84(x, y)            # 좌표정보(x), 좌표정보(y) 배열 → 위도, 경도 배열
+    x, y = projection.from_wgs84(lat, lng)          # 반대 방향 (검증/벤치용)
+
+- 지방행정 인허가(식품_일반음식점 등) 좌표정보는 중부원점 TM (기본 EPSG:5174, Bessel 타원체)
+  다른 좌표계면 TM_CRS 환경변수로 (5174 | 2097 | 5181 | 5186)
+- 계산 순서: TM 역변환(EPSG Guidance Note 7-2 USGS 급수식) → 타원체 위 위경도
+  → 지구중심 직교좌표 → 7-파라미터 Helmert(position vector) → WGS84 직교좌표 → 위경도
+  (GRS80 좌표계는 WGS84 와 사실상 같아서 Helmert 생략)
+- 행 단위 파이썬 루프 없음 (위경도 역산의 반복 몇 번도 배열 단위)
+- 빈 값/NaN 은 NaN 그대로
+"""
+from __future__ import annotations
+
+import math
+import os
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from app.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# 모듈 수준에서 np. 속성을 건드리면 lazy numpy 가 import 시점에 로드됨 → math 로
+_ARCSEC = math.pi / (180 * 3600)
+
+
+@dataclass(frozen=True)
+class Ellipsoid:
+    a: float
+    inv_f: float
+
+    @property
+    def e2(self) -> float:
+        f = 1 / self.inv_f
+        return f * (2 - f)
+
+
+BESSEL = Ellipsoid(6377397.155, 299.1528128)
+GRS80 = Ellipsoid(6378137.0, 298.257222101)
+WGS84 = Ellipsoid(6378137.0, 298.257223563)
+
+
+@dataclass(frozen=True)
+class TransverseMercator:
+    ellipsoid: Ellipsoid
+    lat0: float            # 원점 위도 (도)
+    lon0: float            # 원점 경도 (도)
+    k0: float
+    false_easting: float
+    false_northing: float
+    # WGS84 로 가는 Helmert (tx, ty, tz [m], rx, ry, rz [초], ds [ppm]), None = 변환 없음
+    towgs84: Optional[Tuple[float, ...]] = None
+
+
+CRS = {
+    # Korean 1985 / Modified Central Belt (경도 원점 10.405초 보정)
+    "5174": TransverseMercator(BESSEL, 38.0, 127.0028902777778, 1.0, 200000.0, 500000.0,
+                               (-115.80, 474.99, 674.11, 1.16, -2.31, -1.63, 6.43)),
+    # Korean 1985 / Central Belt
+    "2097": TransverseMercator(BESSEL, 38.0, 127.0, 1.0, 200000.0, 500000.0, (-146.43, 507.89, 681.46, 0, 0, 0, 0)),
+    # Korea 2000 / Central Belt, Central Belt 2010
+    "5181": TransverseMercator(GRS80, 38.0, 127.0, 1.0, 200000.0, 500000.0),
+    "5186": TransverseMercator(GRS80, 38.0, 127.0, 1.0, 200000.0, 600000.0),
+}
+TM_CRS = os.getenv("TM_CRS", "5174")
+
+
+def _meridian_arc(e: Ellipsoid, phi):
+    """적도 → 위도 phi 자오선 길이 M"""
+    e2 = e.e2
+    e4, e6 = e2 * e2, e2 * e2 * e2
+    return e.a * (
+        (1 - e2 / 4 - 3 * e4 / 64 - 5 * e6 / 256) * phi
+        - (3 * e2 / 8 + 3 * e4 / 32 + 45 * e6 / 1024) * np.sin(2 * phi)
+        + (15 * e4 / 256 + 45 * e6 / 1024) * np.sin(4 * phi)
+        - (35 * e6 / 3072) * np.sin(6 * phi)
+    )
+
+
+def tm_forward(tm: TransverseMercator, lat, lng) -> Tuple[np.ndarray, np.ndarray]:
+    """타원체 위경도(도) → (easting, northing)"""
+    e = tm.ellipsoid
+    e2 = e.e2
+    ep2 = e2 / (1 - e2)
+    phi = np.radians(np.asarray(lat, dtype=np.float64))
+    lam = np.radians(np.asarray(lng, dtype=np.float64))
+    sin, cos, tan = np.sin(phi), np.cos(phi), np.tan(phi)
+    nu = e.a / np.sqrt(1 - e2 * sin * sin)
+    t = tan * tan
+    c = ep2 * cos * cos
+    a = (lam - np.radians(tm.lon0)) * cos
+    m = _meridian_arc(e, phi)
+    m0 = _meridian_arc(e, np.radians(tm.lat0))
+    x = tm.false_easting + tm.k0 * nu * (
+        a + (1 - t + c) * a ** 3 / 6 + (5 - 18 * t + t * t + 72 * c - 58 * ep2) * a ** 5 / 120
+    )
+    y = tm.false_northing + tm.k0 * (
+        m - m0 + nu * tan * (
+            a * a / 2 + (5 - t + 9 * c + 4 * c * c) * a ** 4 / 24
+            + (61 - 58 * t + t * t + 600 * c - 330 * ep2) * a ** 6 / 720
+        )
+    )
+    return x, y
+
+
+def tm_inverse(tm: TransverseMercator, x, y) -> Tuple[np.ndarray, np.ndarray]:
+    """(easting, northing) → 타원체 위경도(도)"""
+    e = tm.ellipsoid
+    e2 = e.e2
+    e4, e6 = e2 * e2, e2 * e2 * e2
+    ep2 = e2 / (1 - e2)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    m1 = _meridian_arc(e, np.radians(tm.lat0)) + (y - tm.false_northing) / tm.k0
+    mu = m1 / (e.a * (1 - e2 / 4 - 3 * e4 / 64 - 5 * e6 / 256))
+    e1 = (1 - np.sqrt(1 - e2)) / (1 + np.sqrt(1 - e2))
+    phi1 = (
+        mu
+        + (3 * e1 / 2 - 27 * e1 ** 3 / 32) * np.sin(2 * mu)
+        + (21 * e1 ** 2 / 16 - 55 * e1 ** 4 / 32) * np.sin(4 * mu)
+        + (151 * e1 ** 3 / 96) * np.sin(6 * mu)
+        + (1097 * e1 ** 4 / 512) * np.sin(8 * mu)
+    )
+    sin, cos, tan = np.sin(phi1), np.cos(phi1), np.tan(phi1)
+    w = 1 - e2 * sin * sin
+    nu = e.a / np.sqrt(w)
+    rho = e.a * (1 - e2) / (w * np.sqrt(w))
+    t = tan * tan
+    c = ep2 * cos * cos
+    d = (x - tm.false_easting) / (nu * tm.k0)
+    phi = phi1 - (nu * tan / rho) * (
+        d * d / 2
+        - (5 + 3 * t + 10 * c - 4 * c * c - 9 * ep2) * d ** 4 / 24
+        + (61 + 90 * t + 298 * c + 45 * t * t - 252 * ep2 - 3 * c * c) * d ** 6 / 720
+    )
+    lam = np.radians(tm.lon0) + (
+        d - (1 + 2 * t + c) * d ** 3 / 6 + (5 - 2 * c + 28 * t - 3 * c * c + 8 * ep2 + 24 * t * t) * d ** 5 / 120
+    ) / cos
+    return np.degrees(phi), np.degrees(lam)
+
+
+def geocentric(e: Ellipsoid, lat, lng, h=0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    phi = np.radians(np.asarray(lat, dtype=np.float64))
+    lam = np.radians(np.asarray(lng, dtype=np.float64))
+    nu = e.a / np.sqrt(1 - e.e2 * np.sin(phi) ** 2)
+    return (
+        (nu + h) * np.cos(phi) * np.cos(lam),
+        (nu + h) * np.cos(phi) * np.sin(lam),
+        (nu * (1 - e.e2) + h) * np.sin(phi),
+    )
+
+
+def geodetic(e: Ellipsoid, x, y, z, iterations: int = 4) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """지구중심 직교좌표 → (위도, 경도, 높이) — 위도는 배열 단위 고정점 반복 (지표 근처 4번이면 mm 이하)"""
+    p = np.hypot(x, y)
+    lam = np.arctan2(y, x)
+    phi = np.arctan2(z, p * (1 - e.e2))
+    for _ in range(iterations):
+        nu = e.a / np.sqrt(1 - e.e2 * np.sin(phi) ** 2)
+        h = p / np.cos(phi) - nu
+        phi = np.arctan2(z, p * (1 - e.e2 * nu / (nu + h)))
+    nu = e.a / np.sqrt(1 - e.e2 * np.sin(phi) ** 2)
+    return np.degrees(phi), np.degrees(lam), p / np.cos(phi) - nu
+
+
+def helmert(params: Tuple[float, ...], x, y, z, inverse: bool = False):
+    """7-파라미터 Helmert (position vector, 회전은 초, 축척은 ppm), 작은 회전 근사"""
+    tx, ty, tz, rx, ry, rz, ds = params
+    rx, ry, rz, s = rx * _ARCSEC, ry * _ARCSEC, rz * _ARCSEC, 1 + ds * 1e-6
+    if inverse:
+        # 작은 회전/축척이라 부호만 바꾼 역변환 (mm 수준)
+        x, y, z = x - tx, y - ty, z - tz
+        return ((x + rz * y - ry * z) / s, (-rz * x + y + rx * z) / s, (ry * x - rx * y + z) / s)
+    return (
+        tx + s * (x - rz * y + ry * z),
+        ty + s * (rz * x + y - rx * z),
+        tz + s * (-ry * x + rx * y + z),
+    )
+
+
+def to_wgs84(x, y, crs: str = TM_CRS) -> Tuple[np.ndarray, np.ndarray]:
+    """TM (easting, northing) 배열 → WGS84 (위도, 경도) 배열"""
+    tm = CRS[crs]
+    lat, lng = tm_inverse(tm, x, y)
+    if tm.towgs84 is None:
+        return lat, lng
+    gx, gy, gz = helmert(tm.towgs84, *geocentric(tm.ellipsoid, lat, lng))
+    lat, lng, _ = geodetic(WGS84, gx, gy, gz)
+    return lat, lng
+
+
+def from_wgs84(lat, lng, crs: str = TM_CRS) -> Tuple[np.ndarray, np.ndarray]:
+    """WGS84 (위도, 경도) 배열 → TM (easting, northing) 배열"""
+    tm = CRS[crs]
+    if tm.towgs84 is not None:
+        gx, gy, gz = helmert(tm.towgs84, *geocentric(WGS84, lat, lng), inverse=True)
+        lat, lng, _ = geodetic(tm.ellipsoid, gx, gy, gz)
+    return tm_forward(tm, lat, lng)
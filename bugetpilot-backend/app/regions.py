@@ -0,0 +1,99 @@
+# app/regions.py
+"""
+여행 지역 카탈로그 (프론트 지역 선택 화면의 여행지들)
+- 스크립트(reduce_restaurants_by_region.py, data/filter_attractions_by_region.py)와 같은 키워드
+- 키워드는 행정구역 트리(app/address.py)로 해석 → 주소 코드가 그 지역에 속하면 해당 지역
+  (광주 → 광주광역시만, 성수동 → 성수동1가/2가, 프론트 값 강남/홍대/성수/제주도/울릉도 도 같은 지역으로)
+- TRAVEL_REGIONS 환경변수(쉼표 구분)로 덮어쓸 수 있음
+
+지역 샤딩: SERVED_REGIONS=강릉,속초,춘천 처럼 주면 이 노드는 해당 지역 행만 메모리에 올림
+- 비우면 전체 (샤딩 안 함, 필터도 안 함)
+- 다른 노드 담당 지역 키워드로 들어온 목록 요청은 main.py 미들웨어가 바로 421로 거절
+  (/nearby 는 키워드 대신 좌표 → 담당 지역 데이터 범위 밖이면 같은 421, routers/nearby.py)
+"""
+from __future__ import annotations
+
+import os
+from typing import List, Optional, Sequence
+
+from app import address
+from app.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+TRAVEL_REGIONS = [
+    "강남구", "마포구", "성수동", "종로구", "가평", "인천", "수원", "대전", "천안",
+    "단양", "춘천", "속초", "강릉", "전주", "여수", "목포", "광주", "부산", "대구",
+    "경주", "통영", "제주", "울릉",
+]
+
+
+def configured_regions() -> List[str]:
+    raw = os.getenv("TRAVEL_REGIONS", "")
+    regions = [r.strip() for r in raw.split(",") if r.strip()]
+    return regions or list(TRAVEL_REGIONS)
+
+
+def served_regions() -> Optional[List[str]]:
+    """이 노드가 담당하는 지역 키워드 (None = 전체)"""
+    served = [r.strip() for r in os.getenv("SERVED_REGIONS", "").split(",") if r.strip()]
+    return served or None
+
+
+def region_mask(codes, names: Sequence[str]):
+    """address.parse 결과 중 names 지역 하나라도 속하는 행 → bool ndarray (해석 안 되는 이름은 무시)"""
+    mask = np.zeros(len(codes), dtype=bool)
+    for name in names:
+        ref = address.resolve(name)
+        if ref is not None:
+            # 담당 지역은 행정구역만 (같은 이름 도로는 다른 지역에도 있음)
+            mask |= address.RegionRef(ref.codes).mask(codes)
+    return mask
+
+
+def shard_filter(df, address_col: str):
+    """담당 지역 주소 행만 남긴 DataFrame (index 유지). 샤딩 안 하면 그대로"""
+    served = served_regions()
+    if served is None or len(df) == 0:
+        return df
+    return df[region_mask(address.parse(df[address_col]), served)]
+
+
+def catalog_regions_for(keyword: str, regions: Optional[Sequence[str]] = None) -> List[str]:
+    """검색 키워드가 가리키는 카탈로그 지역들 (강릉시 → 강릉, 성수 → 성수동)"""
+    regions = regions or configured_regions()
+    ref = address.resolve(keyword)
+    if ref is not None:
+        out = []
+        for r in regions:
+            other = address.resolve(r)
+            if other is not None and other.covers(ref):
+                out.append(r)
+        return out
+    # 트리가 아직 모르는 이름 (데이터 로드 전) → 문자열 포함 관계
+    kw = keyword.strip().lower()
+    if not kw:
+        return []
+    return [r for r in regions if r.lower() in kw or kw in r.lower()]
+
+
+def unserved_body(requested: str) -> dict:
+    """421 응답 본문 (목록 API 미들웨어와 /nearby 가 같은 모양)"""
+    return {
+        "detail": f"region not served by this node: {requested}",
+        "served_regions": served_regions(),
+    }
+
+
+def is_served(keyword: Optional[str]) -> bool:
+    """
+    키워드 요청을 이 노드가 처리할 수 있는지
+    - 샤딩 안 함 / 키워드 없음 / 카탈로그 지역이 아닌 키워드(예: 청주) → True (로컬 데이터로 응답)
+    - 카탈로그 지역인데 담당 지역이 하나도 안 겹치면 False
+    """
+    served = served_regions()
+    if served is None or not keyword:
+        return True
+    if not catalog_regions_for(keyword):
+        return True
+    return bool(catalog_regions_for(keyword, served))
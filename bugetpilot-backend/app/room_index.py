@@ -0,0 +1,127 @@
+# app/room_index.py
+"""
+/rooms 필터용 다중 속성 인덱스 (로드 시 1번 빌드)
+
+    index = RoomIndex(room_ids, prices, ratings, codes)
+    index.slot(room_id)                                   # room_id → rooms 위치 (dict 1번)
+    index.filter(positions, max_price=..., min_rating=...)  # → 조건 다 맞는 위치, 파일 순서
+
+- 가격/평점: 값으로 정렬한 위치 배열 + 정렬된 값 → max_price/min_rating 은 이분 탐색(searchsorted)
+  한 번이면 조건 맞는 위치 집합이 정렬 배열의 앞/뒤 구간으로 나옴
+- 행정구역 코드(address.parse 결과)도 코드별로 정렬해 두고 지역 코드마다 구간 → 지역 검색도 이분 탐색
+- 조건 여러 개: 후보가 제일 적은 조건 하나만 펼치고 나머지는 그 후보에 대해서만 확인
+  (가격/평점은 배열 값 비교, 키워드 결과는 정렬된 위치 배열에 이분 탐색)
+  → 비용은 카탈로그 크기가 아니라 가장 작은 후보 집합 크기에 비례
+- 결과는 기존 리스트 필터와 같은 순서(rooms 순서)
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional, Sequence
+
+from app import address
+from app.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _positions(values: Iterable[int]) -> np.ndarray:
+    return np.asarray(values, dtype=np.int64)
+
+
+class _SortedColumn:
+    """값으로 정렬한 위치 배열 + 정렬된 값 (구간 = 이분 탐색 2번)"""
+
+    def __init__(self, values: np.ndarray):
+        self.values = values
+        self.order = np.argsort(values, kind="stable").astype(np.int64)
+        self.sorted = values[self.order]
+
+    def at_most(self, bound) -> np.ndarray:
+        return self.order[: np.searchsorted(self.sorted, bound, side="right")]
+
+    def at_least(self, bound) -> np.ndarray:
+        return self.order[np.searchsorted(self.sorted, bound, side="left"):]
+
+    def count_at_most(self, bound) -> int:
+        return int(np.searchsorted(self.sorted, bound, side="right"))
+
+    def count_at_least(self, bound) -> int:
+        return len(self.sorted) - int(np.searchsorted(self.sorted, bound, side="left"))
+
+    def equal_to(self, value) -> np.ndarray:
+        lo = np.searchsorted(self.sorted, value, side="left")
+        hi = np.searchsorted(self.sorted, value, side="right")
+        return self.order[lo:hi]
+
+
+class RoomIndex:
+    def __init__(self, room_ids: Sequence[int], prices: Sequence[int], ratings: Sequence[float],
+                 codes: Optional[pd.DataFrame] = None):
+        self.size = len(room_ids)
+        # room_id 가 겹치면 기존 next(...) 처럼 앞에 있는 숙소
+        self.slots: Dict[int, int] = {}
+        for pos, rid in enumerate(room_ids):
+            self.slots.setdefault(int(rid), pos)
+        self.price = _SortedColumn(np.asarray(prices, dtype=np.int64))
+        self.rating = _SortedColumn(np.asarray(ratings, dtype=np.float64))
+        self.codes: Dict[str, _SortedColumn] = {}
+        if codes is not None:
+            for col in address.CODE_COLS.values():
+                self.codes[col] = _SortedColumn(codes[col].to_numpy(dtype=np.int64))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def slot(self, room_id: int) -> Optional[int]:
+        return self.slots.get(room_id)
+
+    def region(self, ref: address.RegionRef) -> np.ndarray:
+        """지역 코드(여러 단계 + 도로)에 속하는 위치 (rooms 순서)"""
+        parts = [
+            self.codes[address.CODE_COLS[level]].equal_to(code)
+            for level, codes in ref.by_level().items() for code in codes
+        ]
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        # 단계가 섞이면 같은 행이 여러 번 (종로구 + 종로1가 …)
+        return np.unique(np.concatenate(parts))
+
+    def filter(self, positions: Optional[Iterable[int]] = None, max_price: Optional[int] = None,
+               min_rating: Optional[float] = None) -> np.ndarray:
+        """
+        positions(키워드 검색 결과, rooms 순서) ∩ daily_price <= max_price ∩ rating_star_score >= min_rating
+        조건이 없으면 None 대신 전체 위치
+        """
+        if max_price is not None:
+            # Query 정수는 크기 제한이 없음 → int64 범위로 (비교 결과는 같음)
+            max_price = min(max(int(max_price), _INT64_MIN), _INT64_MAX)
+        kw = None if positions is None else _positions(positions)
+
+        # (후보 수, 후보 펼치기) — 제일 작은 것 하나만 펼침
+        options = []
+        if kw is not None:
+            options.append((len(kw), lambda: kw))
+        if max_price is not None:
+            options.append((self.price.count_at_most(max_price), lambda: self.price.at_most(max_price)))
+        if min_rating is not None:
+            options.append((self.rating.count_at_least(min_rating), lambda: self.rating.at_least(min_rating)))
+        if not options:
+            return np.arange(self.size, dtype=np.int64)
+
+        options.sort(key=lambda o: o[0])
+        out = options[0][1]()
+        ordered = out is kw  # 키워드 결과를 펼쳤으면 이미 rooms 순서
+        if kw is not None and not ordered and len(out):
+            # 키워드 결과는 rooms 순서(정렬됨) → 이분 탐색으로 포함 여부
+            hit = np.searchsorted(kw, out)
+            hit[hit == len(kw)] = 0
+            out = out[kw[hit] == out] if len(kw) else out[:0]
+        if max_price is not None and len(out):
+            out = out[self.price.values[out] <= max_price]
+        if min_rating is not None and len(out):
+            out = out[self.rating.values[out] >= min_rating]
+        return out if ordered else np.sort(out)
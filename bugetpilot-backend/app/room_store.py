@@ -0,0 +1,124 @@
+# app/room_store.py
+"""
+숙소 컬럼 저장소 (struct-of-arrays, 로드 시 1번)
+
+    store = RoomStore(df_rooms, df_images)
+    store.rows([3, 10])        # → Room 필드 dict 리스트 (응답 만들 때만 파이썬 객체로)
+    store.images(3, 1)         # → 이미지 URL 앞 1개
+    store.numeric("daily_price")  # → int64 ndarray (인덱스/필터용, 복사 없음)
+
+- 숫자 필드: 필드마다 NumPy 배열 1개 (Room 타입대로 int64 / float64)
+- 문자열 필드(title/address/description): 고유 값만 UTF-8 바이트 1덩어리 + 시작 오프셋, 행에는 int32 코드
+  (같은 설명/주소가 반복돼도 1번만 저장)
+- 이미지: room_id 로 정렬한 (room_id, URL 코드) 표 + 숙소별 [시작, 끝) 구간 (CSR)
+  URL 도 같은 방식으로 interning (문화 데이터셋은 등급별 URL 5개뿐)
+- pydantic Room 객체를 숙소마다 들고 있지 않음 → 숙소당 수 KB → 수십 바이트
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence
+
+from app.lazy import lazy_import
+from app.models import Room
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+ROOM_FIELDS = list(Room.model_fields)
+STRING_FIELDS = [f for f, info in Room.model_fields.items() if info.annotation is str]
+NUMERIC_DTYPES = {
+    f: ("int64" if info.annotation is int else "float64")
+    for f, info in Room.model_fields.items()
+    if f not in STRING_FIELDS
+}
+
+
+class StringColumn:
+    """interning + 오프셋 인코딩 문자열 컬럼"""
+
+    def __init__(self, values: Sequence[str]):
+        codes, uniques = pd.factorize(pd.Series(list(values), dtype=object), use_na_sentinel=False)
+        self.codes = np.asarray(codes, dtype=np.int32)
+        encoded = [str(u).encode("utf-8") for u in uniques]
+        self.offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        if encoded:
+            self.offsets[1:] = np.cumsum([len(b) for b in encoded])
+        self.data = b"".join(encoded)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def _decode(self, code: int) -> str:
+        return self.data[self.offsets[code]:self.offsets[code + 1]].decode("utf-8")
+
+    def __getitem__(self, pos: int) -> str:
+        return self._decode(int(self.codes[pos]))
+
+    def take(self, positions) -> List[str]:
+        # 고유 값이 적은 컬럼이 많아서 코드별로 1번만 디코딩
+        decoded: Dict[int, str] = {}
+        out = []
+        for code in self.codes[positions].tolist():
+            text = decoded.get(code)
+            if text is None:
+                text = decoded[code] = self._decode(code)
+            out.append(text)
+        return out
+
+    def tolist(self) -> List[str]:
+        return self.take(slice(None))
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.offsets.nbytes + len(self.data)
+
+
+class RoomStore:
+    def __init__(self, df_rooms: pd.DataFrame, df_images: pd.DataFrame):
+        self.size = len(df_rooms)
+        self._numeric: Dict[str, np.ndarray] = {
+            f: df_rooms[f].to_numpy(dtype=dtype) for f, dtype in NUMERIC_DTYPES.items()
+        }
+        self._strings: Dict[str, StringColumn] = {
+            f: StringColumn(df_rooms[f].astype(str).tolist()) for f in STRING_FIELDS
+        }
+
+        # 이미지 CSR: room_id 로 안정 정렬 (같은 숙소 안에서는 CSV 순서 유지)
+        image_ids = df_images["room_id"].to_numpy(dtype=np.int64)
+        order = np.argsort(image_ids, kind="stable")
+        self.image_room_ids = image_ids[order]
+        self.image_urls = StringColumn(df_images["image_url"].astype(str).to_numpy()[order].tolist())
+        room_ids = self._numeric["room_id"]
+        self.image_start = np.searchsorted(self.image_room_ids, room_ids, side="left")
+        self.image_end = np.searchsorted(self.image_room_ids, room_ids, side="right")
+
+    def __len__(self) -> int:
+        return self.size
+
+    def numeric(self, name: str) -> np.ndarray:
+        return self._numeric[name]
+
+    def strings(self, name: str) -> List[str]:
+        return self._strings[name].tolist()
+
+    def rows(self, positions) -> List[dict]:
+        """positions 위치 숙소들 → Room 필드 dict (컬럼 단위로 꺼내서 한 번에 묶음)"""
+        positions = np.asarray(positions, dtype=np.int64)
+        columns = [self._numeric[f][positions].tolist() if f in self._numeric else self._strings[f].take(positions)
+                   for f in ROOM_FIELDS]
+        return [dict(zip(ROOM_FIELDS, values)) for values in zip(*columns)]
+
+    def images(self, pos: int, count: Optional[int] = None) -> List[str]:
+        """숙소 이미지 URL (count 가 있으면 앞에서 count 개)"""
+        start, end = int(self.image_start[pos]), int(self.image_end[pos])
+        if count is not None:
+            end = min(end, start + count)
+        return self.image_urls.take(slice(start, end))
+
+    @property
+    def nbytes(self) -> int:
+        total = sum(a.nbytes for a in self._numeric.values())
+        total += sum(c.nbytes for c in self._strings.values())
+        total += self.image_room_ids.nbytes + self.image_urls.nbytes
+        total += self.image_start.nbytes + self.image_end.nbytes
+        return total
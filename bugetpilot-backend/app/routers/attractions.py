@@ -1,11 +1,21 @@
 # app/routers/attractions.py
 # 전국관광지정보표준데이터.csv 기반 관광지 API
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
-import pandas as pd
 from fastapi import APIRouter, Query
 
+from app import bm25, csv_loader, datasets, fragments, geo, pages, paging, regions, snapshot, storage
+from app.csv_loader import text_column
+from app.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
 router = APIRouter(prefix="/attractions", tags=["attractions"])
 
 APP_ROOT = Path(__file__).resolve().parent.parent
@@ -19,11 +29,12 @@ ATTR_CANDIDATES = [
     (BACKEND_ROOT / "data" / ATTR_CSV),
 ]
 
+# q= 전문 검색: 관광지명이 소개 문장보다 관련도에 더 크게 반영되게
+TEXT_NAME_WEIGHT = float(os.getenv("ATTRACTION_NAME_WEIGHT", "2.0"))
+
 PLACEHOLDER_IMAGE = "https://images.unsplash.com/photo-1507525428034-b723cf961d3e?w=800"
 DEFAULT_PRICE = 0  # 표준데이터에 입장료 없음 → 무료 기본
 
-_attr_df = None
-
 ATTR_COLS = [
     "관광지명",
     "소재지도로명주소",
@@ -32,7 +43,18 @@ ATTR_COLS = [
     "주차가능수",
     "관리기관전화번호",
     "가격",
+    "위도",
+    "경도",
 ]
+OPTIONAL_COLS = ["가격", "위도", "경도"]  # 없어도 됨 (가격 기본값, 좌표 없음)
+ATTR_OUT_COLS = ATTR_COLS + ["_addr"]
+ATTR_DTYPES = {
+    "관광지명": csv_loader.COMPACT_STR,
+    "소재지도로명주소": csv_loader.COMPACT_STR,
+    "소재지지번주소": csv_loader.COMPACT_STR,
+    "관광지소개": csv_loader.COMPACT_STR,
+    "관리기관전화번호": csv_loader.COMPACT_STR,
+}
 
 
 def _pick_path(candidates: list) -> Optional[Path]:
@@ -43,37 +65,185 @@ def _pick_path(candidates: list) -> Optional[Path]:
 
 
 def _read_csv(path: Path) -> pd.DataFrame:
-    encodings = ["utf-8-sig", "utf-8", "cp949", "euc-kr"]
-    required = [c for c in ATTR_COLS if c != "가격"]
-    for enc in encodings:
-        try:
-            df = pd.read_csv(path, encoding=enc, low_memory=False)
-            df.columns = df.columns.astype(str).str.strip()
-            missing = [c for c in required if c not in df.columns]
-            if not missing:
-                out = df[[c for c in ATTR_COLS if c in df.columns]].copy()
-                if "가격" not in out.columns:
-                    out["가격"] = DEFAULT_PRICE
-                return out
-            return pd.DataFrame(columns=ATTR_COLS)
-        except Exception:
-            continue
-    return pd.DataFrame(columns=ATTR_COLS)
-
-
-def _load_data():
-    global _attr_df
-    if _attr_df is not None:
-        return
+    # 필요한 컬럼만 파싱, 가격/좌표 컬럼은 없어도 됨(기본값)
+    required = [c for c in ATTR_COLS if c not in OPTIONAL_COLS]
+    df = csv_loader.read_columns(path, ATTR_COLS, dtypes=ATTR_DTYPES, required=required)
+    if df is None:
+        return pd.DataFrame(columns=ATTR_COLS)
+    if "가격" not in df.columns:
+        df["가격"] = DEFAULT_PRICE
+    for col in ("위도", "경도"):
+        if col not in df.columns:
+            df[col] = np.nan
+    return df
+
+
+def _typed(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    원본 컬럼 → 런타임 컬럼 (로드 시 1번, 요청 때 행마다 파싱하지 않게)
+    - 가격/주차가능수: 정수 (숫자가 아니거나 비면 기본값), 위도/경도: 실수
+    - 주소/소개/전화: 결측은 "" 로, 앞뒤 공백 제거
+    - _addr: 키워드 검색 키 + 응답 location (도로명 + 지번)
+      (응답 변경: 예전엔 한쪽 주소가 비면 location 에 "nan" 이 그대로 붙었음 → 이제 있는 쪽만)
+    """
+    text = {c: text_column(df[c]).astype(csv_loader.COMPACT_STR)
+            for c in ("관광지명", "소재지도로명주소", "소재지지번주소", "관광지소개", "관리기관전화번호")}
+    return df.assign(
+        **text,
+        주차가능수=pd.to_numeric(df["주차가능수"], errors="coerce").fillna(0).astype(np.int64),
+        가격=pd.to_numeric(df["가격"], errors="coerce").fillna(DEFAULT_PRICE).astype(np.int64),
+        위도=pd.to_numeric(df["위도"], errors="coerce"),
+        경도=pd.to_numeric(df["경도"], errors="coerce"),
+        _addr=(text["소재지도로명주소"] + " " + text["소재지지번주소"]).str.strip().astype(csv_loader.COMPACT_STR),
+    )[ATTR_OUT_COLS]
+
+
+def build_attraction_tables() -> Tuple[Dict[str, pd.DataFrame], List[Path]]:
+    """관광지 CSV → 런타임 테이블 (스냅샷 compile 과 CSV fallback 공용)"""
     path = _pick_path(ATTR_CANDIDATES)
     if not path:
-        _attr_df = pd.DataFrame(columns=ATTR_COLS)
-        return
-    _attr_df = _read_csv(path)
-    if _attr_df is not None and len(_attr_df) > 0:
-        _attr_df = _attr_df.dropna(subset=["관광지명"])
+        return {"attractions": pd.DataFrame(columns=ATTR_OUT_COLS)}, []
+    df = _read_csv(path)
+    if df is not None and len(df) > 0:
+        df = _typed(df.dropna(subset=["관광지명"]))
     else:
-        _attr_df = pd.DataFrame(columns=ATTR_COLS)
+        df = pd.DataFrame(columns=ATTR_OUT_COLS)
+    return {"attractions": df}, [path]
+
+
+def _load_attractions():
+    # 스냅샷(python -m app.snapshot compile) 우선, 없으면 CSV 파싱
+    tables = snapshot.load_dataset("attractions") or build_attraction_tables()[0]
+    df = regions.shard_filter(tables["attractions"], "_addr")
+    return storage.make_table("attractions", df, "_addr")
+
+
+datasets.register("attractions", _load_attractions)
+
+
+# (가격, 응답 항목 JSON 조각) — 이름이 비면 None (행 자리는 유지)
+Item = Optional[Tuple[int, bytes]]
+
+
+def _items(df: pd.DataFrame) -> List[Item]:
+    # 컬럼은 로드 때 정규화됨 (_typed) → 행마다 파싱/예외 처리 없이 조각만 만듦
+    return [
+        (price, fragments.encode({
+            "id": f"attr-{i}",
+            "name": name,
+            "location": (addr or name)[:120],
+            "description": desc or f"{name} 관광명소입니다.",
+            "image": PLACEHOLDER_IMAGE,
+            "rating": 4.3,
+            "reviewCount": 0,
+            "price": price,
+            "parkingCount": parking_count,
+        })) if name else None
+        for i, name, addr, desc, price, parking_count in zip(
+            df.index.tolist(), df["관광지명"].tolist(), df["_addr"].tolist(), df["관광지소개"].tolist(),
+            df["가격"].tolist(), df["주차가능수"].tolist(),
+        )
+    ]
+
+
+@dataclass
+class AttractionItems:
+    """관광지 전체 항목 (로드 시 전체 행을 JSON 조각 + 컬럼 배열로 만들어 둠), 위치 = 파일 순서"""
+    items: List[Item]
+    row_ids: np.ndarray     # 위치 → 원본 행 번호
+    prices: np.ndarray
+    has_name: np.ndarray    # 위치별 이름 있음 (bool)
+    named: np.ndarray       # 이름 있는 항목 위치
+    sort_index: paging.SortIndex
+
+    def __post_init__(self):
+        self._order = np.argsort(self.row_ids, kind="stable")
+
+    def positions(self, ids) -> np.ndarray:
+        """검색 결과 원본 행 번호 → 위치"""
+        ids = np.asarray(ids, dtype=np.int64)
+        return self._order[np.searchsorted(self.row_ids, ids, sorter=self._order)]
+
+    def mask(self, positions: np.ndarray, max_price: Optional[int]) -> np.ndarray:
+        """조건 전부를 한 마스크로 (이름 있음 + max_price 이하)"""
+        keep = self.has_name[positions]
+        if max_price is not None:
+            keep &= self.prices[positions] <= max_price
+        return positions[keep]
+
+    def bodies(self, positions: np.ndarray) -> List[bytes]:
+        items = self.items
+        return [items[p][1] for p in positions.tolist()]
+
+
+def _load_items(attractions) -> AttractionItems:
+    df = attractions.search(None, len(attractions))
+    items = _items(df)
+    prices = df["가격"].to_numpy(dtype=np.int64)
+    has_name = np.array([it is not None for it in items], dtype=bool)
+    lat, lng = geo.frame_coordinates(df)
+    # rating/reviewCount 는 모든 관광지가 같은 값 → 정렬하면 파일 순서
+    return AttractionItems(
+        items=items,
+        row_ids=np.asarray(df.index, dtype=np.int64),
+        prices=prices,
+        has_name=has_name,
+        named=np.flatnonzero(has_name),
+        sort_index=paging.SortIndex(
+            {"price": prices, "rating": np.full(len(items), 4.3), "reviewCount": np.zeros(len(items))},
+            lat,
+            lng,
+        ),
+    )
+
+
+datasets.register("attraction_items", _load_items, depends_on=["attractions"])
+
+
+def _load_text(attractions) -> bm25.BM25Index:
+    # 위치 = attraction_items 와 같은 파일 순서
+    df = attractions.search(None, len(attractions))
+    index = bm25.BM25Index(
+        [df["관광지명"].tolist(), df["관광지소개"].tolist()], weights=[TEXT_NAME_WEIGHT, 1.0]
+    )
+    print(f"[ATTR] text index: {len(index):,} docs, {len(index.vocab):,} terms, {index.nbytes() / 1024 / 1024:.1f} MB")
+    return index
+
+
+datasets.register("attraction_text", _load_text, depends_on=["attractions"])
+
+
+def _select(attractions, items: AttractionItems, kw: str, max_price: Optional[int], limit: int) -> np.ndarray:
+    """
+    키워드에 맞는 관광지(파일 순서) 중 조건 마스크를 통과한 앞 limit개 위치
+    검색은 앞에서부터 필요한 만큼만: 마스크 뒤 limit 에 못 미치면 범위를 늘려 다시 (요청 비용 ∝ 결과 크기)
+    """
+    n = limit
+    while True:
+        positions = items.positions(attractions.search_ids(kw, n)) if kw else items.named[:n]
+        selected = items.mask(positions, max_price)[:limit]
+        if len(selected) >= limit or len(positions) < n:
+            return selected
+        n *= 4
+
+
+def _region_page(attractions, items: AttractionItems, key: str) -> pages.RegionPage:
+    # 가격 구간: 지역에 맞는 관광지 전체의 가격 (구간이 같으면 응답도 같음)
+    members = items.mask(items.positions(attractions.search_ids(key, len(attractions))), None)
+    return pages.RegionPage(
+        items.prices[members].tolist(),
+        lambda max_price, limit: items.bodies(_select(attractions, items, key, max_price, limit)),
+        pages.PAGE_LIMITS,
+    )
+
+
+def _load_pages(attractions, item_map) -> pages.RegionPages:
+    if len(attractions) == 0:
+        return pages.RegionPages()
+    return pages.build_pages(lambda key: _region_page(attractions, item_map, key))
+
+
+datasets.register("attraction_pages", _load_pages, depends_on=["attractions", "attraction_items"])
 
 
 @router.get("")
@@ -82,48 +252,69 @@ def list_attractions(
     city_keyword: Optional[str] = Query(None, description="지역 키워드 (예: 강릉, 마포구, 부산)"),
     max_price: Optional[int] = Query(None),
     limit: int = Query(80, ge=1, le=200),
+    sort: Optional[str] = Query(None, description="price | rating | reviewCount | distance"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    lat: Optional[float] = Query(None, description="sort=distance 기준 위도"),
+    lng: Optional[float] = Query(None, description="sort=distance 기준 경도"),
+    format: str = Query("json", pattern=fragments.FORMAT_PATTERN, description="json | ndjson (한 줄에 하나씩 스트리밍)"),
+    q: Optional[str] = Query(None, description="관광지명/소개 검색어 (예: 케이블카, 야경, 온천) — 관련도 순"),
 ):
-    _load_data()
-    results = []
-    if _attr_df is None or len(_attr_df) == 0:
-        return results
-
-    df = _attr_df.copy()
+    gen = datasets.current()
     kw = (city_keyword or "").strip()
+    q = (q or "").strip()
+
+    if sort or cursor:
+        return _paged(gen, kw, max_price, limit, sort, cursor, paging.origin_of(lat, lng), format, q)
+    if q:
+        return fragments.respond(gen.get("attraction_items").bodies(_ranked(gen, kw, q, max_price, limit)), format)
+
+    page = gen.get("attraction_pages").get(kw) if kw else None
+    if page is not None:
+        # 카탈로그 지역: 미리 만든 첫 페이지
+        return fragments.respond(page.get(max_price, limit), format)
+
+    attractions = gen.get("attractions")
+    if len(attractions) == 0:
+        return fragments.respond([], format)
+    items = gen.get("attraction_items")
+    return fragments.respond(items.bodies(_select(attractions, items, kw, max_price, limit)), format)
+
+
+def _keyword_filter(gen, items: AttractionItems, kw: str) -> np.ndarray:
+    """city_keyword 에 맞는 위치별 bool"""
+    attractions = gen.get("attractions")
+    allowed = np.zeros(len(items.items), dtype=bool)
+    allowed[items.positions(attractions.search_ids(kw, len(attractions)))] = True
+    return allowed
+
+
+def _ranked(gen, kw: str, q: str, max_price: Optional[int], limit: int) -> np.ndarray:
+    """q 관련도 상위 limit개 위치 (city_keyword/이름/max_price 조건은 순위 매기기 전에 마스크로)"""
+    items: AttractionItems = gen.get("attraction_items")
+    if len(items.items) == 0:
+        return np.empty(0, dtype=np.int64)
+    allowed = items.has_name.copy()
+    if max_price is not None:
+        allowed &= items.prices <= max_price
     if kw:
-        addr = (df["소재지도로명주소"].fillna("").astype(str) + " " + df["소재지지번주소"].fillna("").astype(str))
-        df = df[addr.str.contains(kw, na=False, case=False)]
-
-    for i, row in df.head(limit).iterrows():
-        name = str(row.get("관광지명", "") or "").strip()
-        if not name:
-            continue
-        addr1 = str(row.get("소재지도로명주소", "") or "").strip()
-        addr2 = str(row.get("소재지지번주소", "") or "").strip()
-        location = (addr1 + " " + addr2).strip() or name
-        desc = str(row.get("관광지소개", "") or "").strip() or f"{name} 관광명소입니다."
-        parking_count = row.get("주차가능수", 0)
-        try:
-            parking_count = int(float(parking_count)) if pd.notna(parking_count) and str(parking_count).strip() else 0
-        except (ValueError, TypeError):
-            parking_count = 0
-        phone = str(row.get("관리기관전화번호", "") or "").strip()
-        try:
-            price = int(float(row.get("가격", DEFAULT_PRICE) or 0)) if pd.notna(row.get("가격")) else DEFAULT_PRICE
-        except (ValueError, TypeError):
-            price = DEFAULT_PRICE
-        if max_price is not None and price > max_price:
-            continue
-        results.append({
-            "id": f"attr-{i}",
-            "name": name,
-            "location": location[:120],
-            "description": desc,
-            "image": PLACEHOLDER_IMAGE,
-            "rating": 4.3,
-            "reviewCount": 0,
-            "price": price,
-            "parkingCount": parking_count,
-        })
+        allowed &= _keyword_filter(gen, items, kw)
+    positions, _ = gen.get("attraction_text").search(q, limit, allowed)
+    return positions
+
 
-    return results[:limit]
+def _paged(gen, kw: str, max_price: Optional[int], limit: int, sort: Optional[str], cursor: Optional[str],
+           origin, format: str = "json", q: str = ""):
+    """정렬 + 커서 페이지: 키워드(+ q 검색어)에 맞는 관광지 전체(max_price 이하) 중 한 페이지"""
+    items: AttractionItems = gen.get("attraction_items")
+    members = items.named
+    if kw and len(items.items) > 0:
+        attractions = gen.get("attractions")
+        members = items.positions(attractions.search_ids(kw, len(attractions)))
+    if q and len(items.items) > 0:
+        # 정렬 요청이면 관련도 대신 정렬 기준 — q 는 용어가 하나라도 있는 관광지로 좁히기만
+        matched = np.zeros(len(items.items), dtype=bool)
+        matched[gen.get("attraction_text").scores(q)[0]] = True
+        members = members[matched[members]]
+    members = items.mask(members, max_price)
+    slots, headers, _ = paging.request_page(items.sort_index, sort, cursor, members, limit, origin)
+    return fragments.respond((items.items[p][1] for p in slots.tolist()), format, headers)
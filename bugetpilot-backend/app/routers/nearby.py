@@ -0,0 +1,135 @@
+# app/routers/nearby.py
+# 좌표 기준 주변 검색 API (숙소 + 식당/카페 + 관광지)
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse
+
+from app import datasets, fragments, geo, regions, spatial
+from app.lazy import lazy_import
+from app.routers import attractions, restaurants, rooms
+
+np = lazy_import("numpy")
+
+router = APIRouter(prefix="/nearby", tags=["nearby"])
+
+TYPES = ("room", "restaurant", "cafe", "attraction")
+MAX_RADIUS_KM = 50.0
+# 응답 조각 앞부분 ("kind" 다음에 "distance_km", 그 뒤는 각 목록 API 항목과 같은 필드)
+# (식당 항목에 이미 "type"(업태) 필드가 있어서 종류는 "kind")
+_KIND_PREFIX = [b'{"kind":' + fragments.encode(t) + b',"distance_km":' for t in TYPES]
+ROOM, RESTAURANT, CAFE, ATTRACTION = range(len(TYPES))
+
+
+@dataclass
+class NearbyCatalog:
+    """모든 POI 좌표를 한 격자 인덱스에 (점 번호 → 종류 + 원래 목록 안 위치)"""
+    grid: spatial.GridIndex
+    kinds: np.ndarray     # 점마다 TYPES 번호
+    slots: np.ndarray     # 점마다 rooms store / restaurant_items / attraction_items 안 위치
+    rooms: rooms.RoomCatalog
+    restaurants: restaurants.RestaurantItems
+    attractions: attractions.AttractionItems
+    # 지역 샤딩 시 담당 지역 점들의 (최소 위도, 최대 위도, 최소 경도, 최대 경도), None = 샤딩 안 함
+    extent: Optional[Tuple[float, float, float, float]] = None
+
+
+def _load_nearby(room_catalog, restaurant_items, attraction_items) -> NearbyCatalog:
+    lats, lngs, kinds, slots = [], [], [], []
+
+    def add(index, kind, positions):
+        lats.append(index.lat[positions] if index.lat is not None else np.full(len(positions), np.nan))
+        lngs.append(index.lng[positions] if index.lng is not None else np.full(len(positions), np.nan))
+        kinds.append(np.full(len(positions), kind, dtype=np.int8))
+        slots.append(positions)
+
+    add(room_catalog.sort_index, ROOM, np.arange(room_catalog.sort_index.size, dtype=np.int64))
+    # 식당/카페: 통합 POI 대표 행만 (목록 API 와 같은 규칙), 카페 데이터에도 있는 POI 는 cafe
+    pois = restaurant_items.pois
+    cafe = (restaurant_items.sources[restaurant_items.poi_codes[pois]] & restaurants.SOURCE_CAFE) > 0
+    add(restaurant_items.sort_index, RESTAURANT, pois[~cafe])
+    add(restaurant_items.sort_index, CAFE, pois[cafe])
+    add(attraction_items.sort_index, ATTRACTION, attraction_items.named)
+
+    grid = spatial.GridIndex(np.concatenate(lats), np.concatenate(lngs))
+    catalog = NearbyCatalog(
+        grid=grid,
+        kinds=np.concatenate(kinds),
+        slots=np.concatenate(slots),
+        rooms=room_catalog,
+        restaurants=restaurant_items,
+        attractions=attraction_items,
+        extent=_extent(grid) if regions.served_regions() is not None else None,
+    )
+    counts = np.bincount(catalog.kinds[catalog.grid.positions], minlength=len(TYPES))
+    print("[NEARBY] points:", dict(zip(TYPES, counts.tolist())), "extent:", catalog.extent)
+    return catalog
+
+
+def _extent(grid: spatial.GridIndex) -> Tuple[float, float, float, float]:
+    # 샤딩하면 목록 데이터셋이 담당 지역 행만 올리므로 점 전체 범위 = 담당 지역 범위 (점이 없으면 모두 밖)
+    if len(grid) == 0:
+        return (np.inf, -np.inf, np.inf, -np.inf)
+    return (float(grid.lat.min()), float(grid.lat.max()), float(grid.lng.min()), float(grid.lng.max()))
+
+
+def _outside(extent: Tuple[float, float, float, float], lat: float, lng: float, radius_km: float) -> bool:
+    """반경 원이 담당 지역 범위(반경만큼 넓힌 위경도 사각형)에 전혀 안 걸치는지"""
+    lat_min, lat_max, lng_min, lng_max = extent
+    dlat = radius_km / geo.KM_PER_DEG
+    dlng = dlat / max(float(np.cos(np.radians(min(abs(lat), 89.0)))), 1e-6)
+    return not (lat_min - dlat <= lat <= lat_max + dlat and lng_min - dlng <= lng <= lng_max + dlng)
+
+
+datasets.register("nearby", _load_nearby, depends_on=["rooms", "restaurant_items", "attraction_items"])
+
+
+def _parse_types(types: Optional[str]) -> List[int]:
+    if not types:
+        return list(range(len(TYPES)))
+    names = [t.strip() for t in types.split(",") if t.strip()]
+    unknown = [t for t in names if t not in TYPES]
+    if unknown or not names:
+        raise HTTPException(status_code=400, detail=f"types must be a comma separated subset of {', '.join(TYPES)}")
+    return sorted({TYPES.index(t) for t in names})
+
+
+def _rows(catalog: NearbyCatalog, points: np.ndarray, dist: np.ndarray) -> Iterator[bytes]:
+    """점 → {"kind", "distance_km", ...목록 API 항목} 조각 (식당/카페 id 는 /restaurants 처럼 응답 안 순번)"""
+    restaurant_n = 0
+    for kind, slot, d in zip(catalog.kinds[points].tolist(), catalog.slots[points].tolist(), dist.tolist()):
+        if kind == ROOM:
+            body = catalog.rooms.heads[slot] + catalog.rooms.tails[1][slot]
+        elif kind == ATTRACTION:
+            body = catalog.attractions.items[slot][1]
+        else:
+            body = fragments.with_id(catalog.restaurants.items[slot][2], f"rest-{restaurant_n}")
+            restaurant_n += 1
+        yield _KIND_PREFIX[kind] + fragments.encode(round(d, 3)) + b"," + body[1:]
+
+
+@router.get("")
+@router.get("/")
+def list_nearby(
+    lat: float = Query(..., ge=-90, le=90, description="기준 위도"),
+    lng: float = Query(..., ge=-180, le=180, description="기준 경도"),
+    radius_km: float = Query(2.0, gt=0, le=MAX_RADIUS_KM),
+    types: Optional[str] = Query(None, description="room,restaurant,cafe,attraction 중 쉼표 구분 (없으면 전체)"),
+    limit: int = Query(100, ge=1, le=500),
+    format: str = Query("json", pattern=fragments.FORMAT_PATTERN, description="json | ndjson (한 줄에 하나씩 스트리밍)"),
+):
+    kinds = _parse_types(types)
+    catalog: NearbyCatalog = datasets.get("nearby")
+    if catalog.extent is not None and _outside(catalog.extent, lat, lng, radius_km):
+        # 다른 노드 담당 지역 좌표 → 빈 목록 대신 목록 API 와 같은 421
+        return JSONResponse(regions.unserved_body(f"{lat},{lng}"), status_code=421)
+
+    # 격자 인덱스로 반경 안 점 (가까운 순) → 종류 필터 → limit
+    points, dist = catalog.grid.within(lat, lng, radius_km)
+    if len(kinds) < len(TYPES):
+        keep = np.isin(catalog.kinds[points], kinds)
+        points, dist = points[keep], dist[keep]
+    return fragments.respond(_rows(catalog, points[:limit], dist[:limit]), format)
@@ -1,11 +1,21 @@
 # app/routers/restaurants.py
 # 식당(식품_일반음식점) + 카페(전국카페표준데이터) CSV 기반 API
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
-import pandas as pd
 from fastapi import APIRouter, Query
 
+from app import address, csv_loader, datasets, fragments, fuzzy, geo, pages, paging, projection, regions, snapshot, storage
+from app.csv_loader import text_column
+from app.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
 router = APIRouter(prefix="/restaurants", tags=["restaurants"])
 
 # 경로 기준
@@ -34,14 +44,18 @@ CAFE_CANDIDATES = [
     (BACKEND_ROOT / "data" / CAFE_NAME),
 ]
 
-_restaurants_df = None  # 식당 DF
-_cafes_df = None        # 카페 DF
-
 DEFAULT_PRICE_REST = 12000
 DEFAULT_PRICE_CAFE = 8000
 PLACEHOLDER_IMAGE_REST = "https://images.unsplash.com/photo-1517248135467-4c7edcad34c4?w=800"
 PLACEHOLDER_IMAGE_CAFE = "https://images.unsplash.com/photo-1501339847302-ac426a4a7cbb?w=800"
 
+# 전국 식품_일반음식점(수백만 행) 적재 방식: auto(큰 파일이면 stream) | stream | full
+# stream: 청크 단위로 읽으며 여행 지역(app/regions.py) + 영업 중인 행만 남김
+REST_INGEST = os.getenv("RESTAURANT_INGEST", "auto").strip().lower()
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+STREAM_CHUNK_ROWS = int(os.getenv("RESTAURANT_CHUNK_ROWS", "100000"))
+REST_OPEN_STATUS = os.getenv("RESTAURANT_OPEN_STATUS", "영업/정상").strip()
+
 
 def _pick_existing_path(candidates: list[Path]) -> Optional[Path]:
     for p in candidates:
@@ -50,97 +64,452 @@ def _pick_existing_path(candidates: list[Path]) -> Optional[Path]:
     return None
 
 
-def _read_csv_robust(path: Path, usecols: list[str]) -> pd.DataFrame:
+# 필요한 컬럼만, dtype 명시해서 파싱 (반복 값 컬럼은 category, 주소는 compact string)
+REST_COLS = ["사업장명", "도로명주소", "지번주소", "업태구분명"]
+REST_TM_COLS = ["좌표정보(x)", "좌표정보(y)"]  # 중부원점 TM (없어도 됨 → 좌표 없음)
+REST_OUT_COLS = ["사업장명", "_addr", "업태구분명", "위도", "경도"]
+REST_DTYPES = {
+    "사업장명": csv_loader.COMPACT_STR,
+    "도로명주소": csv_loader.COMPACT_STR,
+    "지번주소": csv_loader.COMPACT_STR,
+    "업태구분명": csv_loader.CATEGORY,
+}
+CAFE_COLS = ["사업장명", "시도명", "시군구명", "소재지도로명주소"]
+CAFE_OUT_COLS = ["사업장명", "_addr", "위도", "경도"]
+CAFE_DTYPES = {
+    "사업장명": csv_loader.COMPACT_STR,
+    "시도명": csv_loader.CATEGORY,
+    "시군구명": csv_loader.CATEGORY,
+    "소재지도로명주소": csv_loader.COMPACT_STR,
+}
+
+
+def _read_csv_robust(path: Path, usecols: list[str], dtypes: dict, required: Optional[list[str]] = None) -> pd.DataFrame:
     """
-    인코딩/컬럼 공백/열 이름 mismatch 방지.
-    - utf-8, utf-8-sig, cp949, euc-kr 순으로 시도
-    - columns strip
-    - usecols가 안 맞으면 전체 로드 후 필요한 컬럼만 고름
+    인코딩 판별 후 필요한 컬럼만 로드.
+    usecols가 안 맞으면(required 컬럼 누락/파싱 실패) 빈 DF 반환 → 상위에서 처리
     """
-    encodings = ["utf-8", "utf-8-sig", "cp949", "euc-kr"]
-
-    last_err = None
-    for enc in encodings:
-        try:
-            df = pd.read_csv(path, encoding=enc, low_memory=False)
-            df.columns = df.columns.astype(str).str.strip()
-
-            # 필요한 컬럼이 있는지 확인 후 선택
-            missing = [c for c in usecols if c not in df.columns]
-            if missing:
-                # usecols mismatch면 그냥 빈 DF 반환 (상위에서 처리)
-                return pd.DataFrame(columns=usecols)
-
-            return df[usecols].copy()
-        except Exception as e:
-            last_err = e
-
-    # 여기까지 오면 실패 → 빈 DF
-    return pd.DataFrame(columns=usecols)
-
-
-def _load_data():
-    global _restaurants_df, _cafes_df
-    if _restaurants_df is not None and _cafes_df is not None:
-        return
-
-    # -------------------------
-    # 식당 로드
-    # -------------------------
+    df = csv_loader.read_columns(path, usecols, dtypes=dtypes, required=required)
+    if df is None:
+        return pd.DataFrame(columns=usecols)
+    return df
+
+
+def _tm_to_wgs84(df_rest: pd.DataFrame):
+    """좌표정보(x)/(y) (중부원점 TM) → WGS84 위도/경도 배열 (청크 전체를 한 번에, 컬럼 없거나 빈 값이면 NaN)"""
+    if not all(c in df_rest.columns for c in REST_TM_COLS):
+        nan = np.full(len(df_rest), np.nan)
+        return nan, nan
+    x = pd.to_numeric(df_rest["좌표정보(x)"], errors="coerce").to_numpy(dtype=np.float64)
+    y = pd.to_numeric(df_rest["좌표정보(y)"], errors="coerce").to_numpy(dtype=np.float64)
+    # 빈 값/(0, 0) 은 좌표 없음 (원점 38°N 남쪽인 제주는 y 가 음수라 부호로는 거르지 않음)
+    missing = (x == 0) & (y == 0)
+    return geo.clean(*projection.to_wgs84(np.where(missing, np.nan, x), y))
+
+
+def _restaurant_frame(df_rest: pd.DataFrame) -> pd.DataFrame:
+    """원본 컬럼 → 런타임 컬럼 (사업장명, _addr, 업태구분명, 위도, 경도)"""
+    df_rest = df_rest.dropna(subset=["사업장명"])
+    lat, lng = _tm_to_wgs84(df_rest)
+    df_rest = df_rest.assign(
+        _addr=(
+            text_column(df_rest["도로명주소"])
+            + " "
+            + text_column(df_rest["지번주소"])
+        ).str.strip().astype(csv_loader.COMPACT_STR),
+        위도=lat,
+        경도=lng,
+    )
+    return df_rest[REST_OUT_COLS].copy()
+
+
+def _open_rows(df_rest: pd.DataFrame) -> pd.DataFrame:
+    """영업 중인 행만 (영업상태명 컬럼이 없으면 그대로)"""
+    if REST_OPEN_STATUS and "영업상태명" in df_rest.columns:
+        return df_rest[df_rest["영업상태명"] == REST_OPEN_STATUS]
+    return df_rest
+
+
+def _travel_rows(df: pd.DataFrame, names) -> pd.DataFrame:
+    """여행 지역(샤딩 중이면 담당 지역) 주소 행만 — 주소를 행정구역 코드로 파싱해서 비교"""
+    return df[regions.region_mask(address.parse(df["_addr"]), names)]
+
+
+def _use_stream(path: Path) -> bool:
+    if REST_INGEST == "stream":
+        return True
+    if REST_INGEST == "full":
+        return False
+    return path.stat().st_size >= STREAM_THRESHOLD_BYTES
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux: kB
+
+
+def _stream_restaurants(path: Path) -> pd.DataFrame:
+    """
+    전국 단위 파일용: 청크로 읽으면서 여행 지역 + 영업중인 행만 남김 → 최대 메모리 = 청크 + 남긴 행
+    """
+    # 청크마다 category 값 집합이 달라 concat 시 object로 풀리므로 마지막에 category로 변환
+    dtypes = {**REST_DTYPES, "업태구분명": csv_loader.COMPACT_STR, "영업상태명": csv_loader.COMPACT_STR}
+    chunks = csv_loader.iter_columns(
+        path, REST_COLS + ["영업상태명"] + REST_TM_COLS, STREAM_CHUNK_ROWS, dtypes=dtypes, required=REST_COLS
+    )
+    if chunks is None:
+        return pd.DataFrame(columns=REST_OUT_COLS)
+
+    names = regions.served_regions() or regions.configured_regions()
+    scanned = 0
+    kept: List[pd.DataFrame] = []
+    for chunk in chunks:
+        scanned += len(chunk)
+        kept.append(_travel_rows(_restaurant_frame(_open_rows(chunk)), names))
+
+    df = pd.concat(kept) if kept else pd.DataFrame(columns=REST_OUT_COLS)
+    df["업태구분명"] = df["업태구분명"].astype(csv_loader.CATEGORY)
+    peak = _peak_rss_mb()
+    print(
+        f"[REST] stream ingest: scanned {scanned:,} rows, kept {len(df):,}"
+        + (f", peak RSS {peak:.0f} MB" if peak is not None else "")
+    )
+    return df
+
+
+def build_restaurant_tables() -> Tuple[Dict[str, pd.DataFrame], List[Path]]:
+    """식당 CSV → 런타임 테이블 (스냅샷 compile 과 CSV fallback 공용)"""
     rest_path = _pick_existing_path(REST_CANDIDATES)
     print("[REST] candidates:", [str(p) for p in REST_CANDIDATES])
     print("[REST] chosen:", str(rest_path) if rest_path else None)
 
     if not rest_path:
-        _restaurants_df = pd.DataFrame(columns=["사업장명", "_addr", "업태구분명"])
+        return {"restaurants": pd.DataFrame(columns=REST_OUT_COLS)}, []
+
+    if _use_stream(rest_path):
+        return {"restaurants": _stream_restaurants(rest_path)}, [rest_path]
+
+    # stream 과 같은 행 필터 (영업 중 + 여행 지역) → 적재 방식은 메모리 사용량만 바꾸고 결과는 같음
+    df_rest = _read_csv_robust(
+        rest_path, usecols=REST_COLS + ["영업상태명"] + REST_TM_COLS,
+        dtypes={**REST_DTYPES, "영업상태명": csv_loader.CATEGORY}, required=REST_COLS,
+    )
+
+    if len(df_rest) == 0:
+        df = pd.DataFrame(columns=REST_OUT_COLS)
     else:
-        df_rest = _read_csv_robust(
-            rest_path,
-            usecols=["사업장명", "도로명주소", "지번주소", "업태구분명"],
-        )
+        names = regions.served_regions() or regions.configured_regions()
+        df = _travel_rows(_restaurant_frame(_open_rows(df_rest)), names)
+    print(f"[REST] full ingest: read {len(df_rest):,} rows, kept {len(df):,}")
+    return {"restaurants": df}, [rest_path]
 
-        if len(df_rest) == 0:
-            _restaurants_df = pd.DataFrame(columns=["사업장명", "_addr", "업태구분명"])
-        else:
-            df_rest = df_rest.dropna(subset=["사업장명"])
-            df_rest["_addr"] = (
-                df_rest["도로명주소"].fillna("").astype(str).str.strip()
-                + " "
-                + df_rest["지번주소"].fillna("").astype(str).str.strip()
-            ).str.strip()
-            _restaurants_df = df_rest[["사업장명", "_addr", "업태구분명"]].copy()
-
-    print("[REST] rows:", 0 if _restaurants_df is None else len(_restaurants_df))
-
-    # -------------------------
-    # 카페 로드
-    # -------------------------
+
+def build_cafe_tables() -> Tuple[Dict[str, pd.DataFrame], List[Path]]:
+    """카페 CSV → 런타임 테이블"""
     cafe_path = _pick_existing_path(CAFE_CANDIDATES)
     print("[CAFE] candidates:", [str(p) for p in CAFE_CANDIDATES])
     print("[CAFE] chosen:", str(cafe_path) if cafe_path else None)
 
     if not cafe_path:
-        _cafes_df = pd.DataFrame(columns=["사업장명", "_addr"])
+        return {"cafes": pd.DataFrame(columns=CAFE_OUT_COLS)}, []
+
+    # 위도/경도는 없어도 됨 (주변 검색/거리 정렬에서 빠짐)
+    df_cafe = csv_loader.read_columns(cafe_path, CAFE_COLS + ["위도", "경도"], dtypes=CAFE_DTYPES, required=CAFE_COLS)
+
+    if df_cafe is None or len(df_cafe) == 0:
+        df = pd.DataFrame(columns=CAFE_OUT_COLS)
     else:
-        df_cafe = _read_csv_robust(
-            cafe_path,
-            usecols=["사업장명", "시도명", "시군구명", "소재지도로명주소"],
+        df_cafe = df_cafe.dropna(subset=["사업장명"])
+        df_cafe["_addr"] = (
+            text_column(df_cafe["시도명"])
+            + " "
+            + text_column(df_cafe["시군구명"])
+            + " "
+            + text_column(df_cafe["소재지도로명주소"])
+        ).str.strip().astype(csv_loader.COMPACT_STR)
+        for col in ("위도", "경도"):
+            df_cafe[col] = pd.to_numeric(df_cafe[col], errors="coerce") if col in df_cafe.columns else np.nan
+        df = df_cafe[CAFE_OUT_COLS].copy()
+    return {"cafes": df}, [cafe_path]
+
+
+def _load_restaurants():
+    # 스냅샷(python -m app.snapshot compile) 우선, 없으면 CSV 파싱
+    tables = snapshot.load_dataset("restaurants") or build_restaurant_tables()[0]
+    df = regions.shard_filter(tables["restaurants"], "_addr")
+    print("[REST] rows:", len(df))
+    return storage.make_table("restaurants", df, "_addr")
+
+
+def _load_cafes():
+    tables = snapshot.load_dataset("cafes") or build_cafe_tables()[0]
+    df = regions.shard_filter(tables["cafes"], "_addr")
+    print("[CAFE] rows:", len(df))
+    return storage.make_table("cafes", df, "_addr")
+
+
+datasets.register("restaurants", _load_restaurants)
+datasets.register("cafes", _load_cafes)
+
+
+# (이름, 가격, id 뺀 응답 항목 JSON 조각) — 이름이 비면 None (행 자리는 유지)
+Item = Optional[Tuple[str, int, bytes]]
+
+
+def _item(name: str, addr: str, type_label: str, base_price: int, image: str, idx: int) -> Item:
+    if not name:
+        return None
+    name = name.strip()
+    if not name:
+        return None
+    price = base_price + (idx % 5) * 2000
+    addr = (addr or "").strip()
+    return name, price, fragments.encode({
+        "name": name,
+        "type": type_label,
+        "location": addr[:80],
+        "price": price,
+        "description": f"{type_label}입니다. {addr[:50]}",
+        "image": image,
+        "rating": _rating(idx),
+        "reviewCount": _review_count(idx),
+    })
+
+
+def _rating(idx: int) -> float:
+    return round(3.5 + (idx % 15) / 10, 1)
+
+
+def _review_count(idx: int) -> int:
+    return 50 + (idx % 200)
+
+
+def _column(df: pd.DataFrame, col: str, default) -> list:
+    # iterrows 의 row.get(col, default) 와 같은 값 (컬럼 단위로 한 번에)
+    return df[col].tolist() if col in df.columns else [default] * len(df)
+
+
+def _restaurant_items(df: pd.DataFrame) -> List[Item]:
+    return [
+        _item(
+            str(name),
+            str(addr),
+            str(kind or "식당"),
+            DEFAULT_PRICE_REST,
+            PLACEHOLDER_IMAGE_REST,
+            int(i),
         )
+        for i, name, addr, kind in zip(
+            df.index.tolist(), _column(df, "사업장명", ""), _column(df, "_addr", ""), _column(df, "업태구분명", "식당")
+        )
+    ]
+
+
+def _cafe_items(df: pd.DataFrame) -> List[Item]:
+    return [
+        _item(
+            str(name),
+            str(addr),
+            "카페",
+            DEFAULT_PRICE_CAFE,
+            PLACEHOLDER_IMAGE_CAFE,
+            int(i) + 10000,
+        )
+        for i, name, addr in zip(df.index.tolist(), _column(df, "사업장명", ""), _column(df, "_addr", ""))
+    ]
+
 
-        if len(df_cafe) == 0:
-            _cafes_df = pd.DataFrame(columns=["사업장명", "_addr"])
-        else:
-            df_cafe = df_cafe.dropna(subset=["사업장명"])
-            df_cafe["_addr"] = (
-                df_cafe["시도명"].fillna("").astype(str).str.strip()
-                + " "
-                + df_cafe["시군구명"].fillna("").astype(str).str.strip()
-                + " "
-                + df_cafe["소재지도로명주소"].fillna("").astype(str).str.strip()
-            ).str.strip()
-            _cafes_df = df_cafe[["사업장명", "_addr"]].copy()
+# 출처 (통합 POI 마다 비트 OR: 같은 가게가 식당/카페 데이터 양쪽에 있으면 3)
+SOURCE_RESTAURANT = 1
+SOURCE_CAFE = 2
 
-    print("[CAFE] rows:", 0 if _cafes_df is None else len(_cafes_df))
+
+@dataclass
+class RestaurantItems:
+    """
+    식당 + 카페 전체 항목 (로드 시 전체 행을 JSON 조각 + 컬럼 배열로 만들어 둠)
+    위치 = 식당 행(파일 순서) 다음 카페 행(파일 순서)
+    통합 POI: 정규화한 (상호명, 건물 주소) 가 같은 행들은 한 POI → 처음 나온 행이 대표
+    (로드 시 1번 계산, 요청에서는 대표 위치 마스크만)
+    """
+    items: List[Item]
+    row_ids: np.ndarray        # 위치 → 원본 행 번호 (식당 n_restaurants 개 다음 카페)
+    n_restaurants: int
+    name_codes: np.ndarray     # 위치 → 상호명 코드 (-1 = 이름 없음, 오타 허용 검색용)
+    names: List[str]           # 상호명 코드 → 상호명
+    poi_codes: np.ndarray      # 위치 → 통합 POI 번호 (-1 = 이름 없음)
+    primary: np.ndarray        # 위치별 bool: 통합 POI 의 대표 행
+    pois: np.ndarray           # 대표 행 위치 (POI 번호 순 = 위치 순)
+    sources: np.ndarray        # POI 번호 → 출처 비트 (SOURCE_RESTAURANT | SOURCE_CAFE)
+    prices: np.ndarray
+    sort_index: paging.SortIndex
+
+    def __post_init__(self):
+        # 원본 행 번호 → 위치 (정렬 순서 + searchsorted, dict 없이)
+        self._rest_order = np.argsort(self.row_ids[:self.n_restaurants], kind="stable")
+        self._cafe_order = np.argsort(self.row_ids[self.n_restaurants:], kind="stable")
+
+    def restaurant_positions(self, ids) -> np.ndarray:
+        """검색 결과 원본 행 번호 → 위치"""
+        ids = np.asarray(ids, dtype=np.int64)
+        rest = self.row_ids[:self.n_restaurants]
+        return self._rest_order[np.searchsorted(rest, ids, sorter=self._rest_order)]
+
+    def cafe_positions(self, ids) -> np.ndarray:
+        ids = np.asarray(ids, dtype=np.int64)
+        cafe = self.row_ids[self.n_restaurants:]
+        return self.n_restaurants + self._cafe_order[np.searchsorted(cafe, ids, sorter=self._cafe_order)]
+
+    def merged(self, positions: np.ndarray) -> np.ndarray:
+        """검색 결과 위치 → 통합 POI 대표 행만 (이름 없는 행, 중복 행 제외)"""
+        return positions[self.primary[positions]]
+
+    def select(self, members: np.ndarray, max_price: Optional[int], limit: int) -> np.ndarray:
+        """대표 행 위치들 → max_price 이하 앞 limit개 (가격 필터가 limit 보다 먼저)"""
+        if max_price is not None:
+            members = members[self.prices[members] <= max_price]
+        return members[:limit]
+
+    def bodies(self, positions: np.ndarray) -> List[bytes]:
+        items = self.items
+        return [items[p][2] for p in positions.tolist()]
+
+
+def _poi_codes(name_codes: np.ndarray, names: List[str], addrs: pd.Series, codes: pd.DataFrame) -> np.ndarray:
+    """
+    (상호명, 건물 주소) 정규화 키 → 통합 POI 번호 (처음 나온 순서, 이름 없으면 -1)
+    상호명: 소문자 + 공백/문장부호 제거 ("스타벅스 강남점" == "스타벅스강남점"), 고유 상호명만 정규화
+    주소: address.road_keys (식당 "도로명 지번" / 카페 "시도 시군구 도로명, 층" 형식 차이 흡수)
+    """
+    name_keys = pd.Series(names, dtype=object).str.lower().str.replace(r"[\W_]+", "", regex=True)
+    key_codes, key_names = pd.factorize(name_keys.where(name_keys != ""))
+    # 상호명 코드 → 정규화 상호명 코드 (-1 = 이름 없음 / 문장부호뿐)
+    by_row = np.where(name_codes >= 0, np.append(key_codes, -1)[name_codes], -1)
+    named = np.flatnonzero(by_row >= 0)
+    # 정규화 상호명이 한 번만 나오면 그대로 POI 1개 → 주소 키는 여러 번 나오는 상호명 행만
+    shared = np.bincount(by_row[named], minlength=len(key_names))[by_row[named]] > 1
+    addr_codes = np.zeros(len(named), dtype=np.int64)
+    if shared.any():
+        rows = named[shared]
+        addr_codes[shared] = 1 + pd.factorize(address.road_keys(addrs.iloc[rows], codes.iloc[rows]))[0]
+    # (정규화 상호명, 주소 키) 정수 쌍 → 이름 있는 행만 순서대로 묶으니 번호도 처음 나온 순서
+    poi_codes = np.full(len(name_codes), -1, dtype=np.int64)
+    poi_codes[named] = pd.factorize(by_row[named] * (int(addr_codes.max(initial=0)) + 1) + addr_codes)[0]
+    return poi_codes
+
+
+def _load_items(restaurants, cafes) -> RestaurantItems:
+    rest_df = restaurants.search(None, len(restaurants))
+    cafe_df = cafes.search(None, len(cafes))
+    rest_ids = np.asarray(rest_df.index, dtype=np.int64)
+    cafe_ids = np.asarray(cafe_df.index, dtype=np.int64)
+    items = _restaurant_items(rest_df) + _cafe_items(cafe_df)
+    # _item 에 넘긴 idx (카페는 +10000) → rating/reviewCount 정렬 값
+    idx = rest_ids.tolist() + (cafe_ids + 10000).tolist()
+    name_codes, names = pd.factorize(pd.Series([it[0] if it else None for it in items], dtype=object))
+    name_codes = np.asarray(name_codes, dtype=np.int64)
+
+    # 통합 POI: factorize 는 처음 나온 순서로 번호를 매기니 대표 행 = 앞 행들의 최대 번호보다 큰 번호
+    addrs = pd.Series(_column(rest_df, "_addr", "") + _column(cafe_df, "_addr", ""), dtype=object)
+    poi_codes = _poi_codes(name_codes, names.tolist(), addrs,
+                           pd.concat([restaurants.codes, cafes.codes], ignore_index=True))
+    seen_max = np.maximum.accumulate(np.concatenate([[-1], poi_codes[:-1]])) if len(poi_codes) else poi_codes
+    primary = poi_codes > seen_max
+    n_pois = int(primary.sum())
+    is_cafe = np.arange(len(items)) >= len(rest_ids)
+    sources = np.zeros(n_pois, dtype=np.uint8)
+    for mask, bit in ((~is_cafe, SOURCE_RESTAURANT), (is_cafe, SOURCE_CAFE)):
+        sources[np.bincount(poi_codes[mask & (poi_codes >= 0)], minlength=n_pois) > 0] |= bit
+    print(
+        f"[REST] merged POIs: {n_pois:,} from {len(items):,} rows "
+        f"(duplicates {int((poi_codes >= 0).sum()) - n_pois:,}, in both sources {int((sources == 3).sum()):,})"
+    )
+
+    prices = np.array([it[1] if it else 0 for it in items], dtype=np.int64)
+    # 좌표: 식당(로드 때 TM → WGS84 변환해 둔 위도/경도) 다음 카페 (예전 스냅샷처럼 컬럼이 없으면 NaN)
+    lat, lng = np.full(len(items), np.nan), np.full(len(items), np.nan)
+    for df, start in ((rest_df, 0), (cafe_df, len(rest_ids))):
+        df_lat, df_lng = geo.frame_coordinates(df)
+        if df_lat is not None:
+            lat[start:start + len(df)], lng[start:start + len(df)] = df_lat, df_lng
+    return RestaurantItems(
+        items=items,
+        row_ids=np.concatenate([rest_ids, cafe_ids]),
+        n_restaurants=len(rest_ids),
+        name_codes=name_codes,
+        names=names.tolist(),
+        poi_codes=poi_codes,
+        primary=primary,
+        pois=np.flatnonzero(primary),
+        sources=sources,
+        prices=prices,
+        sort_index=paging.SortIndex({
+            "price": prices,
+            "rating": [_rating(i) for i in idx],
+            "reviewCount": [_review_count(i) for i in idx],
+        }, lat, lng),
+    )
+
+
+datasets.register("restaurant_items", _load_items, depends_on=["restaurants", "cafes"])
+
+
+def _load_names(items: RestaurantItems) -> fuzzy.FuzzyIndex:
+    # 색인 위치 = 상호명 코드
+    index = fuzzy.FuzzyIndex(items.names)
+    print(f"[REST] name index: {len(index):,} names, {index.nbytes() / 1024 / 1024:.1f} MB")
+    return index
+
+
+datasets.register("restaurant_names", _load_names, depends_on=["restaurant_items"])
+
+
+def _matches(restaurants, cafes, items: RestaurantItems, kw: str, n: int) -> np.ndarray:
+    """키워드 검색 결과 앞 n개 위치 (식당 먼저, 모자라면 카페)"""
+    rest = items.restaurant_positions(restaurants.search_ids(kw, n)) if len(restaurants) > 0 else np.empty(0, np.int64)
+    if len(rest) >= n or len(cafes) == 0:
+        return rest
+    return np.concatenate([rest, items.cafe_positions(cafes.search_ids(kw, n - len(rest)))])
+
+
+def _select(restaurants, cafes, items: RestaurantItems, kw: Optional[str], max_price: Optional[int],
+            limit: int) -> np.ndarray:
+    """
+    식당 + 카페(파일 순서) 중 통합 POI 대표 행 → max_price 이하 → 앞 limit개 위치
+    키워드 검색은 앞에서부터 필요한 만큼만: 결과가 limit 에 못 미치면 검색 범위를 늘려 다시
+    (대표 행/가격 마스크는 행마다 독립이라 앞 구간 결과는 전체로 계산한 것의 앞부분과 같음)
+    """
+    if not kw:
+        return items.select(items.pois, max_price, limit)
+    n = limit
+    while True:
+        positions = _matches(restaurants, cafes, items, kw, n)
+        selected = items.select(items.merged(positions), max_price, limit)
+        if len(selected) >= limit or len(positions) < n:
+            return selected
+        n *= 4
+
+
+def _region_page(restaurants, cafes, items: RestaurantItems, levels, key: str) -> pages.RegionPage:
+    # 가격 구간은 전체 항목 가격 종류로 (파티션 가격의 상위 집합이라 구간이 같으면 응답도 같음)
+    return pages.RegionPage(
+        levels,
+        lambda max_price, limit: items.bodies(_select(restaurants, cafes, items, key, max_price, limit)),
+        pages.PAGE_LIMITS,
+    )
+
+
+def _load_pages(restaurants, cafes, items) -> pages.RegionPages:
+    levels = np.unique(items.prices).tolist()
+    region_pages = pages.build_pages(lambda key: _region_page(restaurants, cafes, items, levels, key))
+    print("[REST] region pages:", len(region_pages))
+    return region_pages
+
+
+datasets.register("restaurant_pages", _load_pages, depends_on=["restaurants", "cafes", "restaurant_items"])
 
 
 @router.get("")
@@ -149,66 +518,84 @@ def list_restaurants(
     city_keyword: Optional[str] = Query(None, description="지역 키워드 (예: 강릉, 마포구, 부산)"),
     max_price: Optional[int] = Query(None),
     limit: int = Query(50, ge=1, le=200),
+    sort: Optional[str] = Query(None, description="price | rating | reviewCount | distance"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    lat: Optional[float] = Query(None, description="sort=distance 기준 위도"),
+    lng: Optional[float] = Query(None, description="sort=distance 기준 경도"),
+    format: str = Query("json", pattern=fragments.FORMAT_PATTERN, description="json | ndjson (한 줄에 하나씩 스트리밍)"),
+    name: Optional[str] = Query(None, description="상호명 검색 (오타 허용, 가까운 순)"),
 ):
-    _load_data()
-    results = []
-    seen = set()
-
-    def add_row(name: str, addr: str, type_label: str, base_price: int, image: str, idx: int):
-        if not name:
-            return
-        name = name.strip()
-        if not name or name in seen:
-            return
-        seen.add(name)
-
-        price = base_price + (idx % 5) * 2000
-        if max_price is not None and price > max_price:
-            return
-
-        addr = (addr or "").strip()
-        results.append({
-            "id": f"rest-{len(results)}",
-            "name": name,
-            "type": type_label,
-            "location": addr[:80],
-            "price": price,
-            "description": f"{type_label}입니다. {addr[:50]}",
-            "image": image,
-            "rating": round(3.5 + (idx % 15) / 10, 1),
-            "reviewCount": 50 + (idx % 200),
-        })
-
+    gen = datasets.current()
     kw = city_keyword.strip() if city_keyword else None
+    name = name.strip() if name else None
+
+    if sort or cursor:
+        return _paged(gen, kw, max_price, limit, sort, cursor, paging.origin_of(lat, lng), format, name)
+    if name:
+        items = gen.get("restaurant_items")
+        results = items.bodies(_by_name(gen, items, kw, name, max_price, limit))
+        return fragments.respond((fragments.with_id(frag, f"rest-{i}") for i, frag in enumerate(results)), format)
+
+    page = gen.get("restaurant_pages").get(kw) if kw else None
+    if page is not None:
+        # 카탈로그 지역: 미리 만든 첫 페이지
+        results = page.get(max_price, limit)
+    else:
+        items = gen.get("restaurant_items")
+        results = items.bodies(_select(gen.get("restaurants"), gen.get("cafes"), items, kw, max_price, limit))
+
+    # id 는 응답 안 순번 → 조각 앞에 붙여서 바로 바이트 응답
+    return fragments.respond((fragments.with_id(frag, f"rest-{i}") for i, frag in enumerate(results)), format)
+
+
+def _members(gen, items: RestaurantItems, kw: Optional[str], max_price: Optional[int]) -> np.ndarray:
+    """키워드에 맞는 식당 + 카페 통합 POI 전체(max_price 이하) 대표 행 위치, 파일 순서"""
+    if kw:
+        restaurants, cafes = gen.get("restaurants"), gen.get("cafes")
+        members = items.merged(_matches(restaurants, cafes, items, kw, len(restaurants) + len(cafes)))
+    else:
+        members = items.pois
+    if max_price is not None:
+        members = members[items.prices[members] <= max_price]
+    return members
+
 
-    # 식당
-    if _restaurants_df is not None and len(_restaurants_df) > 0:
-        df = _restaurants_df
-        if kw:
-            df = df[df["_addr"].astype(str).str.contains(kw, na=False, case=False)]
-        for i, row in df.head(limit).iterrows():
-            add_row(
-                str(row.get("사업장명", "")),
-                str(row.get("_addr", "")),
-                str(row.get("업태구분명", "식당") or "식당"),
-                DEFAULT_PRICE_REST,
-                PLACEHOLDER_IMAGE_REST,
-                int(i),
-            )
-
-    # 카페
-    if _cafes_df is not None and len(_cafes_df) > 0 and len(results) < limit:
-        df = _cafes_df
-        if kw:
-            df = df[df["_addr"].astype(str).str.contains(kw, na=False, case=False)]
-        for i, row in df.head(limit - len(results)).iterrows():
-            add_row(
-                str(row.get("사업장명", "")),
-                str(row.get("_addr", "")),
-                "카페",
-                DEFAULT_PRICE_CAFE,
-                PLACEHOLDER_IMAGE_CAFE,
-                int(i) + 10000,
-            )
-
-    return results[:limit]
\ No newline at end of file
+def _by_name(gen, items: RestaurantItems, kw: Optional[str], name: str, max_price: Optional[int],
+             limit: int) -> np.ndarray:
+    """
+    상호명 오타 허용 검색 → 가까운 상호명 순, 같은 상호명(지점들)은 파일 순서로 앞 limit개 위치
+    (키워드/가격 조건은 조건에 맞는 POI 가 있는 상호명 마스크로 먼저)
+    """
+    index: fuzzy.FuzzyIndex = gen.get("restaurant_names")
+    members = _members(gen, items, kw, max_price)
+    member_codes = items.name_codes[members]
+    allowed = None
+    if kw or max_price is not None:
+        allowed = np.zeros(len(items.names), dtype=bool)
+        allowed[member_codes] = True
+    # 상호명 limit 개면 POI 는 limit 개 이상 (상호명마다 POI 1개 이상)
+    codes, _ = index.search(name, limit, allowed)
+    rank = np.full(len(items.names), len(codes), dtype=np.int64)
+    rank[codes] = np.arange(len(codes))
+    ranks = rank[member_codes]
+    hit = ranks < len(codes)
+    members, ranks = members[hit], ranks[hit]
+    return members[np.lexsort((members, ranks))][:limit]
+
+
+def _paged(gen, kw: Optional[str], max_price: Optional[int], limit: int, sort: Optional[str], cursor: Optional[str],
+           origin, format: str = "json", name: Optional[str] = None):
+    """
+    정렬 + 커서 페이지: 키워드에 맞는 식당 + 카페 통합 POI 전체(max_price 이하) 중 한 페이지
+    name 이 있으면 상호명이 가까운 것만 (순서는 정렬 기준)
+    id(rest-N)는 앞 페이지들에서 이어지는 번호
+    """
+    items: RestaurantItems = gen.get("restaurant_items")
+    members = _members(gen, items, kw, max_price)
+    if name:
+        close = np.zeros(len(items.names), dtype=bool)
+        close[gen.get("restaurant_names").search(name, len(items.names))[0]] = True
+        members = members[close[items.name_codes[members]]]
+    slots, headers, done = paging.request_page(items.sort_index, sort, cursor, members, limit, origin)
+    frags = (fragments.with_id(items.items[p][2], f"rest-{done + n}") for n, p in enumerate(slots.tolist()))
+    return fragments.respond(frags, format, headers)
@@ -1,14 +1,22 @@
 # app/routers/rooms.py
+from __future__ import annotations
+
 import os
 import re
+import sys
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-import pandas as pd
-import requests
 from fastapi import APIRouter, HTTPException, Query
 
-from app.models import Room, RoomImage, RoomWithImages
+from app import address, csv_loader, datasets, downloads, fragments, fuzzy, geo, ngram, pages, paging, regions, room_index, room_store, snapshot
+from app.lazy import lazy_import
+from app.models import Room, RoomWithImages
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
 
 router = APIRouter(prefix="/rooms", tags=["rooms"])
 
@@ -18,15 +26,32 @@ IMAGES_CSV = DATA_DIR / "dummy_room_images.csv"
 
 # 문화체육관광부 전국 호텔 현황 CSV 후보 경로들
 BACKEND_ROOT = Path(__file__).resolve().parent.parent.parent
-CULTURE_CSV = BACKEND_ROOT / "문화체육관광부_전국호텔현황_20230405.csv"
-CULTURE_CSV_IN_DATA = DATA_DIR / "문화체육관광부_전국호텔현황_20230405.csv"
-CULTURE_CSV_IN_APP_DATA = (
-    Path(__file__).resolve().parent.parent / "data" / "문화체육관광부_전국호텔현황_20230405.csv"
-)
+CULTURE_CSV_NAME = "문화체육관광부_전국호텔현황_20230405.csv"
+CULTURE_CSV = BACKEND_ROOT / CULTURE_CSV_NAME
+CULTURE_CSV_IN_DATA = DATA_DIR / CULTURE_CSV_NAME
+CULTURE_CSV_IN_APP_DATA = Path(__file__).resolve().parent.parent / "data" / CULTURE_CSV_NAME
+
+
+@dataclass
+class RoomCatalog:
+    """한 데이터셋 세대의 숙소 데이터"""
+    # 숙소/이미지 컬럼 저장소 (app/room_store.py), 아래 인덱스들의 위치 = store 위치
+    store: Optional[room_store.RoomStore] = None
+    # city_keyword 검색용: 행정구역 코드 + 주소/이름 n-gram 역색인
+    codes: Optional[pd.DataFrame] = None
+    search_index: Optional[ngram.NgramIndex] = None
+    # room_id → 위치, 가격/평점/지역 코드 정렬 인덱스 (app/room_index.py)
+    index: Optional[room_index.RoomIndex] = None
+    # sort=price|rating|reviewCount|distance 전역 순서 (app/paging.py)
+    sort_index: Optional[paging.SortIndex] = None
+    # 응답 JSON 조각 (store 위치별): 숙소 필드 부분 '{"room_id":...' (닫는 괄호 없음)
+    # + include_images 별 이미지 꼬리 ',"images":[...]}' (같은 URL 목록이면 같은 bytes 객체 공유)
+    heads: List[bytes] = field(default_factory=list)
+    tails: Dict[int, List[bytes]] = field(default_factory=dict)
+    tail_cache: Dict[Tuple[str, ...], bytes] = field(default_factory=dict)
+    # 카탈로그 지역 → 미리 만든 응답 (include_images 별)
+    region_pages: pages.RegionPages = field(default_factory=pages.RegionPages)
 
-_rooms: List[Room] = []
-_room_images: List[RoomImage] = []
-_room_image_map: Dict[int, List[str]] = {}
 
 STAR_DEFAULT_PRICE = {1: 35_000, 2: 55_000, 3: 80_000, 4: 120_000, 5: 180_000}
 STAR_IMAGES = {
@@ -111,32 +136,63 @@ def _is_git_lfs_pointer(path: Path) -> bool:
         return False
 
 
-def _download_to(path: Path, url: str) -> bool:
-    try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with requests.get(url, stream=True, timeout=30) as r:
-            r.raise_for_status()
-            with open(path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=1024 * 1024):
-                    if chunk:
-                        f.write(chunk)
-        return path.exists() and path.stat().st_size > 0
-    except Exception:
-        return False
+def _on_culture_downloaded(path: Path) -> None:
+    # 다운로드가 끝나면 dummy → 문화 데이터셋으로 세대 교체 (다른 reload 진행 중이면 잠시 대기)
+    # reload_in_background: pre-fork 워커면 마스터에 요청 → 마스터가 빌드 후 워커를 다시 fork
+    for _ in range(10):
+        if datasets.reload_in_background():
+            return
+        time.sleep(3)
 
 
-def _read_csv_robust(csv_path: Path) -> Optional[pd.DataFrame]:
-    encodings = ["utf-8", "utf-8-sig", "cp949", "euc-kr"]
-    for enc in encodings:
-        try:
-            df = pd.read_csv(csv_path, encoding=enc)
-            df.columns = df.columns.astype(str).str.strip()
-            return df
-        except Exception:
-            continue
+def _culture_available() -> bool:
+    """문화 CSV 를 쓸 수 있는지 (실제 로컬 파일이 있거나 CULTURE_CSV_URL 로 받을 수 있음) — 네트워크 없이"""
+    candidates = [CULTURE_CSV, CULTURE_CSV_IN_DATA, CULTURE_CSV_IN_APP_DATA]
+    if any(p.exists() and not _is_git_lfs_pointer(p) for p in candidates):
+        return True
+    return bool(os.getenv("CULTURE_CSV_URL", "").strip())
+
+
+def _load_snapshot() -> Optional[Dict[str, pd.DataFrame]]:
+    # 이미지 빌드 때 문화 CSV 없이(LFS 포인터, URL 없음) compile 한 스냅샷은 dummy 원본만 기록됨
+    # → 그 원본은 안 바뀌니 스냅샷이 계속 유효해서 다운로드가 시작도 안 되고, 끝나도 reload 가 같은 dummy 를 읽음
+    # → 문화 CSV 를 쓸 수 있으면 dummy 스냅샷은 오래된 것으로 보고 CSV 경로로 (다운로드 시작/완료 후 문화 데이터)
+    sources = snapshot.source_names("rooms")
+    if sources and CULTURE_CSV_NAME not in sources and _culture_available():
+        print("[ROOMS] snapshot was compiled from dummy rooms but the culture CSV is available, ignoring snapshot")
+        return None
+    return snapshot.load_dataset("rooms")
+
+
+def _culture_csv_path(wait_download: bool = False) -> Optional[Path]:
+    candidates = [CULTURE_CSV, CULTURE_CSV_IN_DATA, CULTURE_CSV_IN_APP_DATA]
+    csv_path = next((p for p in candidates if p.exists()), None)
+    if csv_path and not _is_git_lfs_pointer(csv_path):
+        return csv_path
+
+    # ✅ LFS 포인터거나 (배포에서) 파일이 아예 없으면 release URL에서 캐시 디렉터리로 받기
+    url = os.getenv("CULTURE_CSV_URL", "").strip()
+    if not url:
+        return None
+    dl = downloads.get(url, CULTURE_CSV_NAME, os.getenv("CULTURE_CSV_SHA256"))
+    if dl.cached():
+        return dl.dest
+
+    # 기동을 막지 않도록 백그라운드로 받고, 그동안은 dummy rooms로 서빙
+    dl.start(on_ready=None if wait_download else _on_culture_downloaded)
+    if wait_download and dl.wait():
+        return dl.dest
     return None
 
 
+CULTURE_COLS = ["호텔명", "지역", "주소", "결정 등급", "객실수"]
+
+
+def _read_csv_robust(csv_path: Path) -> Optional[pd.DataFrame]:
+    # 인코딩 판별 후 사용하는 컬럼만 파싱
+    return csv_loader.read_columns(csv_path, CULTURE_COLS, required=["호텔명", "지역"])
+
+
 def _pick_col(df: pd.DataFrame, candidates: List[str]) -> Optional[str]:
     """df.columns에서 후보 중 하나를 찾아 실제 컬럼명을 리턴(대소문자/strip 대응)"""
     cols_strip = {str(c).strip(): str(c) for c in df.columns}
@@ -171,38 +227,24 @@ def _to_float(v: Any, default: float = 0.0) -> float:
         return default
 
 
-def _load_culture_hotels() -> bool:
-    global _rooms, _room_images, _room_image_map
+ROOM_COLUMNS = list(Room.model_fields)
 
-    candidates = [CULTURE_CSV, CULTURE_CSV_IN_DATA, CULTURE_CSV_IN_APP_DATA]
-    csv_path = next((p for p in candidates if p.exists()), None)
-
-    # ✅ LFS 포인터면 release에서 다운받아서 tmp에 저장
-    url = os.getenv("CULTURE_CSV_URL", "").strip()
-    if csv_path and _is_git_lfs_pointer(csv_path) and url:
-        tmp_path = Path("/tmp") / csv_path.name
-        if _download_to(tmp_path, url):
-            csv_path = tmp_path
-
-    # ✅ 로컬에 파일이 아예 없으면 (배포에서) URL로만도 시도
-    if not csv_path and url:
-        tmp_path = Path("/tmp") / "문화체육관광부_전국호텔현황_20230405.csv"
-        if _download_to(tmp_path, url):
-            csv_path = tmp_path
 
+def _culture_room_tables(wait_download: bool = False) -> Optional[Tuple[pd.DataFrame, pd.DataFrame, List[Path]]]:
+    csv_path = _culture_csv_path(wait_download)
     if not csv_path or not csv_path.exists():
-        return False
+        return None
 
     df = _read_csv_robust(csv_path)
     if df is None:
-        return False
+        return None
 
     required = {"호텔명", "지역"}
     if not required.issubset(set(df.columns)):
-        return False
+        return None
 
-    _rooms = []
-    _room_image_map = {}
+    rooms: List[Dict[str, Any]] = []
+    images: List[Dict[str, Any]] = []
 
     for idx, row in df.iterrows():
         star = _star_from_grade(str(row.get("결정 등급", "3성")))
@@ -228,8 +270,8 @@ def _load_culture_hotels() -> bool:
         description = f"{region} {star}성급 호텔입니다. 객실 {room_count}개 보유."
         room_id = idx + 1
 
-        _rooms.append(
-            Room(
+        rooms.append(
+            dict(
                 room_id=room_id,
                 host_id=1,
                 title=title,
@@ -250,36 +292,30 @@ def _load_culture_hotels() -> bool:
                 review_count=room_count * 2 if room_count else 10,
             )
         )
+        for url_str in STAR_IMAGES.get(star, STAR_IMAGES[3]):
+            images.append({"room_id": room_id, "image_url": url_str})
+
+    if not rooms:
+        return None
+    return (
+        pd.DataFrame(rooms, columns=ROOM_COLUMNS),
+        pd.DataFrame(images, columns=["room_id", "image_url"]),
+        [csv_path],
+    )
 
-        _room_image_map[room_id] = STAR_IMAGES.get(star, STAR_IMAGES[3])[:]
-
-    _room_images = []
-    return len(_rooms) > 0
-
-
-def load_data():
-    global _rooms, _room_images, _room_image_map
 
-    # 1) 문화 CSV 우선
-    try:
-        if _load_culture_hotels():
-            return
-    except Exception:
-        pass
-
-    # 2) fallback: dummy rooms
+def _dummy_room_tables() -> Tuple[pd.DataFrame, pd.DataFrame, List[Path]]:
+    empty_images = pd.DataFrame(columns=["room_id", "image_url"])
     try:
         df_rooms = pd.read_csv(ROOMS_CSV)
         df_rooms.columns = df_rooms.columns.astype(str).str.strip()
     except Exception:
-        _rooms = []
-        _room_image_map = {}
-        return
+        return pd.DataFrame(columns=ROOM_COLUMNS), empty_images, []
 
     if "room_id" not in df_rooms.columns:
         df_rooms["room_id"] = df_rooms.index + 1
 
-    _rooms = []
+    rooms: List[Dict[str, Any]] = []
     for _, row in df_rooms.iterrows():
         room_data = {
             "bedroom_count": _to_int(row.get("bedroom_count", 0)),
@@ -292,8 +328,8 @@ def load_data():
 
         korean_description = generate_korean_description(room_data)
 
-        _rooms.append(
-            Room(
+        rooms.append(
+            dict(
                 room_id=_to_int(row.get("room_id")),
                 host_id=_to_int(row.get("host_id", 1), 1),
                 title=room_data["title"],
@@ -314,16 +350,14 @@ def load_data():
                 review_count=_to_int(row.get("review_count", 0)),
             )
         )
+    df_out = pd.DataFrame(rooms, columns=ROOM_COLUMNS)
 
-    # 3) dummy images (robust)
+    # dummy images (robust) — 없어도 rooms만으로 list_rooms는 작동해야 함
     try:
         df_images = pd.read_csv(IMAGES_CSV)
         df_images.columns = df_images.columns.astype(str).str.strip()
     except Exception:
-        _room_images = []
-        # rooms만 있어도 list_rooms는 작동해야 하니 map 빈 값으로
-        _room_image_map = {}
-        return
+        return df_out, empty_images, [ROOMS_CSV]
 
     room_id_col = _pick_col(df_images, ["room_id", "roomId", "ROOM_ID", "숙소ID", "숙소_id"])
     image_url_col = _pick_col(
@@ -332,12 +366,9 @@ def load_data():
     )
 
     if not room_id_col or not image_url_col:
-        _room_images = []
-        _room_image_map = {}
-        return
+        return df_out, empty_images, [ROOMS_CSV, IMAGES_CSV]
 
-    _room_images = []
-    image_map: Dict[int, List[str]] = {}
+    images: List[Dict[str, Any]] = []
     for _, row in df_images.iterrows():
         rid = row.get(room_id_col)
         url = row.get(image_url_col)
@@ -353,11 +384,137 @@ def load_data():
         if not url_str:
             continue
 
-        img = RoomImage(room_id=rid_int, image_url=url_str)
-        _room_images.append(img)
-        image_map.setdefault(rid_int, []).append(url_str)
+        images.append({"room_id": rid_int, "image_url": url_str})
+
+    return df_out, pd.DataFrame(images, columns=["room_id", "image_url"]), [ROOMS_CSV, IMAGES_CSV]
+
 
-    _room_image_map = image_map
+def build_room_tables(wait_download: bool = False) -> Tuple[Dict[str, pd.DataFrame], List[Path]]:
+    """숙소 테이블 생성 (스냅샷 compile 과 CSV fallback 공용)"""
+    # 1) 문화 CSV 우선 (다운로드 중이면 이번 세대는 dummy, 완료되면 reload)
+    culture = None
+    try:
+        culture = _culture_room_tables(wait_download)
+    except Exception:
+        pass
+
+    # 2) fallback: dummy rooms
+    df_rooms, df_images, sources = culture or _dummy_room_tables()
+    return {"rooms": df_rooms, "room_images": df_images}, sources
+
+
+def load_data() -> RoomCatalog:
+    # 스냅샷(python -m app.snapshot compile) 우선, 없으면 CSV 파싱
+    tables = _load_snapshot() or build_room_tables()[0]
+    # 샤딩 중이면 담당 지역 숙소와 그 이미지만
+    df_rooms = regions.shard_filter(tables["rooms"], "address")
+    df_images = tables["room_images"]
+    if len(df_rooms) < len(tables["rooms"]):
+        df_images = df_images[df_images["room_id"].isin(df_rooms["room_id"])]
+    return build_catalog(df_rooms, df_images)
+
+
+def build_catalog(df_rooms: pd.DataFrame, df_images: pd.DataFrame) -> RoomCatalog:
+    """숙소/이미지 테이블 → 저장소 + 검색/정렬 인덱스 + 응답 조각 (bench/room_store.py 가 전체 메모리를 잼)"""
+    catalog = RoomCatalog()
+    store = catalog.store = room_store.RoomStore(df_rooms, df_images)
+    addresses = store.strings("address")
+    catalog.codes = address.parse(addresses)
+    catalog.search_index = ngram.NgramIndex(addresses, store.strings("title"))
+    catalog.index = room_index.RoomIndex(
+        store.numeric("room_id"),
+        store.numeric("daily_price"),
+        store.numeric("rating_star_score"),
+        catalog.codes,
+    )
+    # 문화 데이터셋은 좌표가 없어서 (0, 0) → 좌표 없음(NaN)
+    lat, lng = geo.clean(store.numeric("lat"), store.numeric("lng"))
+    catalog.sort_index = paging.SortIndex(
+        {
+            "price": store.numeric("daily_price"),
+            "rating": store.numeric("rating_star_score"),
+            "reviewCount": store.numeric("review_count"),
+        },
+        lat,
+        lng,
+    )
+    catalog.heads = [fragments.encode(room)[:-1] for room in store.rows(range(len(store)))]
+    catalog.tails = {
+        n: [_images_tail(catalog, store.images(pos, n)) for pos in range(len(store))] for n in pages.PAGE_IMAGE_COUNTS
+    }
+    catalog.region_pages = pages.build_pages(lambda key: _region_page(catalog, key))
+    # 저장소만이 아니라 숙소마다 미리 만든 응답 조각도 같이 (조각이 저장소보다 큼)
+    print(f"[ROOMS] rooms: {len(store)}, store {store.nbytes / 1024:.0f} KB, "
+          f"fragments {fragment_bytes(catalog) / 1024:.0f} KB")
+    return catalog
+
+
+def fragment_bytes(catalog: RoomCatalog) -> int:
+    """숙소별 응답 조각(heads + include_images 별 tails 리스트 + 공유 꼬리 bytes) 크기, 파이썬 객체 오버헤드 포함"""
+    total = sys.getsizeof(catalog.heads) + sum(sys.getsizeof(h) for h in catalog.heads)
+    total += sum(sys.getsizeof(tails) for tails in catalog.tails.values())
+    total += sum(sys.getsizeof(t) for t in catalog.tail_cache.values())
+    return total
+
+
+def _images_tail(catalog: RoomCatalog, urls: List[str]) -> bytes:
+    key = tuple(urls)
+    tail = catalog.tail_cache.get(key)
+    if tail is None:
+        tail = catalog.tail_cache[key] = b',"images":' + fragments.encode(urls) + b"}"
+    return tail
+
+
+def _iter_with_images(catalog: RoomCatalog, positions: Iterable[int], include_images: Optional[int]) -> Iterator[bytes]:
+    """store 위치들 → RoomWithImages JSON 조각 (이미지는 include_images 개까지), 하나씩"""
+    count = include_images if include_images and include_images > 0 else 0
+    tails = catalog.tails.get(count)
+    if tails is not None:
+        return (catalog.heads[pos] + tails[pos] for pos in positions)
+    store = catalog.store
+    return (catalog.heads[pos] + _images_tail(catalog, store.images(pos, count)) for pos in positions)
+
+
+def _with_images(catalog: RoomCatalog, positions: List[int], include_images: Optional[int]) -> List[bytes]:
+    return list(_iter_with_images(catalog, positions, include_images))
+
+
+def _search(catalog: RoomCatalog, keyword: str) -> List[int]:
+    """행정구역 키워드면 주소 코드로, 아니면 주소/이름 부분 문자열로 → rooms 위치"""
+    ref = address.resolve(keyword)
+    if ref is not None:
+        return catalog.index.region(ref).tolist()
+    return catalog.search_index.search(keyword)
+
+
+def _region_page(catalog: RoomCatalog, key: str) -> pages.RegionPage:
+    partition = _search(catalog, key)
+    prices = catalog.store.numeric("daily_price")[partition].tolist()
+    built = {n: _with_images(catalog, partition, n) for n in pages.PAGE_IMAGE_COUNTS}
+
+    def select(max_price: Optional[int], include_images: Optional[int]) -> List[bytes]:
+        if include_images in built:
+            rows = built[include_images]
+        else:
+            rows = _with_images(catalog, partition, include_images)
+        return [r for r, price in zip(rows, prices) if max_price is None or price <= max_price]
+
+    return pages.RegionPage(prices, select, pages.PAGE_IMAGE_COUNTS)
+
+
+datasets.register("rooms", load_data)
+
+
+def _load_names(catalog: RoomCatalog) -> fuzzy.FuzzyIndex:
+    # 위치 = store 위치
+    index = fuzzy.FuzzyIndex(catalog.store.strings("title"))
+    print(f"[ROOMS] name index: {len(index):,} titles, {index.nbytes() / 1024:.0f} KB")
+    return index
+
+
+datasets.register("room_names", _load_names, depends_on=["rooms"])
+
+PAGE_SIZE = 50  # sort/cursor 요청에 limit 이 없을 때
 
 
 @router.get("", response_model=List[RoomWithImages])
@@ -367,40 +524,71 @@ def list_rooms(
     max_price: Optional[int] = Query(None),
     min_rating: Optional[float] = Query(None),
     include_images: Optional[int] = Query(1, ge=0, le=10, description="각 숙소별 포함할 이미지 수"),
+    sort: Optional[str] = Query(None, description="price | rating | reviewCount | distance (없으면 파일 순서)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    limit: Optional[int] = Query(None, ge=1, le=200, description="페이지 크기 (sort/cursor 를 주면 기본 50)"),
+    lat: Optional[float] = Query(None, description="sort=distance 기준 위도"),
+    lng: Optional[float] = Query(None, description="sort=distance 기준 경도"),
+    format: str = Query("json", pattern=fragments.FORMAT_PATTERN, description="json | ndjson (한 줄에 하나씩 스트리밍)"),
+    name: Optional[str] = Query(None, description="숙소명 검색 (오타 허용, 가까운 순, 기본 limit 50)"),
 ):
-    data = _rooms
-
-    if city_keyword:
-        key = city_keyword.lower()
-        data = [r for r in data if key in r.address.lower() or key in r.title.lower()]
-
-    if max_price is not None:
-        data = [r for r in data if r.daily_price <= max_price]
-
-    if min_rating is not None:
-        data = [r for r in data if r.rating_star_score >= min_rating]
-
-    result: List[RoomWithImages] = []
-    for room in data:
-        images = _room_image_map.get(room.room_id, [])
-        if include_images and include_images > 0:
-            images = images[: include_images]
-        else:
-            images = []
-        result.append(RoomWithImages(**room.dict(), images=images))
-
-    return result
+    gen = datasets.current()
+    catalog: RoomCatalog = gen.get("rooms")
+    name = name.strip() if name else None
+
+    if sort or cursor or (limit is not None and not name):
+        return _paged_rooms(gen, catalog, city_keyword, max_price, min_rating, include_images, sort, cursor,
+                            limit or PAGE_SIZE, paging.origin_of(lat, lng), format, name)
+    if name:
+        slots = _by_name(gen, catalog, city_keyword, name, max_price, min_rating, limit or PAGE_SIZE)
+        return fragments.respond(_iter_with_images(catalog, slots.tolist(), include_images), format)
+
+    page = catalog.region_pages.get(city_keyword) if city_keyword else None
+    if page is not None and min_rating is None:
+        # 카탈로그 지역: 미리 만든 응답
+        return fragments.respond(page.get(max_price, include_images), format)
+
+    # 키워드 검색 결과 ∩ 가격 구간 ∩ 평점 구간 (인덱스, 결과 크기에 비례)
+    positions = _search(catalog, city_keyword) if city_keyword else None
+    slots = catalog.index.filter(positions, max_price=max_price, min_rating=min_rating)
+    return fragments.respond(_iter_with_images(catalog, slots.tolist(), include_images), format)
+
+
+def _filtered(catalog: RoomCatalog, city_keyword, max_price, min_rating):
+    """키워드/가격/평점 조건에 맞는 위치 (조건이 없으면 None = 전체)"""
+    if not (city_keyword or max_price is not None or min_rating is not None):
+        return None
+    positions = _search(catalog, city_keyword) if city_keyword else None
+    return catalog.index.filter(positions, max_price=max_price, min_rating=min_rating)
+
+
+def _by_name(gen, catalog: RoomCatalog, city_keyword, name: str, max_price, min_rating, limit: int):
+    """숙소명 오타 허용 검색 → 가까운 순 위치 (다른 조건은 마스크로 먼저)"""
+    members = _filtered(catalog, city_keyword, max_price, min_rating)
+    allowed = None
+    if members is not None:
+        allowed = np.zeros(len(catalog.store), dtype=bool)
+        allowed[members] = True
+    return gen.get("room_names").search(name, limit, allowed)[0]
+
+
+def _paged_rooms(gen, catalog: RoomCatalog, city_keyword, max_price, min_rating, include_images, sort, cursor, limit,
+                 origin, format: str = "json", name: Optional[str] = None):
+    """정렬 + 커서 페이지 (다음 커서는 X-Next-Cursor 헤더), name 이 있으면 숙소명이 가까운 것만"""
+    members = _filtered(catalog, city_keyword, max_price, min_rating)
+    if name:
+        close = gen.get("room_names").search(name, len(catalog.store))[0]
+        members = np.sort(close) if members is None else np.intersect1d(members, close)
+    slots, headers, _ = paging.request_page(catalog.sort_index, sort, cursor, members, limit, origin)
+    return fragments.respond(_iter_with_images(catalog, slots.tolist(), include_images), format, headers)
 
 
 @router.get("/{room_id}", response_model=RoomWithImages)
 def get_room(room_id: int):
-    room = next((r for r in _rooms if r.room_id == room_id), None)
-    if not room:
+    catalog: RoomCatalog = datasets.get("rooms")
+    slot = catalog.index.slot(room_id)
+    if slot is None:
         raise HTTPException(status_code=404, detail="Room not found")
 
-    images = _room_image_map.get(room_id, [])
-    return RoomWithImages(**room.dict(), images=images)
-
-
-# import 시 로딩
-load_data()
\ No newline at end of file
+    tail = _images_tail(catalog, catalog.store.images(slot))
+    return fragments.RawJSONResponse(catalog.heads[slot] + tail)
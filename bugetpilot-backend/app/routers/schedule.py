@@ -4,7 +4,6 @@ from typing import List, Optional, Dict, Any
 import json
 import sys
 import os
-from openai import OpenAI
 
 # config.py는 루트 디렉토리에 있으므로 경로 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
@@ -40,6 +39,7 @@ async def generate_schedule(request: ScheduleRequest):
         )
     
     try:
+        from openai import OpenAI  # 무거운 SDK라 실제 호출 시점에 import
         client = OpenAI(api_key=S.OPENAI_API_KEY)
         
         # 선택한 식당과 관광지 정보를 문자열로 변환
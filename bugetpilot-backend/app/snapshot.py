@@ -0,0 +1,283 @@
+# app/snapshot.py
+"""
+데이터셋 스냅샷 (CSV → 컬럼 단위 NumPy 파일)
+
+- 오프라인에서 한 번 `python -m app.snapshot compile` 로 CSV를 파싱해 저장
+- 숫자 컬럼은 .npy (np.load(mmap_mode="r")로 메모리 맵, 복사 없음)
+- 문자열 컬럼은 NUL 구분 UTF-8 바이트(.npy) + 시작 오프셋(.npy) + 결측 마스크
+  → 메모리 맵이 아님: 로드 시 전체를 디코딩해 파이썬 문자열 객체로 만듦 (CSV 파싱보다 빠를 뿐)
+- manifest.json 에 컬럼 타입/행 수/원본 CSV 정보/파일별 크기·sha256 기록
+- 서빙 경로(load_dataset)는 파일 크기만 확인, sha256 전체 검증은 `python -m app.snapshot verify` 로 필요할 때
+- 라우터는 스냅샷이 있으면 그걸 읽고, 없거나 깨졌거나 원본보다 오래되면 CSV로 fallback
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+APP_ROOT = Path(__file__).resolve().parent
+SNAPSHOT_DIR = Path(os.getenv("DATASET_SNAPSHOT_DIR", "") or APP_ROOT / "data" / "snapshots")
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 4  # 2: 카페/관광지 위도·경도, 3: 식당 위도·경도(TM 변환), 4: 관광지 정규화 컬럼 — 예전 스냅샷은 무시 → CSV 로 읽음
+
+INDEX_COL = "__index__"  # DataFrame index(원본 행 번호)도 그대로 보존해야 id/가격 계산이 같아짐
+NUL = "\x00"
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _source_info(path: Path) -> dict:
+    st = path.stat()
+    return {
+        "path": str(path),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "sha256": _sha256(path),
+    }
+
+
+def _source_unchanged(info: dict) -> bool:
+    """원본 CSV가 컴파일 이후 바뀌지 않았는지 (원본이 없는 배포 환경이면 스냅샷을 신뢰)"""
+    path = Path(info["path"])
+    if not path.exists():
+        return True
+    st = path.stat()
+    if st.st_size != info["size"]:
+        return False
+    if st.st_mtime_ns == info["mtime_ns"]:
+        return True
+    # git checkout/COPY 로 mtime만 바뀐 경우 → 내용으로 비교
+    return _sha256(path) == info["sha256"]
+
+
+def read_manifest() -> dict:
+    path = SNAPSHOT_DIR / MANIFEST_NAME
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("format_version") != FORMAT_VERSION:
+        return {}
+    return manifest
+
+
+# -------------------------
+# 쓰기
+# -------------------------
+def _write_string_column(out_dir: Path, prefix: str, values: pd.Series) -> Dict[str, str]:
+    null = values.isna().to_numpy()
+    texts = ["" if m else str(v) for v, m in zip(values.tolist(), null)]
+    if any(NUL in t for t in texts):
+        texts = [t.replace(NUL, "") for t in texts]
+    encoded = [t.encode("utf-8") for t in texts]
+
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        # 각 값 뒤에 NUL 구분자 1바이트
+        offsets[1:] = np.cumsum([len(b) + 1 for b in encoded])
+    data = np.frombuffer(b"".join(b + b"\x00" for b in encoded), dtype=np.uint8)
+
+    files = {
+        "data": f"{prefix}.data.npy",
+        "offsets": f"{prefix}.offsets.npy",
+        "null": f"{prefix}.null.npy",
+    }
+    np.save(out_dir / files["data"], data)
+    np.save(out_dir / files["offsets"], offsets)
+    np.save(out_dir / files["null"], null)
+    return files
+
+
+def _write_table(out_dir: Path, table: str, df: pd.DataFrame) -> dict:
+    columns = []
+    series_list = [(INDEX_COL, pd.Series(df.index.to_numpy(dtype=np.int64)))]
+    series_list += [(str(c), df[c]) for c in df.columns]
+
+    for i, (name, s) in enumerate(series_list):
+        prefix = f"{table}.{i}"
+        dtype = str(s.dtype)
+        if pd.api.types.is_bool_dtype(s.dtype) or (
+            pd.api.types.is_numeric_dtype(s.dtype) and not isinstance(s.dtype, pd.CategoricalDtype)
+        ):
+            files = {"values": f"{prefix}.npy"}
+            np.save(out_dir / files["values"], s.to_numpy())
+            kind = "numeric"
+        else:
+            files = _write_string_column(out_dir, prefix, s)
+            kind = "string"
+        columns.append({"name": name, "kind": kind, "dtype": dtype, "files": files})
+
+    return {"rows": int(len(df)), "columns": columns}
+
+
+def write_dataset(name: str, tables: Dict[str, pd.DataFrame], sources: List[Path]) -> dict:
+    """한 데이터셋(여러 테이블 가능)을 SNAPSHOT_DIR/<name>/ 에 쓰고 manifest 항목을 반환"""
+    final_dir = SNAPSHOT_DIR / name
+    tmp_dir = SNAPSHOT_DIR / f".{name}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    entry = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sources": [_source_info(p) for p in sources],
+        "tables": {t: _write_table(tmp_dir, t, df) for t, df in tables.items()},
+    }
+    files = sorted(tmp_dir.iterdir())
+    entry["checksums"] = {p.name: _sha256(p) for p in files}
+    entry["sizes"] = {p.name: p.stat().st_size for p in files}
+
+    # 완성된 디렉터리로 교체 (부분적으로 쓰인 스냅샷이 읽히지 않도록)
+    shutil.rmtree(final_dir, ignore_errors=True)
+    tmp_dir.rename(final_dir)
+    return entry
+
+
+# -------------------------
+# 읽기
+# -------------------------
+def _read_string_column(base: Path, col: dict, rows: int) -> pd.Series:
+    files = col["files"]
+    data = np.load(base / files["data"], mmap_mode="r")
+    null = np.load(base / files["null"])
+    # 마지막 NUL 구분자 뒤의 빈 문자열 제거
+    values = data.tobytes().decode("utf-8").split(NUL)[:rows] if rows else []
+    arr = np.array(values, dtype=object)
+    if null.any():
+        arr[null] = np.nan
+    if col["dtype"] == "category":
+        return pd.Series(arr, dtype="category")
+    if col["dtype"] == "object":
+        return pd.Series(arr, dtype=object)
+    return pd.Series(arr).astype(col["dtype"])
+
+
+def _read_table(base: Path, meta: dict) -> pd.DataFrame:
+    rows = meta["rows"]
+    data = {}
+    for col in meta["columns"]:
+        if col["kind"] == "numeric":
+            s = pd.Series(np.load(base / col["files"]["values"], mmap_mode="r"), copy=False)
+        else:
+            s = _read_string_column(base, col, rows)
+        data[col["name"]] = s.to_numpy() if col["name"] == INDEX_COL else s.reset_index(drop=True)
+
+    index = pd.Index(data.pop(INDEX_COL))
+    df = pd.DataFrame(data, copy=False)
+    df.index = index
+    return df
+
+
+def source_names(name: str) -> List[str]:
+    """스냅샷 compile 때 읽은 원본 파일 이름들 (스냅샷이 없으면 빈 리스트)"""
+    entry = read_manifest().get("datasets", {}).get(name) or {}
+    return [Path(s["path"]).name for s in entry.get("sources", [])]
+
+
+def load_dataset(name: str, verify: bool = False) -> Optional[Dict[str, pd.DataFrame]]:
+    """
+    스냅샷이 있으면 {table: DataFrame} 반환, 없거나 무효하면 None (호출 측에서 CSV로 fallback)
+    verify=True 면 파일마다 sha256 까지 비교 (전체를 다시 읽으므로 verify 커맨드에서만)
+    """
+    entry = read_manifest().get("datasets", {}).get(name)
+    if not entry:
+        return None
+    base = SNAPSHOT_DIR / name
+
+    try:
+        if not all(_source_unchanged(s) for s in entry["sources"]):
+            print(f"[SNAPSHOT] {name}: source CSV changed since compile, ignoring snapshot")
+            return None
+        # 잘린/덜 복사된 파일은 크기로 (stat 만, 파일 내용은 안 읽음)
+        for fname, size in entry.get("sizes", {}).items():
+            if (base / fname).stat().st_size != size:
+                print(f"[SNAPSHOT] {name}: size mismatch ({fname}), ignoring snapshot")
+                return None
+        if verify:
+            for fname, digest in entry["checksums"].items():
+                if _sha256(base / fname) != digest:
+                    print(f"[SNAPSHOT] {name}: checksum mismatch ({fname}), ignoring snapshot")
+                    return None
+        tables = {t: _read_table(base, meta) for t, meta in entry["tables"].items()}
+    except (OSError, KeyError, ValueError) as e:
+        print(f"[SNAPSHOT] {name}: unreadable ({e}), ignoring snapshot")
+        return None
+
+    print(f"[SNAPSHOT] {name}: loaded", {t: len(df) for t, df in tables.items()})
+    return tables
+
+
+# -------------------------
+# compile 커맨드
+# -------------------------
+def _builders() -> Dict[str, Callable[[], Tuple[Dict[str, pd.DataFrame], List[Path]]]]:
+    # 라우터가 이 모듈을 import 하므로 여기서 늦게 import
+    from app.routers import attractions, restaurants, rooms
+
+    return {
+        "restaurants": restaurants.build_restaurant_tables,
+        "cafes": restaurants.build_cafe_tables,
+        "attractions": attractions.build_attraction_tables,
+        # compile은 오프라인 작업이라 문화 CSV 다운로드가 필요하면 끝날 때까지 기다림
+        "rooms": lambda: rooms.build_room_tables(wait_download=True),
+    }
+
+
+def compile_all(names: Optional[List[str]] = None) -> dict:
+    builders = _builders()
+    SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+
+    manifest = read_manifest() or {"format_version": FORMAT_VERSION, "datasets": {}}
+    for name, build in builders.items():
+        if names and name not in names:
+            continue
+        t0 = time.perf_counter()
+        tables, sources = build()
+        if not sources:
+            print(f"[SNAPSHOT] {name}: no source CSV found, skipped")
+            continue
+        manifest["datasets"][name] = write_dataset(name, tables, sources)
+        rows = {t: len(df) for t, df in tables.items()}
+        print(f"[SNAPSHOT] {name}: {rows} in {time.perf_counter() - t0:.2f}s")
+
+    tmp = SNAPSHOT_DIR / (MANIFEST_NAME + ".tmp")
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp.replace(SNAPSHOT_DIR / MANIFEST_NAME)
+    return manifest
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="CSV 데이터셋 스냅샷 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_compile = sub.add_parser("compile", help="CSV를 파싱해 스냅샷 생성")
+    p_compile.add_argument("datasets", nargs="*", help="생략하면 전체 (restaurants, cafes, attractions, rooms)")
+    sub.add_parser("verify", help="manifest 체크섬 검증")
+    args = parser.parse_args(argv)
+
+    if args.command == "compile":
+        compile_all(args.datasets or None)
+    elif args.command == "verify":
+        ok = True
+        for name in read_manifest().get("datasets", {}):
+            ok = load_dataset(name, verify=True) is not None and ok
+        raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
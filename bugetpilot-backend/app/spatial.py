@@ -0,0 +1,87 @@
+# app/spatial.py
+"""
+주변 검색용 격자(grid) 공간 인덱스 (로드 시 1번 빌드)
+
+    grid = GridIndex(lat, lng)                       # 좌표 없는 점(NaN)은 빠짐
+    positions, dist_km = grid.within(37.56, 126.97, 2.0)   # 반경 안, 가까운 순
+
+- 위경도를 cell_deg 크기 칸으로 나눠 칸 번호(행 * 열 수 + 열)로 정렬해 둠
+  → 같은 위도 행에서 연속한 칸들은 정렬 배열의 한 구간 = 이분 탐색(searchsorted) 2번
+- 질의: 반경을 감싸는 사각형에 걸친 위도 행마다 구간 하나 → 후보만 haversine 으로 거리 계산 후 반경 안만 정렬
+  → 비용은 전체 점 수가 아니라 사각형 안 점 수에 비례
+- 경도 ±180 경계(날짜변경선)는 넘지 않는다고 봄 (국내 데이터)
+- 거리가 같으면 위치 오름차순
+"""
+from __future__ import annotations
+
+import os
+from typing import Tuple
+
+from app import geo
+from app.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+CELL_DEG = float(os.getenv("NEARBY_CELL_DEG", "0.02"))  # 약 2.2km (위도 방향)
+
+
+def _ranges(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """[lo[i], hi[i]) 구간들을 이어 붙인 인덱스 (파이썬 루프 없이)"""
+    lengths = hi - lo
+    keep = lengths > 0
+    lo, lengths = lo[keep], lengths[keep]
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    # 구간 시작마다 (다음 구간 시작 - 이전 구간 끝) 만큼 건너뛰는 누적합
+    steps = np.ones(total, dtype=np.int64)
+    starts = np.cumsum(lengths)[:-1]
+    steps[0] = lo[0]
+    steps[starts] = lo[1:] - (lo[:-1] + lengths[:-1]) + 1
+    return np.cumsum(steps)
+
+
+class GridIndex:
+    def __init__(self, lat, lng, cell_deg: float = CELL_DEG):
+        lat = np.asarray(lat, dtype=np.float64)
+        lng = np.asarray(lng, dtype=np.float64)
+        self.cell_deg = cell_deg
+        self.cols = int(np.ceil(360 / cell_deg)) + 1
+        points = np.flatnonzero(np.isfinite(lat) & np.isfinite(lng))
+        keys = self._row(lat[points]) * self.cols + self._col(lng[points])
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.positions = points[order]
+        # 질의 때 후보 좌표를 연속 메모리에서 읽도록 칸 순서로 복사
+        self.lat = lat[self.positions]
+        self.lng = lng[self.positions]
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def _row(self, lat):
+        return np.floor((np.asarray(lat) + 90) / self.cell_deg).astype(np.int64)
+
+    def _col(self, lng):
+        return np.floor((np.asarray(lng) + 180) / self.cell_deg).astype(np.int64)
+
+    def candidates(self, lat0: float, lng0: float, radius_km: float) -> np.ndarray:
+        """반경을 감싸는 위경도 사각형에 걸친 칸들의 점 (정렬 배열 인덱스)"""
+        dlat = radius_km / geo.KM_PER_DEG
+        # 구면 위 원을 감싸는 경도 폭: asin(sin(r/R) / cos(lat0)), 극을 포함하면 전체 경도
+        ratio = np.sin(radius_km / geo.EARTH_RADIUS_KM) / np.cos(np.radians(lat0))
+        dlng = float(np.degrees(np.arcsin(ratio))) if abs(lat0) + dlat < 90 and ratio < 1 else 180.0
+        rows = np.arange(int(self._row(lat0 - dlat)), int(self._row(lat0 + dlat)) + 1, dtype=np.int64)
+        c0, c1 = int(self._col(max(lng0 - dlng, -180.0))), int(self._col(min(lng0 + dlng, 180.0)))
+        lo = np.searchsorted(self.keys, rows * self.cols + c0, side="left")
+        hi = np.searchsorted(self.keys, rows * self.cols + c1, side="right")
+        return _ranges(lo, hi)
+
+    def within(self, lat0: float, lng0: float, radius_km: float) -> Tuple[np.ndarray, np.ndarray]:
+        """반경 radius_km 안의 (위치, 거리 km), 가까운 순"""
+        idx = self.candidates(lat0, lng0, radius_km)
+        dist = geo.haversine_km(self.lat[idx], self.lng[idx], lat0, lng0)
+        keep = dist <= radius_km
+        positions, dist = self.positions[idx[keep]], dist[keep]
+        order = np.lexsort((positions, dist))
+        return positions[order], dist[order]
@@ -0,0 +1,228 @@
+# app/storage.py
+"""
+목록 API용 저장소 백엔드 (DATASET_BACKEND=pandas|sqlite, 기본 pandas)
+
+라우터는 Table.search(keyword, limit) / Table.search_ids(keyword, limit) 만 사용
+- search 반환: 원본 DataFrame과 같은 컬럼/같은 index(원본 행 번호)의 DataFrame, 파일 순서 그대로 최대 limit행
+- search_ids 반환: 같은 행들의 원본 행 번호 배열만 (행 내용을 안 만듦, 미리 만든 항목과 합칠 때)
+- keyword: 행정구역으로 해석되면(app/address.py, 예: 광주 → 광주광역시) 주소 코드 정수 비교,
+  아니면 search_col 에 대한 대소문자 무시 부분 문자열 검색
+- 주소 코드(_sido/_sgg/_emd/_road)는 두 백엔드 모두 로드 시 1번 파싱해 메모리에 둠 (행당 16바이트)
+
+PandasTable: 메모리 DataFrame + n-gram 역색인(app/ngram.py), 정규식 키워드만 str.contains 스캔
+SqliteTable: 임베디드 SQLite 파일 (행 번호 PK + search_col FTS5 trigram)
+    - 이름 검색은 두 백엔드 모두 라우터의 메모리 오타 검색 색인(app/fuzzy.py) → SQLite 에는 이름 색인 없음
+    - 3글자 이상 키워드는 FTS5 trigram MATCH, 2글자 이하(강릉, 부산 …)는 instr 스캔
+    - 데이터 내용 해시가 같으면 기존 DB 파일을 재사용, 다르면 임시 파일에 만들고 교체
+    - 요청 스레드마다 읽기 전용 커넥션
+    - 메모리 이득 없음: 식당/카페/관광지 라우터가 로드 시 search(None, 전체)로 모든 행을 읽어
+      주소 코드/n-gram/오타/정렬 색인과 응답 조각을 메모리에 만듦 → 상주 메모리는 pandas 와 같고 DB 파일이 더해짐
+      (bench/storage_backends.py 가 앱 전체 RSS 를 같이 출력). 바뀌는 것은 키워드 조회 경로뿐
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+from app import address, ngram
+from app.lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+BACKEND = os.getenv("DATASET_BACKEND", "pandas").strip().lower()
+SQLITE_DIR = Path(os.getenv("DATASET_SQLITE_DIR", "") or Path(__file__).resolve().parent / "data" / "sqlite")
+
+INDEX_COL = "__idx__"
+FTS_MIN_CHARS = 3  # trigram 토크나이저는 3글자 미만 패턴을 인덱스로 못 찾음
+SCHEMA = "v2: t + t_fts(search_col)"  # 테이블 구성이 바뀌면 올림 → 예전 DB 파일은 fingerprint 가 달라 다시 빌드
+
+
+def _region_positions(codes: pd.DataFrame, keyword: str, limit: int):
+    """행정구역 키워드면 해당 행 위치(파일 순서, 최대 limit개), 아니면 None"""
+    ref = address.resolve(keyword)
+    if ref is None:
+        return None
+    return np.flatnonzero(ref.mask(codes))[:limit]
+
+
+class PandasTable:
+    def __init__(self, name: str, df: pd.DataFrame, search_col: str):
+        self.name = name
+        self.df = df
+        self.search_col = search_col
+        self.codes = address.parse(df[search_col])
+        self.index = ngram.NgramIndex(df[search_col].astype(str).tolist())
+        self.row_index = np.asarray(df.index, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def _positions(self, keyword: Optional[str], limit: int):
+        """검색 결과 행 위치 (파일 순서, 최대 limit개)"""
+        if not keyword:
+            return np.arange(min(limit, len(self.df)), dtype=np.int64)
+        positions = _region_positions(self.codes, keyword, limit)
+        if positions is not None:
+            return positions
+        if ngram.is_literal(keyword):
+            return np.asarray(self.index.search(keyword, limit), dtype=np.int64)
+        mask = self.df[self.search_col].astype(str).str.contains(keyword, na=False, case=False).to_numpy()
+        return np.flatnonzero(mask)[:limit]
+
+    def search(self, keyword: Optional[str], limit: int) -> pd.DataFrame:
+        return self.df.iloc[self._positions(keyword, limit)]
+
+    def search_ids(self, keyword: Optional[str], limit: int):
+        return self.row_index[self._positions(keyword, limit)]
+
+
+def _fingerprint(df: pd.DataFrame) -> str:
+    h = hashlib.sha256()
+    h.update(SCHEMA.encode())
+    h.update(repr(list(df.columns)).encode())
+    h.update(np.asarray(df.index, dtype=np.int64).tobytes())
+    h.update(pd.util.hash_pandas_object(df.astype(object), index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class SqliteTable:
+    def __init__(self, name: str, df: pd.DataFrame, search_col: str):
+        self.name = name
+        self.search_col = search_col
+        self.columns = [str(c) for c in df.columns]
+        self.dtypes = {str(c): df[c].dtype for c in df.columns}
+        self._rows = len(df)
+        self.codes = address.parse(df[search_col])
+        self.row_index = np.asarray(df.index, dtype=np.int64)
+        self.path = SQLITE_DIR / f"{name}.sqlite3"
+        self._local = threading.local()
+        self._build(df)
+
+    def __len__(self) -> int:
+        return self._rows
+
+    # -------------------------
+    # 빌드
+    # -------------------------
+    def _existing_fingerprint(self) -> Optional[str]:
+        if not self.path.exists():
+            return None
+        try:
+            with sqlite3.connect(f"file:{self.path}?mode=ro", uri=True) as conn:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+                return row[0] if row else None
+        except sqlite3.Error:
+            return None
+
+    def _build(self, df: pd.DataFrame) -> None:
+        fingerprint = _fingerprint(df)
+        if self._existing_fingerprint() == fingerprint:
+            return
+
+        SQLITE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+        tmp.unlink(missing_ok=True)
+        cols = ", ".join(_quote(c) for c in self.columns)
+
+        with sqlite3.connect(tmp) as conn:
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.execute(f"CREATE TABLE t ({_quote(INDEX_COL)} INTEGER PRIMARY KEY, {cols})")
+            out = df.astype(object).where(df.notna(), None)
+            out.insert(0, INDEX_COL, np.asarray(df.index, dtype=np.int64).tolist())
+            placeholders = ", ".join("?" * (len(self.columns) + 1))
+            conn.executemany(f"INSERT INTO t VALUES ({placeholders})", out.itertuples(index=False, name=None))
+
+            # 키워드 부분 문자열 검색용 FTS5 (external content → 텍스트 중복 저장 안 함)
+            conn.execute(
+                f"CREATE VIRTUAL TABLE t_fts USING fts5({_quote(self.search_col)}, content='t', "
+                f"content_rowid={_quote(INDEX_COL)}, tokenize='trigram')"
+            )
+            conn.execute("INSERT INTO t_fts(t_fts) VALUES ('rebuild')")
+
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute("INSERT INTO meta VALUES ('fingerprint', ?)", (fingerprint,))
+        # 기존 커넥션(이전 세대)은 예전 파일을 계속 읽음
+        os.replace(tmp, self.path)
+        print(f"[SQLITE] {self.name}: built {self.path} ({self._rows} rows)")
+
+    # -------------------------
+    # 조회
+    # -------------------------
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            self._local.conn = conn
+        return conn
+
+    def _query(self, keyword: Optional[str], limit: int, cols: str):
+        """행정구역이 아닌 키워드 → (sql, params)"""
+        col = _quote(self.search_col)
+        if not keyword:
+            sql, params = f"SELECT {cols} FROM t ORDER BY t.{_quote(INDEX_COL)} LIMIT ?", (limit,)
+        elif len(keyword) >= FTS_MIN_CHARS:
+            phrase = '"' + keyword.replace('"', '""') + '"'
+            sql = (
+                f"SELECT {cols} FROM t_fts JOIN t ON t.{_quote(INDEX_COL)} = t_fts.rowid "
+                f"WHERE t_fts.{col} MATCH ? ORDER BY t_fts.rowid LIMIT ?"
+            )
+            params = (phrase, limit)
+        else:
+            sql = (
+                f"SELECT {cols} FROM t WHERE instr(lower(t.{col}), lower(?)) > 0 "
+                f"ORDER BY t.{_quote(INDEX_COL)} LIMIT ?"
+            )
+            params = (keyword, limit)
+        return sql, params
+
+    def search(self, keyword: Optional[str], limit: int) -> pd.DataFrame:
+        cols = ", ".join("t." + _quote(c) for c in [INDEX_COL] + self.columns)
+        positions = _region_positions(self.codes, keyword, limit) if keyword else None
+        if positions is not None:
+            # 행정구역 키워드: 코드로 고른 행을 PK로 조회
+            ids = self.row_index[positions].tolist()
+            sql = (
+                f"SELECT {cols} FROM t WHERE t.{_quote(INDEX_COL)} IN ({', '.join('?' * len(ids))}) "
+                f"ORDER BY t.{_quote(INDEX_COL)}"
+            )
+            params = tuple(ids)
+        else:
+            sql, params = self._query(keyword, limit, cols)
+
+        rows = self._conn().execute(sql, params).fetchall()
+        df = pd.DataFrame.from_records(rows, columns=[INDEX_COL] + self.columns)
+        df = df.set_index(INDEX_COL)
+        df.index.name = None
+        # NULL → NaN, 원래 dtype 복원 (pandas 경로와 같은 값이 나오도록)
+        for c, dtype in self.dtypes.items():
+            s = df[c].where(df[c].notna(), np.nan)
+            try:
+                df[c] = s.astype(dtype)
+            except (TypeError, ValueError):
+                df[c] = s
+        return df
+
+    def search_ids(self, keyword: Optional[str], limit: int):
+        positions = _region_positions(self.codes, keyword, limit) if keyword else None
+        if positions is not None:
+            return self.row_index[positions]
+        sql, params = self._query(keyword, limit, "t." + _quote(INDEX_COL))
+        rows = self._conn().execute(sql, params).fetchall()
+        return np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+
+
+def make_table(name: str, df: pd.DataFrame, search_col: str):
+    """DATASET_BACKEND 설정에 맞는 Table 생성 (search_col: 키워드 검색 컬럼)"""
+    if BACKEND == "sqlite":
+        return SqliteTable(name, df, search_col)
+    return PandasTable(name, df, search_col)
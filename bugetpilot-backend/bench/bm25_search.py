@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+/attractions q= 검색: BM25 역색인(app/bm25.py) 빌드/질의 지연시간, 문서 수별
+
+    python bench/bm25_search.py [--sizes 10000,100000] [--limit 80] [--repeat 20]
+
+- 가짜 관광지(이름 + 소개 문장 조합)로 코퍼스를 만들고 크기별로
+  빌드 시간, 색인 메모리, 질의별 지연시간(중앙값/p95) 출력
+- 같은지 확인: 문서마다 파이썬으로 BM25 점수를 직접 계산해서 고른 상위 limit개 == 색인 결과
+  (직접 계산 시간 = 색인 없이 전체를 훑는 비용, 참고 출력)
+"""
+import argparse
+import math
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+PLACES = ["해상", "도심", "산림", "호수", "강변", "해안", "역사", "민속", "생태", "전통", "예술", "한옥", "항구", "섬", "계곡"]
+KINDS = ["케이블카", "전망대", "공원", "온천", "해수욕장", "박물관", "시장", "사찰", "수목원", "테마파크", "산책로", "폭포"]
+PHRASES = [
+    "야경이 아름다운 곳입니다", "가족 단위 관광객에게 인기가 많습니다", "사계절 내내 방문객이 찾는 명소입니다",
+    "케이블카를 타고 바다를 내려다볼 수 있습니다", "노천 온천에서 피로를 풀 수 있습니다", "일출 명소로 유명합니다",
+    "조선시대 유적이 남아 있습니다", "맛집과 카페가 모여 있습니다", "해안 산책로를 따라 걷기 좋습니다",
+    "아이들을 위한 체험 프로그램이 있습니다", "가을 단풍이 특히 아름답습니다", "주차장이 넓어 편리합니다",
+    "night view and cable car", "전통 한옥 마을 풍경을 볼 수 있습니다", "폭포와 계곡이 어우러진 자연 휴양지입니다",
+]
+QUERIES = ["케이블카", "야경", "온천", "해수욕장 일출", "전통 한옥 마을", "cable car", "단풍 산책로", "없는검색어"]
+
+
+def make_corpus(rows: int):
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    names = [f"{PLACES[a]}{KINDS[b]}" for a, b in zip(rng.integers(0, len(PLACES), rows), rng.integers(0, len(KINDS), rows))]
+    counts = rng.integers(1, 6, rows)
+    picks = rng.integers(0, len(PHRASES), int(counts.sum()))
+    descs, start = [], 0
+    for n in counts.tolist():
+        descs.append(" ".join(PHRASES[i] for i in picks[start:start + n].tolist()) + ".")
+        start += n
+    return names, descs
+
+
+def reference(bm25, names, descs, query, weights, k1, b, limit):
+    """문서마다 파이썬으로 BM25 (색인 없이 전체 훑기)"""
+    docs = []
+    for name, desc in zip(names, descs):
+        tf = Counter()
+        length = 0.0
+        for text, w in zip((name, desc), weights):
+            toks = bm25.tokens(text)
+            length += w * len(toks)
+            for t in toks:
+                tf[t] += w
+        docs.append((tf, length))
+    n = len(docs)
+    avgdl = sum(d[1] for d in docs) / n
+    terms = list(dict.fromkeys(bm25.tokens(query)))
+    df = {t: sum(1 for tf, _ in docs if t in tf) for t in terms}
+    scored = []
+    for pos, (tf, length) in enumerate(docs):
+        score = 0.0
+        for t in terms:
+            f = tf.get(t)
+            if f:
+                idf = math.log(1 + (n - df[t] + 0.5) / (df[t] + 0.5))
+                score += idf * f * (k1 + 1) / (f + k1 * (1 - b + b * length / avgdl))
+        if score > 0:
+            scored.append((-score, pos))
+    scored.sort()
+    return [pos for _, pos in scored[:limit]], [-s for s, _ in scored[:limit]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--limit", type=int, default=80)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    import numpy as np
+
+    from app import bm25
+
+    weights = [2.0, 1.0]
+    mismatches = 0
+    for rows in [int(x) for x in args.sizes.split(",") if x.strip()]:
+        names, descs = make_corpus(rows)
+        t0 = time.perf_counter()
+        index = bm25.BM25Index([names, descs], weights=weights)
+        build = time.perf_counter() - t0
+        print(f"\n문서 {rows:,}개: build {build * 1000:.0f}ms, 용어 {len(index.vocab):,}개, "
+              f"색인 {index.nbytes() / 1024 / 1024:.1f}MB")
+        print(f"{'query':<16} {'hits':>8} {'median':>10} {'p95':>10} {'전체 훑기':>10}  same")
+        for query in QUERIES:
+            samples = []
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                positions, scores = index.search(query, args.limit)
+                samples.append((time.perf_counter() - t0) * 1000)
+            t0 = time.perf_counter()
+            expected, expected_scores = reference(bm25, names, descs, query, weights, index.k1, bm25.B, args.limit)
+            scan_ms = (time.perf_counter() - t0) * 1000
+            # 점수는 float32 tf 로 계산해서 아주 작은 차이 허용, 순서는 그대로 같아야 함
+            same = positions.tolist() == expected and np.allclose(scores, expected_scores, rtol=1e-6)
+            mismatches += not same
+            samples.sort()
+            print(f"{query:<16} {len(index.scores(query)[0]):>8,} {statistics.median(samples):>8.2f}ms "
+                  f"{samples[int(len(samples) * 0.95) - 1]:>8.2f}ms {scan_ms:>8.0f}ms  {same}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+정렬 + 커서 페이지네이션(app/paging.py) 확인
+
+    python bench/cursor_paging.py [--limit 37] [--repeat 5]
+
+1) 같은지 확인: /rooms, /restaurants, /attractions × sort(없음, price, rating, reviewCount, distance)
+   × 여러 필터로 X-Next-Cursor 를 따라 끝까지 받은 페이지를 이어 붙인 결과
+   == 같은 조건의 전체 목록(기존 비정렬 경로를 limit 없이 실행, 파일 순서)을 파이썬 sorted() 로 정렬한 결과
+   (같은 값이면 파일 순서)
+2) 깊은 페이지 시간: 첫 페이지 vs 마지막 근처 페이지 (offset 이 아니라 커서라서 비슷해야 함)
+"""
+import argparse
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+SORTS = [None, "price", "rating", "reviewCount", "distance"]
+DESC = {"rating", "reviewCount"}
+ORIGIN = {"lat": 37.5665, "lng": 126.9780}   # 서울시청
+FILTERS = {
+    "/rooms": [{}, {"city_keyword": "서울"}, {"city_keyword": "부산", "max_price": 90000, "min_rating": 4}],
+    "/restaurants": [{}, {"city_keyword": "강릉"}, {"city_keyword": "마포구", "max_price": 15000}],
+    "/attractions": [{}, {"city_keyword": "제주"}, {"max_price": 0}],
+}
+# 응답 필드 이름 (숙소만 다름)
+ROOM_FIELDS = {"price": "daily_price", "rating": "rating_star_score", "reviewCount": "review_count"}
+
+
+def _walk(client, path, params, limit):
+    out, cursor, pages = [], None, 0
+    while True:
+        q = dict(params, limit=limit, **({"cursor": cursor} if cursor else {}))
+        r = client.get(path, params=q)
+        if r.status_code != 200:
+            return None, r.status_code
+        out.extend(r.json())
+        pages += 1
+        cursor = r.headers.get("X-Next-Cursor")
+        if not cursor:
+            return out, pages
+
+
+def _key(path, sort, item, coords):
+    from app import geo
+
+    if sort == "distance":
+        lat, lng = coords.get(_ident(path, item), (math.nan, math.nan))
+        if path == "/rooms" and (item["lat"], item["lng"]) != (0, 0):
+            lat, lng = item["lat"], item["lng"]
+        dist = float(geo.haversine_km([lat], [lng], ORIGIN["lat"], ORIGIN["lng"])[0])
+        return math.inf if math.isnan(dist) else dist
+    value = item[ROOM_FIELDS[sort] if path == "/rooms" else sort]
+    return -value if sort in DESC else value
+
+
+def _ident(path, item):
+    return tuple(sorted(_strip_id(path, item).items()))
+
+
+def _coordinates(path):
+    """응답에 좌표가 없으니 (항목 → 좌표) 를 데이터셋에서 가져옴 (식당/카페, 관광지)"""
+    import json
+
+    from app import datasets
+
+    if path == "/rooms":
+        return {}
+    if path == "/restaurants":
+        items = datasets.get("restaurant_items")
+        bodies = {p: it[2] for p, it in enumerate(items.items) if it is not None}
+    else:
+        items = datasets.get("attraction_items")
+        bodies = {p: items.items[p][1] for p in items.named.tolist()}
+    index = items.sort_index
+    return {_ident(path, json.loads(body)): (float(index.lat[p]), float(index.lng[p])) for p, body in bodies.items()}
+
+
+def _file_order(client, path, params):
+    """비교 기준: 조건에 맞는 전체 목록 (파일 순서, 통합 POI 중복 제거 + max_price 를 행마다 파이썬으로)"""
+    import json
+
+    import numpy as np
+
+    from app import datasets
+
+    if path == "/rooms":
+        return _walk(client, path, params, 200)[0]
+    kw = params.get("city_keyword")
+    max_price = params.get("max_price")
+    if path == "/restaurants":
+        items = datasets.get("restaurant_items")
+        rest, cafes = datasets.get("restaurants"), datasets.get("cafes")
+        positions = np.concatenate([
+            items.restaurant_positions(rest.search(kw, len(rest)).index),
+            items.cafe_positions(cafes.search(kw, len(cafes)).index),
+        ])
+        frags, seen = [], set()
+        for p in positions.tolist():
+            poi = int(items.poi_codes[p])
+            if poi >= 0 and poi not in seen:
+                seen.add(poi)
+                if max_price is None or items.items[p][1] <= max_price:
+                    frags.append(items.items[p][2])
+    else:
+        items = datasets.get("attraction_items")
+        table = datasets.get("attractions")
+        frags = [
+            items.items[p][1] for p in items.positions(table.search(kw, len(table)).index).tolist()
+            if items.items[p] is not None and (max_price is None or items.items[p][0] <= max_price)
+        ]
+    return [json.loads(f) for f in frags]
+
+
+def _strip_id(path, item):
+    # 식당 id(rest-N)는 응답 안 순번 → 비교에서 뺌
+    return {k: v for k, v in item.items() if k != "id"} if path == "/restaurants" else item
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--limit", type=int, default=37)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    client = TestClient(app)
+    mismatches = 0
+    for path, filters in FILTERS.items():
+        for params in filters:
+            for sort in SORTS:
+                q = dict(params, **({"sort": sort} if sort else {}))
+                if sort == "distance":
+                    q.update(ORIGIN)
+                if sort is None and path != "/rooms":
+                    continue   # 식당/관광지는 sort/cursor 없으면 기존 응답
+                got, pages = _walk(client, path, q, args.limit)
+                if got is None:
+                    print(f"{path:>13} {str(q):<70} → {pages}")
+                    continue
+                base = _file_order(client, path, params)
+                coords = _coordinates(path)
+                expected = sorted(base, key=lambda it: _key(path, sort, it, coords)) if sort else base
+                same = [_strip_id(path, i) for i in got] == [_strip_id(path, i) for i in expected]
+                mismatches += not same
+                print(f"{path:>13} {str(q):<70} {len(got):>6} rows {pages:>4} pages  same={same}")
+
+    # 2) 깊은 페이지
+    print()
+    for path in FILTERS:
+        for sort in ["price", "rating"]:
+            first = client.get(path, params={"sort": sort, "limit": 50})
+            cursor = first.headers.get("X-Next-Cursor")
+            deep = None
+            while cursor:
+                r = client.get(path, params={"sort": sort, "limit": 200, "cursor": cursor})
+                nxt = r.headers.get("X-Next-Cursor")
+                if not nxt:
+                    break
+                deep, cursor = cursor, nxt
+            t_first = _ms(lambda: client.get(path, params={"sort": sort, "limit": 50}), args.repeat)
+            t_deep = _ms(lambda: client.get(path, params={"sort": sort, "limit": 50, "cursor": deep}), args.repeat) \
+                if deep else float("nan")
+            print(f"{path:>13} sort={sort:<7} first page {t_first:6.2f}ms  deep page {t_deep:6.2f}ms")
+
+    bad = client.get("/rooms", params={"sort": "price", "cursor": "!!not-a-cursor"}).status_code
+    print(f"\n잘못된 커서 → {bad}")
+    mismatches += bad != 400
+    sys.exit(1 if mismatches else 0)
+
+
+def _ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+if __name__ == "__main__":
+    main()
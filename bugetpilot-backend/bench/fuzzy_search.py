@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+상호명 오타 허용 검색: 자모 trigram 색인(app/fuzzy.py) 지연시간 + 정확도, 이름 수별
+
+    python bench/fuzzy_search.py [--sizes 100000,300000,500000] [--queries 200] [--limit 20]
+
+- 가짜 상호명(지역/수식어 + 음식 종류 + 지점) 코퍼스를 크기별로 만들고
+  빌드 시간, 색인 메모리, 오타 질의 지연시간(중앙값/p95/최대) 출력 — 목표 10ms 미만
+- 오타 질의: 코퍼스 이름에서 음절 하나를 비슷한 음절로 바꾸거나(모음/받침) 한 글자 빼기
+  → 원래 이름이 상위 limit 안에 있는 비율(recall)
+- 같은지 확인: 색인 결과 == 전체 이름에 편집 거리를 직접 계산해서 고른 결과 (후보 상한에 안 걸린 질의)
+- 실제 데이터(/restaurants 이름 코드)도 같은 방식으로 지연시간만
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+PREFIXES = ["", "", "원조", "옛날", "행복한", "할매", "착한", "신촌", "강릉", "부산", "제주", "명동", "해운대", "전주", "춘천",
+            "대박", "황금", "우리", "고향", "바다", "산골", "청년", "엄마손", "시골"]
+CORES = ["칼국수", "돼지국밥", "해물탕", "순대국", "김밥", "치킨", "닭갈비", "막국수", "갈비", "냉면", "족발", "보쌈", "곱창",
+         "삼겹살", "짬뽕", "짜장", "초밥", "돈까스", "떡볶이", "카페", "베이커리", "커피", "피자", "순두부", "감자탕", "추어탕"]
+SUFFIXES = ["", "", "", "집", "식당", "본점", "전문점", "하우스", "마을", "나라"]
+SYLLABLES = "가나다라마바사아자차카타파하강남동서울산천해운대명성진영미소한빛솔숲별달꽃"
+
+
+def make_names(rows: int):
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    p = rng.integers(0, len(PREFIXES), rows)
+    c = rng.integers(0, len(CORES), rows)
+    s = rng.integers(0, len(SUFFIXES), rows)
+    tags = rng.integers(0, len(SYLLABLES), (rows, 2))
+    branch = rng.integers(0, 4, rows)
+    names = []
+    for i in range(rows):
+        tag = SYLLABLES[tags[i, 0]] + SYLLABLES[tags[i, 1]]
+        name = f"{PREFIXES[p[i]]}{tag}{CORES[c[i]]}{SUFFIXES[s[i]]}"
+        if branch[i] == 0:
+            name += f" {SYLLABLES[tags[i, 1]]}{SYLLABLES[tags[i, 0]]}점"
+        names.append(name)
+    return names
+
+
+def typo(rng, name: str) -> str:
+    """음절 하나를 중성/종성만 바꾼 음절로 바꾸거나, 한 글자 빼기"""
+    hangul = [i for i, ch in enumerate(name) if "가" <= ch <= "힣"]
+    if not hangul:
+        return name
+    i = hangul[int(rng.integers(0, len(hangul)))]
+    code = ord(name[i]) - 0xAC00
+    kind = int(rng.integers(0, 3))
+    if kind == 0:     # 모음 바꿈 (ㅔ/ㅐ 같은)
+        code = code // 588 * 588 + (code % 588 // 28 + 1) % 21 * 28 + code % 28
+    elif kind == 1:   # 받침 붙이거나 바꿈
+        code = code - code % 28 + (code % 28 + 4) % 28
+    else:
+        return name[:i] + name[i + 1:]
+    return name[:i] + chr(0xAC00 + code) + name[i + 1:]
+
+
+def brute(fuzzy, index, np, query: str, limit: int):
+    """전체 이름에 편집 거리를 직접 계산 (청크 단위) → 같은 순위 규칙"""
+    pattern = fuzzy.jamo(query)[:fuzzy.MAX_PATTERN]
+    edits = fuzzy.max_edits(len(pattern))
+    dist = np.concatenate([
+        index.distances(pattern, np.arange(lo, min(lo + 50_000, len(index)), dtype=np.int64))
+        for lo in range(0, len(index), 50_000)
+    ])
+    docs = np.flatnonzero(dist <= edits)
+    grams = set(pattern[i:i + 3] for i in range(len(pattern) - 2))
+    shared = np.array([len(grams & set(index.texts[d][i:i + 3] for i in range(len(index.texts[d]) - 2)))
+                       for d in docs.tolist()], dtype=np.int64)
+    similarity = shared / (len(grams) + index.gram_counts[docs] - shared)
+    order = np.lexsort((docs, -similarity, dist[docs]))[:limit]
+    return docs[order]
+
+
+def _latency(index, queries, limit):
+    samples = []
+    for q in queries:
+        t0 = time.perf_counter()
+        index.search(q, limit)
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1], samples[-1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100000,300000,500000")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--verify", type=int, default=20, help="직접 계산과 비교할 질의 수 (크기마다)")
+    args = parser.parse_args()
+
+    import numpy as np
+
+    from app import fuzzy
+
+    rng = np.random.default_rng(1)
+    mismatches = 0
+    for rows in [int(x) for x in args.sizes.split(",") if x.strip()]:
+        names = make_names(rows)
+        t0 = time.perf_counter()
+        index = fuzzy.FuzzyIndex(names)
+        build = time.perf_counter() - t0
+        picks = rng.integers(0, rows, args.queries).tolist()
+        queries = [typo(rng, names[i]) for i in picks]
+        median, p95, worst = _latency(index, queries, args.limit)
+        found = 0
+        for q, i in zip(queries, picks):
+            positions, _ = index.search(q, args.limit)
+            # 같은 이름이 여러 개일 수 있어서 이름으로 비교
+            found += names[i] in {names[p] for p in positions.tolist()}
+        print(f"\n이름 {rows:,}개: build {build * 1000:.0f}ms, 색인 {index.nbytes() / 1024 / 1024:.1f}MB")
+        print(f"  오타 질의 {len(queries)}개: median {median:.2f}ms  p95 {p95:.2f}ms  max {worst:.2f}ms  "
+              f"recall@{args.limit} {found / len(queries) * 100:.1f}%")
+        for q in queries[:3]:
+            positions, dist = index.search(q, 3)
+            print(f"  {q!r} → {[names[p] for p in positions.tolist()]} 거리 {dist.tolist()}")
+
+        checked = 0
+        for q in queries[:args.verify]:
+            pattern = fuzzy.jamo(q)[:fuzzy.MAX_PATTERN]
+            docs, _ = index._candidates(pattern, fuzzy.max_edits(len(pattern)), None)
+            if len(docs) > fuzzy.VERIFY_MAX:
+                continue
+            checked += 1
+            expected = brute(fuzzy, index, np, q, args.limit)
+            got, _ = index.search(q, args.limit)
+            if got.tolist() != expected.tolist():
+                mismatches += 1
+                print(f"  다름: {q!r} {got.tolist()} != {expected.tolist()}")
+        print(f"  전체 직접 계산과 비교: {checked}개 질의")
+
+    # 실제 데이터
+    from app import datasets
+    import app.main  # noqa: F401  (라우터 데이터셋 등록)
+
+    index = datasets.get("restaurant_names")
+    real = datasets.get("restaurant_items").names
+    if real:
+        queries = [typo(rng, real[i]) for i in rng.integers(0, len(real), args.queries).tolist()]
+        median, p95, worst = _latency(index, queries, args.limit)
+        print(f"\n실제 식당/카페 이름 {len(real):,}개: median {median:.2f}ms  p95 {p95:.2f}ms  max {worst:.2f}ms")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+앱 import 시간 벤치마크 (python -X importtime 기반)
+
+    python bench/import_time.py            # import_budget.json 기준 초과 시 exit 1
+    python bench/import_time.py --update   # 현재 측정값으로 budget 갱신
+
+- `import app.main` 을 새 프로세스에서 여러 번 실행해 누적 시간(중앙값)을 측정
+- 서빙 경로에서 import 되면 안 되는 무거운 모듈(pandas/numpy/openai ...)이 sys.modules 에 있으면 실패
+  (importtime 출력은 importlib.import_module 로 불린 모듈(lazy_import)을 최상위 줄로 안 남겨서 sys.modules 로 확인)
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+BUDGET_FILE = Path(__file__).resolve().parent / "import_budget.json"
+TARGET = "app.main"
+
+
+def measure_once(forbidden: list, target: str = TARGET) -> tuple:
+    """(모듈 → 누적 us, import 후 sys.modules 에 있는 forbidden 모듈)"""
+    check = f"import sys, json, {target}; print(json.dumps([m for m in {forbidden!r} if m in sys.modules]))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", check],
+        cwd=BACKEND_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"import {target} failed:\n{proc.stderr[-2000:]}")
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [p.strip() for p in line[len("import time:"):].split("|")]
+        if not parts[0].isdigit():
+            continue
+        modules[parts[2].strip()] = int(parts[1])
+    return modules, json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--update", action="store_true", help="측정값(+여유분)으로 budget 파일 갱신")
+    parser.add_argument("--slack", type=float, default=1.3, help="--update 시 허용 배수")
+    args = parser.parse_args()
+
+    budget = json.loads(BUDGET_FILE.read_text(encoding="utf-8")) if BUDGET_FILE.exists() else {}
+    forbidden = budget.get("forbidden_modules", ["pandas", "numpy", "openai", "requests"])
+
+    measured = [measure_once(forbidden) for _ in range(args.runs)]
+    runs = [modules for modules, _ in measured]
+    total_ms = statistics.median(r.get(TARGET, 0) for r in runs) / 1000
+    print(f"import {TARGET}: median {total_ms:.1f} ms over {args.runs} runs")
+
+    top = sorted(runs[-1].items(), key=lambda kv: kv[1], reverse=True)[:10]
+    for name, us in top:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    if args.update:
+        budget = {"max_ms": round(total_ms * args.slack, 1), "forbidden_modules": forbidden}
+        BUDGET_FILE.write_text(json.dumps(budget, indent=2) + "\n", encoding="utf-8")
+        print(f"budget updated: {budget}")
+        return
+
+    failures = []
+    heavy = sorted({m for _, loaded in measured for m in loaded})
+    if heavy:
+        failures.append(f"heavy modules imported at startup: {heavy}")
+    max_ms = budget.get("max_ms")
+    if max_ms is not None and total_ms > max_ms:
+        failures.append(f"import time {total_ms:.1f} ms > budget {max_ms} ms")
+
+    if failures:
+        for f in failures:
+            print("FAIL:", f)
+        raise SystemExit(1)
+    print("OK" + (f" (budget {max_ms} ms)" if max_ms is not None else ""))
+
+
+if __name__ == "__main__":
+    main()
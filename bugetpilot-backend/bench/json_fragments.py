@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+목록 응답: 객체 생성 → response_model 검증 → jsonable_encoder → json.dumps vs 미리 만든 JSON 조각(app/fragments.py)
+
+    python bench/json_fragments.py [--repeat 5]
+
+1) 같은지 확인
+   - 모든 숙소 × include_images(0,1,2,3,10) 와 get_room: 기존 방식(RoomWithImages → JSONResponse) 바이트 == 조각
+   - /rooms, /restaurants, /attractions, /nearby 여러 요청: 응답 바이트 == 기록해 둔 응답
+     (tests/snapshots/responses.json = 현재 트리 스냅샷, 테스트와 같은 조건 — 식당 원본 CSV/컴파일 스냅샷 없이;
+      기준 커밋과의 비교는 tests/test_responses.py 의 baseline_responses.json)
+2) 넓은 /rooms 응답(전체 숙소, include_images=3)을 만드는 시간 비교
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+sys.path.insert(0, str(BACKEND_ROOT / "tests"))
+
+IMAGE_COUNTS = [0, 1, 2, 3, 10]
+
+
+def _ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+    from fastapi.testclient import TestClient
+    from pydantic import TypeAdapter
+
+    from app import datasets, fragments, snapshot
+    from app.main import app
+    from app.models import RoomWithImages
+    from app.routers import restaurants, rooms
+    from test_responses import REQUESTS, SNAPSHOT_FILE, _key
+
+    # 기준 응답을 기록한 테스트와 같은 조건
+    snapshot.SNAPSHOT_DIR = Path(tempfile.mkdtemp())
+    restaurants.REST_CANDIDATES = []
+    datasets.reload()
+    client = TestClient(app)
+    expected = json.loads(SNAPSHOT_FILE.read_text(encoding="utf-8"))
+    catalog = datasets.get("rooms")
+    store = catalog.store
+    positions = list(range(len(store)))
+
+    def old_rooms(include_images: int) -> List[RoomWithImages]:
+        return [
+            RoomWithImages(**room, images=store.images(pos, include_images) if include_images else [])
+            for pos, room in zip(positions, store.rows(positions))
+        ]
+
+    # 1) 같은지
+    mismatches = 0
+    for n in IMAGE_COUNTS:
+        old = [JSONResponse(jsonable_encoder(r)).body for r in old_rooms(n)]
+        new = rooms._with_images(catalog, positions, n)
+        mismatches += sum(a != b for a, b in zip(old, new))
+    for pos, room in zip(positions, store.rows(positions)):
+        old = JSONResponse(jsonable_encoder(RoomWithImages(**room, images=store.images(pos)))).body
+        new = client.get(f"/rooms/{room['room_id']}").content
+        # room_id 가 겹치면 get_room 은 앞 숙소 → 첫 위치만 비교
+        if catalog.index.slot(room["room_id"]) == pos:
+            mismatches += old != new
+    print(f"rooms: {len(store):,} × include_images {IMAGE_COUNTS} + get_room → mismatches {mismatches}")
+
+    for path, params in REQUESTS:
+        r = client.get(path, params=params)
+        want = expected[_key(path, params)]
+        same = (r.status_code == want["status"] and r.headers.get("content-type") == want["content_type"]
+                and r.content.decode("utf-8") == want["body"])
+        mismatches += not same
+        print(f"{path:>13} {str(params):<70} {len(r.content):>7,} bytes  same={same}")
+
+    # 2) 넓은 응답 만드는 시간 (전체 숙소, include_images=3)
+    adapter = TypeAdapter(List[RoomWithImages])
+
+    def old_path():
+        objs = old_rooms(3)
+        return JSONResponse(jsonable_encoder(adapter.validate_python(objs))).body
+
+    def new_path():
+        return fragments.array(rooms._with_images(catalog, positions, 3))
+
+    assert old_path() == new_path()
+    print(f"\n/rooms 전체 {len(store):,}개 응답 만들기: objects {_ms(old_path, args.repeat):.1f}ms "
+          f"→ fragments {_ms(new_path, args.repeat):.2f}ms")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
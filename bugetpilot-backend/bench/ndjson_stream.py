@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+format=ndjson 스트리밍 vs JSON 배열 한 번에 (app/fragments.py respond())
+
+    python bench/ndjson_stream.py [--scale 50] [--repeat 5]
+
+1) 같은지 확인: /rooms, /restaurants, /attractions 여러 요청
+   - format 없음 == format=json (바이트)
+   - ndjson 줄들 == JSON 배열 원소 ("[" + ",".join(줄) + "]" 가 배열 응답 바이트와 같음), content-type application/x-ndjson
+2) 넓은 /rooms 응답 (전체 숙소 × scale, include_images=3)
+   - 첫 바이트까지 시간 / 전체 시간 / tracemalloc 최대 메모리: 배열 한 번에 vs ndjson generator
+"""
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+REQUESTS = [
+    ("/rooms", {}), ("/rooms", {"city_keyword": "서울", "include_images": 3}), ("/rooms", {"city_keyword": "강릉"}),
+    ("/rooms", {"city_keyword": "부산", "max_price": 90000, "min_rating": 4}), ("/rooms", {"sort": "price", "limit": 30}),
+    ("/restaurants", {}), ("/restaurants", {"city_keyword": "강릉", "limit": 80}),
+    ("/restaurants", {"city_keyword": "마포구", "max_price": 15000, "limit": 200}), ("/restaurants", {"sort": "rating"}),
+    ("/attractions", {}), ("/attractions", {"city_keyword": "제주", "max_price": 0}), ("/attractions", {"city_keyword": "xyz"}),
+]
+
+
+def _run(fn, repeat: int):
+    """(첫 조각까지 ms, 전체 ms, 최대 메모리 bytes) 중앙값"""
+    firsts, totals, peaks = [], [], []
+    for _ in range(repeat):
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        first = None
+        for _chunk in fn():
+            if first is None:
+                first = time.perf_counter() - t0
+        totals.append((time.perf_counter() - t0) * 1000)
+        firsts.append(first * 1000)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return statistics.median(firsts), statistics.median(totals), statistics.median(peaks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    from fastapi.testclient import TestClient
+
+    from app import datasets, fragments
+    from app.main import app
+    from app.routers import rooms
+
+    client = TestClient(app)
+
+    # 1) 같은지
+    mismatches = 0
+    for path, params in REQUESTS:
+        plain = client.get(path, params=params)
+        as_json = client.get(path, params=dict(params, format="json"))
+        nd = client.get(path, params=dict(params, format="ndjson"))
+        lines = nd.content.split(b"\n")
+        same = (plain.content == as_json.content
+                and lines[-1] == b"" and fragments.array(lines[:-1]) == plain.content
+                and nd.headers["content-type"] == "application/x-ndjson"
+                and nd.headers.get("X-Next-Cursor") == plain.headers.get("X-Next-Cursor"))
+        mismatches += not same
+        print(f"{path:>13} {str(params):<60} {len(lines) - 1:>5} rows  same={same}")
+    bad = client.get("/rooms", params={"format": "xml"}).status_code
+    print(f"format=xml → {bad}")
+    mismatches += bad != 422
+
+    # 2) 넓은 응답
+    catalog = datasets.get("rooms")
+    positions = list(range(len(catalog.store))) * args.scale
+
+    def whole():
+        yield fragments.array(rooms._with_images(catalog, positions, 3))
+
+    def stream():
+        return fragments.ndjson_lines(rooms._iter_with_images(catalog, positions, 3))
+
+    print(f"\n/rooms {len(positions):,}개 (include_images=3)")
+    for name, fn in (("json array", whole), ("ndjson", stream)):
+        first, total, peak = _run(fn, args.repeat)
+        print(f"  {name:<10} first byte {first:8.2f}ms  total {total:8.1f}ms  peak {peak / 1024 / 1024:8.2f}MB")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
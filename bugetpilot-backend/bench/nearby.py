@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+주변 검색: 전체 점 haversine(벡터화) vs 격자 인덱스(app/spatial.py GridIndex)
+
+    python bench/nearby.py [--points 1000000] [--queries 50]
+
+1) 합성 데이터: 국내 범위(위도 33~38.6, 경도 124.5~130.9)에 점 N개 (1%는 좌표 없음)
+   - 반경 0.5/2/10/50km 질의마다 두 방식의 결과(위치, 거리순)가 같은지 확인 + 질의 시간 중앙값
+2) 실제 데이터: /nearby 응답 == 전체 POI 를 직접 거리 계산해서 고른 결과 (몇 개 기준점)
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+RADII = [0.5, 2.0, 10.0, 50.0]
+ORIGINS = [(37.5665, 126.9780), (35.8742, 128.5907), (35.1796, 129.0756), (33.4996, 126.5312), (37.7519, 128.8761)]
+
+
+def _brute(geo, np, lat, lng, lat0, lng0, radius_km):
+    dist = geo.haversine_km(lat, lng, lat0, lng0)
+    hit = np.flatnonzero(dist <= radius_km)
+    order = np.lexsort((hit, dist[hit]))
+    return hit[order], dist[hit][order]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    import numpy as np
+
+    from app import geo, spatial
+
+    rng = np.random.default_rng(0)
+    lat = rng.uniform(33.0, 38.6, args.points)
+    lng = rng.uniform(124.5, 130.9, args.points)
+    lat[rng.random(args.points) < 0.01] = np.nan
+
+    t0 = time.perf_counter()
+    grid = spatial.GridIndex(lat, lng)
+    build_ms = (time.perf_counter() - t0) * 1000
+    nbytes = grid.keys.nbytes + grid.positions.nbytes + grid.lat.nbytes + grid.lng.nbytes
+    print(f"points {args.points:,} (indexed {len(grid):,}), cell {grid.cell_deg}°: "
+          f"build {build_ms:.0f}ms, {nbytes / 1024 / 1024:.1f}MB")
+
+    # 1) 합성 데이터
+    mismatches = 0
+    origins = np.column_stack([rng.uniform(33.2, 38.4, args.queries), rng.uniform(124.7, 130.7, args.queries)])
+    print(f"{'radius':>8} {'hits':>8} {'brute':>10} {'grid':>10}")
+    for radius in RADII:
+        brute_ms, grid_ms, hits = [], [], []
+        for lat0, lng0 in origins.tolist():
+            t0 = time.perf_counter()
+            expected = _brute(geo, np, lat, lng, lat0, lng0, radius)
+            brute_ms.append((time.perf_counter() - t0) * 1000)
+            t0 = time.perf_counter()
+            got = grid.within(lat0, lng0, radius)
+            grid_ms.append((time.perf_counter() - t0) * 1000)
+            mismatches += not (np.array_equal(got[0], expected[0]) and np.array_equal(got[1], expected[1]))
+            hits.append(len(got[0]))
+        print(f"{radius:>6}km {statistics.median(hits):>8.0f} {statistics.median(brute_ms):>8.2f}ms "
+              f"{statistics.median(grid_ms):>8.3f}ms")
+
+    # 2) 실제 데이터 /nearby
+    from fastapi.testclient import TestClient
+
+    from app import datasets
+    from app.main import app
+    from app.routers import nearby
+
+    client = TestClient(app)
+    client.get("/nearby", params={"lat": 37.5, "lng": 127.0})
+    catalog = datasets.get("nearby")
+    all_lat = np.full(len(catalog.kinds), np.nan)
+    all_lng = np.full(len(catalog.kinds), np.nan)
+    all_lat[catalog.grid.positions], all_lng[catalog.grid.positions] = catalog.grid.lat, catalog.grid.lng
+    for lat0, lng0 in ORIGINS:
+        for radius in (1.0, 5.0):
+            points, dist = _brute(geo, np, all_lat, all_lng, lat0, lng0, radius)
+            expected = list(nearby._rows(catalog, points[:100], dist[:100]))
+            got = client.get("/nearby", params={"lat": lat0, "lng": lng0, "radius_km": radius}).content
+            same = got == b"[" + b",".join(expected) + b"]"
+            mismatches += not same
+            print(f"/nearby ({lat0}, {lng0}) {radius}km: {len(expected)} rows  same={same}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+city_keyword 검색: str.contains 전체 스캔 vs n-gram 역색인(app/ngram.py), 코퍼스 크기별
+
+    python bench/ngram_index.py --sizes 10000,100000,300000
+
+- 가짜 주소(시/구/동/도로명/번지 조합)로 코퍼스를 만들고 크기별로
+  빌드 시간, posting 메모리, 키워드별 지연시간(limit=80 / 전체 매치) 출력
+- 결과가 str.contains(case=False) 와 같은지 확인
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+CITIES = [
+    "강원특별자치도 강릉시", "강원특별자치도 속초시", "부산광역시 해운대구", "부산광역시 중구", "서울특별시 마포구",
+    "서울특별시 성동구", "서울특별시 강남구", "제주특별자치도 제주시", "전라남도 여수시", "경상북도 경주시",
+    "광주광역시 동구", "대구광역시 중구", "인천광역시 연수구", "경기도 수원시 팔달구", "충청남도 천안시 동남구",
+]
+ROADS = ["중앙로", "해안로", "문화로", "번영로", "시청로", "역전로", "공원로", "대학로", "항구길", "시장길"]
+KEYWORDS = ["강릉", "부산", "마포구", "제주", "해운대구", "여수시", "중앙로 1", "없는지역"]
+
+
+def make_addresses(rows: int):
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    city = rng.integers(0, len(CITIES), rows)
+    road = rng.integers(0, len(ROADS), rows)
+    num = rng.integers(1, 999, rows)
+    sub = rng.integers(1, 80, rows)
+    return [
+        f"{CITIES[c]} {ROADS[r]}{s}번길 {n}" for c, r, s, n in zip(city.tolist(), road.tolist(), sub.tolist(), num.tolist())
+    ]
+
+
+def _ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,300000")
+    parser.add_argument("--limit", type=int, default=80)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    import pandas as pd
+    from app.ngram import NgramIndex
+
+    for rows in [int(x) for x in args.sizes.split(",")]:
+        addrs = make_addresses(rows)
+        s = pd.Series(addrs)
+        t0 = time.perf_counter()
+        index = NgramIndex(addrs)
+        build = time.perf_counter() - t0
+        mem = sum(p.nbytes for p in index.postings.values()) / 1024 / 1024
+        print(f"\n== rows={rows:,}: build {build:.1f}s, {len(index.postings):,} grams, postings {mem:.1f} MB ==")
+        print(f"{'keyword':>10} {'matches':>8} {'scan':>9} {'index@' + str(args.limit):>10} {'index all':>10} {'same':>5}")
+        for kw in KEYWORDS:
+            expected = s[s.str.contains(kw, case=False, na=False)]
+            same = index.search(kw) == expected.index.tolist()
+            scan = _ms(lambda: s[s.str.contains(kw, case=False, na=False)].head(args.limit), args.repeat)
+            top = _ms(lambda: index.search(kw, args.limit), args.repeat)
+            full = _ms(lambda: index.search(kw), args.repeat)
+            print(f"{kw:>10} {len(expected):>8} {scan:7.2f}ms {top:8.2f}ms {full:8.2f}ms {str(same):>5}")
+
+
+if __name__ == "__main__":
+    main()
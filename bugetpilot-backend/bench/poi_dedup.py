@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+식당 + 카페 통합 POI: 로드 시 (상호명, 건물 주소) 중복 병합 vs 예전 요청마다 이름 중복 제거
+
+    python bench/poi_dedup.py [--repeat 50]
+
+1) 같은지 확인: 통합 POI 번호(RestaurantItems.poi_codes) == 행마다 파이썬으로 만든 키
+   (상호명 소문자 + 공백/문장부호 제거, 주소는 시군구 코드 + 도로명 + 건물번호)로 묶은 것
+   + 형식이 다른 같은 건물 주소 예시가 같은 키인지
+2) 로드 시 병합 단계 시간, POI/중복/양쪽 출처 개수, 예전 규칙(이름만)이면 숨던 지점 수
+3) 요청마다: 예전 np.unique 이름 중복 제거 vs 대표 행 마스크 (키워드별 검색 결과 전체)
+"""
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+KEYWORDS = [None, "서울", "부산", "해운대", "중구", "제주", "치킨"]
+SAME_BUILDING = [
+    ("서울특별시 중구 세종대로 110 서울특별시 중구 태평로1가 31",          # 식당: 도로명 + 지번
+     "서울특별시 중구 서울특별시 중구 세종대로 110, 1층 (태평로1가)"),      # 카페: 시도 시군구 + 도로명, 층
+    ("대구광역시 중구 큰장로26길 25-3 대구광역시 중구 대신동 115",
+     "대구광역시 중구 대구광역시 중구 큰장로26길 25-3, 서문시장 2지구 (대신동)"),
+]
+DIFFERENT_BUILDING = [
+    ("서울특별시 중구 세종대로 110", "서울특별시 중구 세종대로 112"),
+    ("서울특별시 중구 세종대로 110", "부산광역시 중구 세종대로 110"),
+    ("서울특별시 종로구 종로5가 12", "서울특별시 종로구 종로 5"),
+]
+_ROAD = re.compile(r"(?:^|\s)([가-힣0-9·.]+(?:로|길))\s+(\d+(?:-\d+)?)(?=[\s,(]|$)")
+
+
+def _ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def _key(name, addr, sido, sgg):
+    """행 하나 → 통합 키 (파이썬으로)"""
+    if name is None:
+        return None
+    name_key = re.sub(r"[\W_]+", "", name.lower())
+    if not name_key:
+        return None
+    addr = addr or ""
+    region = sgg if sgg > 0 else sido
+    m = _ROAD.search(addr)
+    if m and region > 0:
+        return name_key, f"{region} {m.group(1)} {m.group(2)}"
+    return name_key, re.sub(r"[\W_]+", "", addr.lower())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    import numpy as np
+    import pandas as pd
+
+    from app import address, datasets
+    import app.main  # noqa: F401  (라우터 데이터셋 등록)
+    from app.routers import restaurants as router
+
+    mismatches = 0
+
+    # 1) 주소 형식 예시
+    for pairs, same in ((SAME_BUILDING, True), (DIFFERENT_BUILDING, False)):
+        for a, b in pairs:
+            keys = address.road_keys([a, b], address.parse([a, b])).tolist()
+            ok = (keys[0] == keys[1]) == same
+            mismatches += not ok
+            print(f"{'같은' if same else '다른'} 건물 {ok}: {keys}")
+
+    restaurants, cafes = datasets.get("restaurants"), datasets.get("cafes")
+    items = datasets.get("restaurant_items")
+    rest_df = restaurants.search(None, len(restaurants))
+    cafe_df = cafes.search(None, len(cafes))
+    addrs = rest_df["_addr"].astype(str).tolist() + cafe_df["_addr"].astype(str).tolist()
+    codes = pd.concat([restaurants.codes, cafes.codes], ignore_index=True)
+    names = [it[0] if it else None for it in items.items]
+
+    # 행마다 파이썬 키 → 처음 나온 순서 번호
+    numbering = {}
+    expected = []
+    for name, addr, sido, sgg in zip(names, addrs, codes["_sido"].tolist(), codes["_sgg"].tolist()):
+        key = _key(name, addr, sido, sgg)
+        expected.append(-1 if key is None else numbering.setdefault(key, len(numbering)))
+    same = np.array_equal(np.asarray(expected, dtype=np.int64), items.poi_codes)
+    mismatches += not same
+    print(f"\n통합 POI 번호 == 행마다 파이썬 키: {same}")
+
+    # 2) 로드 시 병합 단계
+    addr_series = pd.Series(addrs, dtype=object)
+    load_ms = _ms(lambda: router._poi_codes(items.name_codes, items.names, addr_series, codes), max(1, args.repeat // 10))
+    n_pois = len(items.pois)
+    named = int((items.poi_codes >= 0).sum())
+    by_name = len(set(n for n in names if n))
+    print(f"행 {len(items.items):,}개 (이름 있는 {named:,}) → 통합 POI {n_pois:,}개, 병합된 중복 {named - n_pois:,}, "
+          f"식당+카페 양쪽 {int((items.sources == 3).sum()):,}")
+    print(f"예전 규칙(이름만 같으면 1개)이면 {by_name:,}개 → 다른 주소 지점 {n_pois - by_name:,}개가 숨었음")
+    print(f"병합 단계 (상호명/주소 키 + factorize): {load_ms:.1f}ms (로드 시 1번)")
+
+    # 3) 요청마다 드는 비용: 검색 결과 전체에서
+    def old_dedup(positions):
+        positions = positions[items.name_codes[positions] >= 0]
+        _, first = np.unique(items.name_codes[positions], return_index=True)
+        return positions[np.sort(first)]
+
+    print(f"\n{'keyword':<10} {'rows':>8} {'np.unique 이름':>16} {'대표 행 마스크':>16}")
+    for kw in KEYWORDS:
+        positions = router._matches(restaurants, cafes, items, kw, len(restaurants) + len(cafes)) if kw \
+            else np.arange(len(items.items), dtype=np.int64)
+        old_ms = _ms(lambda: old_dedup(positions), args.repeat)
+        new_ms = _ms(lambda: items.merged(positions), args.repeat)
+        print(f"{kw or '-':<10} {len(positions):>8,} {old_ms:>14.3f}ms {new_ms:>14.3f}ms")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+워커별 메모리 비교: uvicorn --workers (워커마다 로드) vs python -m app.prefork (마스터 1회 로드 후 fork)
+
+    python bench/prefork_rss.py --workers 4
+
+- 두 모드로 서버를 띄우고 /ready 가 200이 될 때까지 대기, 목록 API를 몇 번 호출한 뒤
+  /proc/<pid>/smaps_rollup 에서 워커별 Rss / Pss / Shared 를 읽어 출력
+- Pss(비례 배분 RSS)의 합이 실제 노드 메모리 사용량에 가까움
+"""
+import argparse
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from pathlib import Path
+from typing import Dict, List
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+WARM_PATHS = ["/rooms?city_keyword=서울", "/restaurants?city_keyword=강릉", "/attractions?city_keyword=부산"]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _children(pid: int) -> List[int]:
+    out = []
+    for task in Path(f"/proc/{pid}/task").iterdir():
+        try:
+            out += [int(c) for c in (task / "children").read_text().split()]
+        except OSError:
+            continue
+    return out
+
+
+def _smaps(pid: int) -> Dict[str, int]:
+    fields = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        key, _, rest = line.partition(":")
+        parts = rest.split()
+        if parts and parts[0].isdigit():
+            fields[key] = int(parts[0])  # kB
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "shared": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+    }
+
+
+def _get(url: str, timeout: float = 5.0) -> int:
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as r:
+            r.read()
+            return r.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except OSError:
+        return 0
+
+
+def run_mode(name: str, cmd: List[str], port: int, workers: int) -> List[Dict[str, int]]:
+    proc = subprocess.Popen(cmd, cwd=BACKEND_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.time() + 120
+        # 워커 수만큼 /ready 200이 연속으로 나와야 모든 워커가 준비됐다고 봄
+        while time.time() < deadline:
+            if all(_get(base + "/ready") == 200 for _ in range(workers * 3)):
+                break
+            time.sleep(0.5)
+        else:
+            raise SystemExit(f"{name}: server not ready")
+
+        for _ in range(workers * 5):
+            for path in WARM_PATHS:
+                _get(base + urllib.parse.quote(path, safe="/?=&"))
+
+        pids = _children(proc.pid)
+        # uvicorn --workers 는 multiprocessing 보조 프로세스가 섞여 있을 수 있어 smaps 읽히는 것만
+        stats = []
+        for pid in pids:
+            try:
+                stats.append({"pid": pid, **_smaps(pid)})
+            except OSError:
+                continue
+        master = {"pid": proc.pid, **_smaps(proc.pid)}
+        return [master] + stats
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def _print(name: str, stats: List[Dict[str, int]]) -> None:
+    master, workers = stats[0], stats[1:]
+    print(f"\n== {name} ==")
+    print(f"{'pid':>8} {'role':>7} {'RSS MB':>8} {'PSS MB':>8} {'Shared MB':>10}")
+    for role, s in [("master", master)] + [("worker", w) for w in workers]:
+        print(f"{s['pid']:>8} {role:>7} {s['rss'] / 1024:8.1f} {s['pss'] / 1024:8.1f} {s['shared'] / 1024:10.1f}")
+    total_pss = sum(s["pss"] for s in stats) / 1024
+    print(f"total PSS: {total_pss:.1f} MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    port = _free_port()
+    before = run_mode(
+        "uvicorn --workers",
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--workers", str(args.workers)],
+        port,
+        args.workers,
+    )
+    _print(f"before: uvicorn --workers {args.workers}", before)
+
+    port = _free_port()
+    after = run_mode(
+        "prefork",
+        [sys.executable, "-m", "app.prefork", "--host", "127.0.0.1", "--port", str(port), "--workers", str(args.workers)],
+        port,
+        args.workers,
+    )
+    _print(f"after: python -m app.prefork --workers {args.workers}", after)
+
+
+if __name__ == "__main__":
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        sys.exit("needs Linux /proc/<pid>/smaps_rollup")
+    main()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+기준(변경 전) 커밋에서 API 응답을 기록 → tests/snapshots/baseline_responses.json
+
+    python bench/record_baseline.py [--ref <커밋>]      # 기본: 저장소 첫 커밋(baseline)
+
+- 기준 커밋을 임시 git worktree 로 꺼내 그 트리의 app.main 으로 요청을 보냄
+  (저장소 밖 파일은 worktree 에 없으므로 식당 원본 CSV/컴파일 스냅샷 없이 — 테스트와 같은 조건)
+- 요청 목록: tests/test_responses.py 의 BASELINE_REQUESTS (기준 커밋에도 있던 경로/파라미터만)
+- 기록: 본문 바이트 + content-type + X-Next-Cursor + status
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT / "tests"))
+
+# worktree 안에서 실행: stdin 으로 요청 목록을 받아 응답을 argv[1] 파일(JSON)로 (stdout 은 앱 로그가 섞임)
+_RECORDER = r"""
+import json, sys
+sys.path.insert(0, ".")
+from fastapi.testclient import TestClient
+from app.main import app
+
+out = {}
+with TestClient(app) as client:
+    for key, path, params in json.load(sys.stdin):
+        r = client.get(path, params=params)
+        out[key] = {
+            "status": r.status_code,
+            "content_type": r.headers.get("content-type"),
+            "next_cursor": r.headers.get("x-next-cursor"),
+            "body": r.content.decode("utf-8"),
+        }
+open(sys.argv[1], "w", encoding="utf-8").write(json.dumps(out, ensure_ascii=False))
+"""
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(["git", *args], cwd=BACKEND_ROOT, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ref", default=None, help="기준 커밋 (기본: 첫 커밋)")
+    args = parser.parse_args()
+
+    from test_responses import BASELINE_FILE, BASELINE_REQUESTS, _key
+
+    ref = args.ref or _git("rev-list", "--max-parents=0", "HEAD").splitlines()[0]
+    repo_root = Path(_git("rev-parse", "--show-toplevel"))
+    backend_rel = BACKEND_ROOT.relative_to(repo_root)
+    requests = [[_key(p, q), p, q] for p, q in BASELINE_REQUESTS]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tree = Path(tmp) / "baseline"
+        out_file = Path(tmp) / "responses.json"
+        _git("worktree", "add", "--detach", str(tree), ref)
+        try:
+            proc = subprocess.run(
+                [sys.executable, "-c", _RECORDER, str(out_file)],
+                cwd=tree / backend_rel,
+                input=json.dumps(requests, ensure_ascii=False),
+                capture_output=True,
+                text=True,
+            )
+            out = json.loads(out_file.read_text(encoding="utf-8")) if proc.returncode == 0 else None
+        finally:
+            _git("worktree", "remove", "--force", str(tree))
+
+    if out is None:
+        print(proc.stderr)
+        print(f"[BASELINE] {ref[:7]} 에서 응답을 기록하지 못함")
+        sys.exit(1)
+
+    BASELINE_FILE.write_text(json.dumps(out, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+    print(f"[BASELINE] {ref[:7]} → {BASELINE_FILE.relative_to(BACKEND_ROOT)} ({len(out)} 요청)")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
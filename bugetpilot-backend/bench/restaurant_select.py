@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+/restaurants 결과 만들기 (limit=200): 기존 iterrows + add_row vs 컬럼 배열 선택(RestaurantItems.select)
+
+    python bench/restaurant_select.py [--limit 200] [--repeat 20]
+
+1) 같은지 확인: 일반 검색 경로(_select → 미리 만든 조각) == 행마다 파이썬으로 계산한 결과
+   (식당 다음 카페, 파일 순서, 통합 POI 중복 제거 → max_price 이하 → 앞 limit개 = 가격 필터가 limit 보다 먼저)
+2) 시간: 키워드 × max_price 마다
+   - iterrows: 예전 list_restaurants (str.contains → head(limit).iterrows() → add_row → dict)
+   - columnar: 검색 행 번호 → 위치 배열 → 대표 행/가격 마스크 → 조각 (응답 바이트까지)
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+KEYWORDS = [None, "서울", "성수", "해운대", "중구", "치킨", "xyz없음"]
+MAX_PRICES = [None, 10000, 14000]
+
+
+def _ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def _iterrows(restaurants, kw, max_price, limit):
+    """예전 list_restaurants 본문 (max_price 가 limit 뒤에 적용되던 방식 그대로)"""
+    results = []
+    seen = set()
+    rest_df = restaurants.search(None, len(restaurants))
+
+    def add_row(name, addr, type_label, base_price, image, idx):
+        if not name:
+            return
+        name = name.strip()
+        if not name or name in seen:
+            return
+        seen.add(name)
+        price = base_price + (idx % 5) * 2000
+        if max_price is not None and price > max_price:
+            return
+        addr = (addr or "").strip()
+        results.append({
+            "id": f"rest-{len(results)}",
+            "name": name,
+            "type": type_label,
+            "location": addr[:80],
+            "price": price,
+            "description": f"{type_label}입니다. {addr[:50]}",
+            "image": image,
+            "rating": round(3.5 + (idx % 15) / 10, 1),
+            "reviewCount": 50 + (idx % 200),
+        })
+
+    def run(df_rest, df_cafe):
+        results.clear()
+        seen.clear()
+        df = df_rest
+        if kw:
+            df = df[df["_addr"].astype(str).str.contains(kw, na=False, case=False)]
+        for i, row in df.head(limit).iterrows():
+            add_row(str(row.get("사업장명", "")), str(row.get("_addr", "")),
+                    str(row.get("업태구분명", "식당") or "식당"), 12000, "", int(i))
+        if len(results) < limit:
+            df = df_cafe
+            if kw:
+                df = df[df["_addr"].astype(str).str.contains(kw, na=False, case=False)]
+            for i, row in df.head(limit - len(results)).iterrows():
+                add_row(str(row.get("사업장명", "")), str(row.get("_addr", "")), "카페", 8000, "", int(i) + 10000)
+        return results[:limit]
+
+    return rest_df, run
+
+
+def _reference(items, restaurants, cafes, kw, max_price, limit):
+    """행마다 파이썬: 검색 결과 전체 → 통합 POI 중복 제거 → max_price → 앞 limit개"""
+    import numpy as np
+
+    positions = np.concatenate([
+        items.restaurant_positions(restaurants.search(kw, len(restaurants)).index),
+        items.cafe_positions(cafes.search(kw, len(cafes)).index),
+    ])
+    out, seen = [], set()
+    for p in positions.tolist():
+        poi = int(items.poi_codes[p])
+        if poi < 0 or poi in seen:
+            continue
+        seen.add(poi)
+        item = items.items[p]
+        if max_price is None or item[1] <= max_price:
+            out.append(item[2])
+    return out[:limit]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    from app import datasets, fragments
+    import app.main  # noqa: F401  (라우터 데이터셋 등록)
+    from app.routers import restaurants as router
+
+    restaurants, cafes = datasets.get("restaurants"), datasets.get("cafes")
+    items = datasets.get("restaurant_items")
+    cafe_df = cafes.search(None, len(cafes))
+    print(f"식당 {len(restaurants):,}행, 카페 {len(cafes):,}행, limit={args.limit}")
+
+    def columnar(kw, max_price):
+        positions = router._select(restaurants, cafes, items, kw, max_price, args.limit)
+        frags = (fragments.with_id(f, f"rest-{i}") for i, f in enumerate(items.bodies(positions)))
+        return b"[" + b",".join(frags) + b"]"
+
+    mismatches = 0
+    print(f"{'keyword':<10} {'max_price':>9} {'iterrows':>16} {'columnar':>16}")
+    for kw in KEYWORDS:
+        for max_price in MAX_PRICES:
+            expected = _reference(items, restaurants, cafes, kw, max_price, args.limit)
+            got = items.bodies(router._select(restaurants, cafes, items, kw, max_price, args.limit))
+            mismatches += got != expected
+
+            rest_df, run = _iterrows(restaurants, kw, max_price, args.limit)
+            old_rows = len(run(rest_df, cafe_df))
+            old_ms = _ms(lambda: run(rest_df, cafe_df), max(1, args.repeat // 4))
+            new_ms = _ms(lambda: columnar(kw, max_price), args.repeat)
+            print(f"{kw or '-':<10} {max_price or '-':>9} {old_ms:>8.2f}ms {old_rows:>3}행 "
+                  f"{new_ms:>8.3f}ms {len(got):>3}행")
+    print("결과 불일치:", mismatches)
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
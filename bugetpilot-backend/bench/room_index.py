@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+/rooms 필터: 리스트 컴프리헨션 3번 + next(...) 선형 탐색 vs RoomIndex(app/room_index.py)
+
+    python bench/room_index.py --sizes 100000,300000
+
+- 가짜 숙소(Room)를 크기별로 만들어 list_rooms 와 같은 조합(키워드/max_price/min_rating)의
+  필터 지연시간과 get_room(room_id) 지연시간을 비교
+- 두 방식의 결과(위치 리스트)가 같은지도 확인
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+CITIES = [
+    "강원특별자치도 강릉시 교동", "강원특별자치도 속초시 조양동", "부산광역시 해운대구 우동", "서울특별시 마포구 서교동",
+    "서울특별시 성동구 성수동2가", "제주특별자치도 제주시 연동", "전라남도 여수시 종화동", "경상북도 울릉군 울릉읍",
+]
+# (city_keyword, max_price, min_rating)
+CASES = [
+    ("강릉", None, None),
+    (None, 60000, None),
+    (None, None, 4.8),
+    ("부산", 60000, None),
+    ("마포구", 150000, 4.5),
+    ("울릉", 40000, 4.9),
+    ("서교동", None, 4.0),
+    (None, 30000, 4.9),
+    ("해운대", 1000000, 0.0),
+]
+
+
+def make_rooms(rows: int):
+    import numpy as np
+    from app.models import Room
+
+    rng = np.random.default_rng(0)
+    city = rng.integers(0, len(CITIES), rows)
+    # 울릉은 드문 지역으로 (0.5%)
+    city = np.where((city == 7) & (rng.random(rows) > 0.04), 0, city)
+    price = rng.integers(20, 400, rows) * 1000
+    rating = np.round(rng.uniform(3.0, 5.0, rows), 2)
+    reviews = rng.integers(0, 500, rows)
+    rooms = []
+    for i in range(rows):
+        rooms.append(Room.model_construct(
+            room_id=i + 1, host_id=1, title=f"숙소 {i}", description="", address=f"{CITIES[city[i]]} {i % 300}",
+            lat=0.0, lng=0.0, bathroom_count=1, bed_count=1, bedroom_count=1, headcount_capacity=2,
+            cleaning_fee=0, daily_price=int(price[i]), lodging_tax_ratio=0.0, sale_ratio=0.0, service_fee=0,
+            rating_star_score=float(rating[i]), review_count=int(reviews[i]),
+        ))
+    return rooms
+
+
+def _ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100000,300000")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    from app import address
+    from app.ngram import NgramIndex
+    from app.room_index import RoomIndex
+
+    for rows in [int(x) for x in args.sizes.split(",")]:
+        rooms = make_rooms(rows)
+        pos_of = {id(r): i for i, r in enumerate(rooms)}
+        t0 = time.perf_counter()
+        codes = address.parse([r.address for r in rooms])
+        search = NgramIndex([r.address for r in rooms], [r.title for r in rooms])
+        index = RoomIndex([r.room_id for r in rooms], [r.daily_price for r in rooms],
+                          [r.rating_star_score for r in rooms], codes)
+        build = time.perf_counter() - t0
+        print(f"\n== rooms={rows:,}: build(codes+ngram+index) {build:.1f}s ==")
+        print(f"{'case':>28} {'rows':>7} {'lists':>9} {'index':>9} {'same':>5}")
+
+        def keyword_positions(kw):
+            ref = address.resolve(kw)
+            return index.region(ref) if ref is not None else search.search(kw)
+
+        for kw, mp, mr in CASES:
+            def old():
+                data = rooms
+                if kw:
+                    key = kw.lower()
+                    data = [r for r in data if key in r.address.lower() or key in r.title.lower()]
+                if mp is not None:
+                    data = [r for r in data if r.daily_price <= mp]
+                if mr is not None:
+                    data = [r for r in data if r.rating_star_score >= mr]
+                return data
+
+            def new():
+                positions = keyword_positions(kw) if kw else None
+                return [rooms[i] for i in index.filter(positions, max_price=mp, min_rating=mr).tolist()]
+
+            expected = [pos_of[id(r)] for r in old()]
+            same = [pos_of[id(r)] for r in new()] == expected
+            label = f"{kw or '-'}/{mp or '-'}/{mr if mr is not None else '-'}"
+            print(f"{label:>28} {len(expected):>7} {_ms(old, args.repeat):7.2f}ms {_ms(new, args.repeat):7.2f}ms {str(same):>5}")
+
+        ids = [rows // 2, rows, rows + 1]
+        linear = _ms(lambda: [next((r for r in rooms if r.room_id == rid), None) for rid in ids], args.repeat) / len(ids)
+        slot = _ms(lambda: [index.slot(rid) for rid in ids], args.repeat) / len(ids)
+        print(f"{'get_room':>28} {'':>7} {linear:7.2f}ms {slot * 1000:7.2f}us")
+
+
+if __name__ == "__main__":
+    main()
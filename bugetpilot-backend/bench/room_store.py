@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+숙소 메모리: pydantic Room 리스트 + RoomImage 리스트 + image_map vs RoomStore(app/room_store.py)
+            vs RoomCatalog 전체 (저장소 + 검색/정렬 인덱스 + 숙소별 응답 조각 + 지역 페이지)
+
+    python bench/room_store.py [--scale 10]
+
+- dummy_rooms.csv(+ dummy_room_images.csv) 와 문화체육관광부 호텔 CSV 테이블로 각각 두 표현을 만들고
+  tracemalloc 으로 잡힌 메모리(파이썬 객체 + NumPy 버퍼)를 비교
+- store/catalog 열은 tracemalloc 값 (같은 데이터로 한 번 빌드해서 지연 import/캐시를 채운 뒤 잼)
+- nbytes 는 저장소 배열 크기만, fragments 는 rooms.fragment_bytes (숙소별 응답 조각)
+- 서빙 시 실제로 상주하는 것은 catalog 열 → objects(List[Room]) 와 비교할 값
+- --scale N: 테이블을 N배로 복제해서 숙소 수가 늘 때의 차이도 확인
+"""
+import argparse
+import sys
+import tracemalloc
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def _measure(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, after - before
+
+
+def _old(df_rooms, df_images):
+    from app.models import Room, RoomImage
+
+    rooms = [Room(**rec) for rec in df_rooms.to_dict("records")]
+    room_images, image_map = [], {}
+    for rid, url in zip(df_images["room_id"].tolist(), df_images["image_url"].tolist()):
+        room_images.append(RoomImage(room_id=int(rid), image_url=url))
+        image_map.setdefault(int(rid), []).append(url)
+    return rooms, room_images, image_map
+
+
+def _new(df_rooms, df_images):
+    from app.room_store import RoomStore
+
+    return RoomStore(df_rooms, df_images)
+
+
+def _catalog(df_rooms, df_images):
+    from app.routers import rooms
+
+    return rooms.build_catalog(df_rooms, df_images)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=1)
+    args = parser.parse_args()
+
+    import pandas as pd
+    from app.routers import rooms as rooms_router
+
+    datasets = {"dummy": rooms_router._dummy_room_tables()}
+    culture = rooms_router._culture_room_tables()
+    if culture is not None:
+        datasets["culture"] = culture
+    else:
+        print("(문화 호텔 CSV 없음 → dummy 만)")
+
+    print(f"{'dataset':>8} {'rooms':>8} {'images':>8} {'objects':>10} {'store':>10} {'nbytes':>10} "
+          f"{'catalog':>10} {'fragments':>10} {'per room obj/store/catalog':>28}")
+    for name, (df_rooms, df_images, _) in datasets.items():
+        if args.scale > 1:
+            df_rooms = pd.concat([df_rooms] * args.scale, ignore_index=True)
+            df_images = pd.concat([df_images] * args.scale, ignore_index=True)
+        (old_rooms, _, _), old_bytes = _measure(lambda: _old(df_rooms, df_images))
+        store, new_bytes = _measure(lambda: _new(df_rooms, df_images))
+        assert store.rows(range(len(store))) == [r.model_dump() for r in old_rooms]
+        _catalog(df_rooms, df_images)
+        catalog, catalog_bytes = _measure(lambda: _catalog(df_rooms, df_images))
+        n = max(len(store), 1)
+        print(f"{name:>8} {len(df_rooms):>8,} {len(df_images):>8,} {old_bytes / 1024 / 1024:8.2f}MB "
+              f"{new_bytes / 1024 / 1024:8.2f}MB {store.nbytes / 1024 / 1024:8.2f}MB "
+              f"{catalog_bytes / 1024 / 1024:8.2f}MB {rooms_router.fragment_bytes(catalog) / 1024 / 1024:8.2f}MB "
+              f"{old_bytes / n:9.0f}B / {new_bytes / n:5.0f}B / {catalog_bytes / n:5.0f}B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+저장소 백엔드 비교: pandas(str.contains 전체 스캔) vs sqlite(FTS5 trigram / instr)
+
+    python bench/storage_backends.py --rows 1000000
+
+- 식당 테이블 모양(사업장명, _addr, 업태구분명)의 가짜 데이터를 만들어 두 백엔드에 올리고
+  목록 API와 같은 호출(search(keyword, limit))의 지연시간(p50/p95)을 비교
+- 두 백엔드의 결과(index + 값)가 같은지도 확인
+- 앱 전체를 백엔드별로 따로 띄워 warm-up 후 상주 메모리(RSS) 비교 (--no-app-memory 로 생략)
+  sqlite 여도 라우터가 로드 시 전체 행을 읽어 색인/응답 조각을 메모리에 만들므로 메모리 이득은 없음
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+CITIES = [
+    ("강원특별자치도 강릉시", "교동"), ("부산광역시 해운대구", "우동"), ("서울특별시 마포구", "서교동"),
+    ("제주특별자치도 제주시", "연동"), ("서울특별시 성동구", "성수동2가"), ("광주광역시 동구", "충장로"),
+    ("경상북도 경주시", "황오동"), ("전라남도 여수시", "종화동"), ("경기도 가평군", "가평읍"),
+]
+KEYWORDS = ["강릉", "부산", "마포구", "제주", "성수동", "해운대구", "여수시", "없는지역", None]
+TYPES = ["한식", "중국식", "일식", "경양식", "분식", "기타"]
+
+
+def make_frame(rows: int):
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    city = rng.integers(0, len(CITIES), rows)
+    # 조회 대상 지역이 드문 경우도 보도록 1% 만 '여수시' 유지, 나머지는 다른 지역으로
+    city = np.where((city == 7) & (rng.random(rows) > 0.01), 8, city)
+    num = rng.integers(1, 999, rows)
+    addr = [f"{CITIES[c][0]} 중앙로 {n} ({CITIES[c][1]})" for c, n in zip(city, num)]
+    return pd.DataFrame({
+        "사업장명": [f"가게{i}" for i in range(rows)],
+        "_addr": addr,
+        "업태구분명": pd.Categorical(rng.choice(TYPES, rows)),
+    })
+
+
+def _time(table, keyword, limit: int, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        table.search(keyword, limit)
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1 if len(samples) > 1 else 0]
+
+
+def _app_rss_mb(backend: str, sqlite_dir: str) -> float:
+    """새 프로세스에서 app.main 을 올리고 전체 데이터셋 warm-up 후 RSS (MB)"""
+    code = (
+        f"import json, os, sys; sys.path.insert(0, {str(BACKEND_ROOT)!r}); "
+        "import app.main; from app import datasets; datasets.warm_up(); "
+        "rss = int(open('/proc/self/statm').read().split()[1]) * os.sysconf('SC_PAGE_SIZE'); "
+        "print(json.dumps(rss / 1024 / 1024))"
+    )
+    env = {**os.environ, "DATASET_BACKEND": backend, "DATASET_SQLITE_DIR": sqlite_dir}
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=300_000)
+    parser.add_argument("--limit", type=int, default=80)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--no-app-memory", action="store_true", help="앱 전체 메모리 비교 생략")
+    args = parser.parse_args()
+
+    os.environ.setdefault("DATASET_SQLITE_DIR", tempfile.mkdtemp(prefix="bp-sqlite-"))
+    from app import storage
+
+    df = make_frame(args.rows)
+    pandas_table = storage.PandasTable("bench", df, "_addr")
+    t0 = time.perf_counter()
+    sqlite_table = storage.SqliteTable("bench", df, "_addr")
+    build = time.perf_counter() - t0
+    size_mb = sqlite_table.path.stat().st_size / 1024 / 1024
+    print(f"rows={args.rows:,} limit={args.limit} sqlite build {build:.1f}s, {size_mb:.0f} MB on disk")
+
+    print(f"{'keyword':>10} {'pandas p50':>11} {'p95':>7} {'sqlite p50':>11} {'p95':>7} {'same':>5}")
+    for kw in KEYWORDS:
+        same = pandas_table.search(kw, args.limit).equals(sqlite_table.search(kw, args.limit))
+        p50_pd, p95_pd = _time(pandas_table, kw, args.limit, args.repeat)
+        p50_sq, p95_sq = _time(sqlite_table, kw, args.limit, args.repeat)
+        print(f"{str(kw):>10} {p50_pd:9.2f}ms {p95_pd:5.1f}ms {p50_sq:9.2f}ms {p95_sq:5.1f}ms {str(same):>5}")
+
+    if args.no_app_memory or not Path("/proc/self/statm").exists():
+        return
+    app_sqlite_dir = tempfile.mkdtemp(prefix="bp-sqlite-app-")
+    rss = {backend: _app_rss_mb(backend, app_sqlite_dir) for backend in ("pandas", "sqlite")}
+    disk = sum(p.stat().st_size for p in Path(app_sqlite_dir).glob("*.sqlite3")) / 1024 / 1024
+    print(f"\n앱 전체 warm-up 후 RSS: pandas {rss['pandas']:.0f} MB, sqlite {rss['sqlite']:.0f} MB (+ DB 파일 {disk:.0f} MB)")
+    print("sqlite 백엔드는 메모리 이득 없음: 라우터가 로드 시 전체 행을 읽어 주소 코드/n-gram/오타/정렬 색인과 "
+          "응답 조각을 메모리에 만듦 → 차이는 키워드 조회 경로뿐")
+
+
+if __name__ == "__main__":
+    main()
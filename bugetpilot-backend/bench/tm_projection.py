@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+식당 좌표정보(x)/(y) TM → WGS84 변환(app/projection.py) 정확도 + 속도
+
+    python bench/tm_projection.py [--points 1000000] [--crs 5174]
+
+1) 공식 예제 (EPSG Guidance Note 7-2)
+   - 횡메르카토르: OSGB 1936 / British National Grid, 50°30'N 0°30'E ↔ E 577274.99 N 69740.50
+   - Helmert position vector: WGS72 → WGS84 (tz 4.5m, rz 0.554", ds 0.219ppm) 직교좌표 예제
+2) 랜드마크 (tests/test_projection.py 의 EPSG5174_LANDMARKS, PROJ 9.5.1 기준값):
+   - EPSG:5174 이면 forward(위경도 → TM)/inverse(TM → 위경도) 오차를 기준값과 비교 (15cm 안쪽)
+   - 위경도 → TM → 위경도 왕복 오차, 측지계 차이(Bessel TM - GRS80 TM, 국내 약 300~400m) 확인
+3) 실제 식당 데이터: 변환한 좌표가 주소의 시군구 안쪽인지 — 같은 시군구 카페/관광지 좌표 중앙값까지 거리
+   (좌표계를 잘못 고르면 여기서 바로 티가 남, 참고 출력)
+4) 속도: 행마다 파이썬 변환 vs 배열 한 번에
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+sys.path.insert(0, str(BACKEND_ROOT / "tests"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--crs", default=None, help="기본: TM_CRS 환경변수 (5174)")
+    args = parser.parse_args()
+
+    import numpy as np
+
+    from app import geo, projection
+
+    crs = args.crs or projection.TM_CRS
+    failures = 0
+
+    # 1) 공식 예제
+    airy = projection.Ellipsoid(6377563.396, 299.3249646)
+    bng = projection.TransverseMercator(airy, 49.0, -2.0, 0.9996012717, 400000.0, -100000.0)
+    x, y = projection.tm_forward(bng, 50.5, 0.5)
+    lat, lng = projection.tm_inverse(bng, 577274.99, 69740.50)
+    err_fwd = max(abs(x - 577274.99), abs(y - 69740.50))
+    err_inv = max(abs(lat - 50.5) * 111_000, abs(lng - 0.5) * 71_000)
+    print(f"TM 예제: forward 오차 {err_fwd * 100:.2f}cm, inverse 오차 {err_inv * 100:.2f}cm")
+    gx, gy, gz = projection.helmert((0, 0, 4.5, 0, 0, 0.554, 0.219), 3657660.66, 255768.55, 5201382.11)
+    err_h = max(abs(gx - 3657660.78), abs(gy - 255778.43), abs(gz - 5201387.75))
+    print(f"Helmert 예제: 오차 {err_h * 100:.2f}cm")
+    failures += err_fwd > 0.02 or err_inv > 0.02 or err_h > 0.02
+
+    # 2) 랜드마크
+    from test_projection import EPSG5174_LANDMARKS, TOLERANCE_M
+
+    names = list(EPSG5174_LANDMARKS)
+    lat, lng, ref_x, ref_y = (np.array(col) for col in zip(*(EPSG5174_LANDMARKS[n] for n in names)))
+    x, y = projection.from_wgs84(lat, lng, crs)
+    back_lat, back_lng = projection.to_wgs84(x, y, crs)
+    inv_lat, inv_lng = projection.to_wgs84(ref_x, ref_y, crs)
+    gx, gy = projection.from_wgs84(lat, lng, "5181")
+    published = crs == "5174"
+    print(f"\n{'랜드마크':<10} {'TM x':>12} {'TM y':>12} {'forward':>9} {'inverse':>9} {'왕복 오차':>10} {'GRS80 TM 과 차이':>16}")
+    for i, name in enumerate(names):
+        roundtrip = float(geo.haversine_km([back_lat[i]], [back_lng[i]], lat[i], lng[i])[0]) * 1000
+        shift = float(np.hypot(x[i] - gx[i], y[i] - gy[i]))
+        fwd = float(np.hypot(x[i] - ref_x[i], y[i] - ref_y[i]))
+        inv = float(geo.haversine_km([inv_lat[i]], [inv_lng[i]], lat[i], lng[i])[0]) * 1000
+        ref = f"{fwd * 100:>7.2f}cm {inv * 100:>7.2f}cm" if published else f"{'-':>9} {'-':>9}"
+        print(f"{name:<10} {x[i]:>12.2f} {y[i]:>12.2f} {ref} {roundtrip * 100:>8.2f}cm {shift:>14.1f}m")
+        failures += roundtrip > 0.05
+        if published:
+            failures += fwd > TOLERANCE_M or inv > TOLERANCE_M
+        if projection.CRS[crs].towgs84 is not None:
+            failures += not 250 < shift < 500
+
+    # 3) 실제 식당 데이터
+    from app import address, datasets
+    import app.main  # noqa: F401  (라우터 데이터셋 등록)
+
+    items = datasets.get("restaurant_items")
+    n_rest = items.n_restaurants
+    rest_df = datasets.get("restaurants").search(None, n_rest)
+    r_lat, r_lng = items.sort_index.lat[:n_rest], items.sort_index.lng[:n_rest]
+    r_codes = address.parse(rest_df["_addr"])["_sgg"].to_numpy()
+    ref_lat = np.concatenate([items.sort_index.lat[n_rest:], datasets.get("attraction_items").sort_index.lat])
+    ref_lng = np.concatenate([items.sort_index.lng[n_rest:], datasets.get("attraction_items").sort_index.lng])
+    attr_df = datasets.get("attractions").search(None, len(datasets.get("attractions")))
+    cafe_df = datasets.get("cafes").search(None, len(datasets.get("cafes")))
+    attr_addr = (attr_df["소재지도로명주소"].fillna("").astype(str) + " "
+                 + attr_df["소재지지번주소"].fillna("").astype(str)).str.strip()
+    ref_codes = np.concatenate([address.parse(cafe_df["_addr"])["_sgg"].to_numpy(),
+                                address.parse(attr_addr)["_sgg"].to_numpy()])
+    dists = []
+    for code in np.unique(r_codes[r_codes > 0]).tolist():
+        ref = (ref_codes == code) & np.isfinite(ref_lat)
+        rows = (r_codes == code) & np.isfinite(r_lat)
+        if ref.sum() >= 3 and rows.any():
+            center = (np.median(ref_lat[ref]), np.median(ref_lng[ref]))
+            dists.append(geo.haversine_km(r_lat[rows], r_lng[rows], *center))
+    if dists:
+        d = np.concatenate(dists)
+        print(f"\n식당 {n_rest:,}개 중 좌표 {int(np.isfinite(r_lat).sum()):,}개, 시군구 비교 {len(d):,}개: "
+              f"시군구 중심까지 중앙값 {np.median(d):.1f}km, 20km 이내 {np.mean(d <= 20) * 100:.1f}%")
+
+    # 4) 속도
+    rng = np.random.default_rng(0)
+    x = rng.uniform(150_000, 450_000, args.points)
+    y = rng.uniform(100_000, 600_000, args.points)
+    sample = min(args.points, 20_000)
+    t0 = time.perf_counter()
+    for i in range(sample):
+        projection.to_wgs84(x[i], y[i], crs)
+    per_row = (time.perf_counter() - t0) / sample * args.points
+    t0 = time.perf_counter()
+    projection.to_wgs84(x, y, crs)
+    vectorized = time.perf_counter() - t0
+    print(f"\n{args.points:,}점 변환 (EPSG:{crs}): 행마다 {per_row:.1f}s (추정) → 배열 {vectorized * 1000:.0f}ms")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,7 +18,6 @@ from fastapi import APIRouter, HTTPException, Query
 
 from config import get_settings
 from schemas import HotelSearchQuery, HotelItem
-from services.amadeus import get_access_token, search_hotel_offers
 
 router = APIRouter(prefix="/hotels", tags=["hotels"])
 S = get_settings()
@@ -385,6 +384,7 @@ def search_hotels(
         budget_min=budget_min, budget_max=budget_max,
     )
 
+    from services.amadeus import get_access_token, search_hotel_offers
     token = get_access_token()
     payload = search_hotel_offers(
         token,
@@ -455,6 +455,7 @@ def recommend_hotels(
         co = (start + timedelta(days=max(nights, 1))).isoformat()
 
     # 2) 검색
+    from services.amadeus import get_access_token, search_hotel_offers
     token = get_access_token()
     payload = search_hotel_offers(
         token,
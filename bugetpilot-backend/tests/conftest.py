@@ -0,0 +1,56 @@
+# tests/conftest.py
+# bench/ 스크립트처럼 백엔드 루트를 import 경로에 (python -m pytest tests)
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _FileHandler(BaseHTTPRequestHandler):
+    """server.files[경로] 바이트를 내려줌. server.ignore_range 면 Range 무시(항상 200 전체)"""
+
+    def do_GET(self):
+        body = self.server.files.get(self.path)
+        self.server.requests.append((self.path, self.headers.get("Range")))
+        if body is None:
+            self.send_error(404)
+            return
+        status, start = 200, 0
+        rng = self.headers.get("Range")
+        if rng and not self.server.ignore_range:
+            start = int(rng.removeprefix("bytes=").split("-")[0])
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(body)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            status = 206
+        self.send_response(status)
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+        self.wfile.write(body[start:])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def file_server():
+    """localhost 파일 서버 (Range 지원) — 다운로드 테스트용. url(path) 로 주소"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FileHandler)
+    server.files, server.requests, server.ignore_range = {}, [], False
+    server.url = lambda path: f"http://127.0.0.1:{server.server_port}{path}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,91 @@
+# tests/test_address.py
+# 주소 파서(읍면동/도로) + 키워드 해석(resolve) 회귀 테스트
+import pytest
+
+from app import address
+
+ADDRESSES = [
+    "강원특별자치도 강릉시 경강로 2100 아이파크102동 (교동)",
+    "서울특별시 서초구 반포대로 275 래미안101동 (반포동)",
+    "강원특별자치도 강릉시 경강로 2100 래미안101동",
+    "서울특별시 종로구 종로 5 서울특별시 종로구 종로5가 12",
+    "대구광역시 중구 종로 20 대구광역시 중구 종로1가 5",
+    "경상남도 진주시 강남로 79 (칠암동)",
+    "서울특별시 강남구 테헤란로 1 (역삼동)",
+    "광주광역시 동구 금남로 1",
+    "경기도 광주시 경안로 1",
+    "서울특별시 성동구 번영로 209 서울특별시 성동구 성수동2가 565-30",
+    "대구광역시 중구 대구광역시 중구 북성로 77, 1층 (북성로2가)",
+    "제주특별자치도 서귀포시 중문관광로72번길 75 (색달동)",
+]
+
+
+@pytest.fixture(scope="module")
+def codes():
+    return address.parse(ADDRESSES)
+
+
+def _emd(codes, i):
+    return address.TREE.names.get(int(codes["_emd"].iloc[i]))
+
+
+def _rows(codes, keyword):
+    ref = address.resolve(keyword)
+    assert ref is not None, keyword
+    return [ADDRESSES[i] for i in ref.mask(codes).nonzero()[0]]
+
+
+@pytest.mark.parametrize("i, emd", [
+    (0, "교동"),        # 아파트 건물 동 대신 괄호 안 법정동
+    (1, "반포동"),
+    (2, None),          # 래미안101동 은 읍면동이 아님
+    (3, "종로5가"),
+    (4, "종로1가"),
+    (9, "성수동2가"),
+    (10, "북성로2가"),
+    (11, "색달동"),
+])
+def test_parse_emd(codes, i, emd):
+    assert _emd(codes, i) == emd
+
+
+def test_apartment_dong_not_in_tree(codes):
+    assert address.resolve("아이파크102동") is None
+    assert address.resolve("래미안101동") is None
+
+
+def test_parse_road(codes):
+    assert (codes["_road"] > 0).all()
+    assert codes["_road"].iloc[3] == codes["_road"].iloc[4]   # 서울/대구 둘 다 "종로"
+
+
+def test_exact_name_stays_precise(codes):
+    assert _rows(codes, "광주") == [ADDRESSES[7]]
+    assert _rows(codes, "광주시") == [ADDRESSES[8]]
+
+
+def test_stem_combines_levels_and_roads(codes):
+    # 종로구 + 대구 중구 종로1가 (첫 단계에서 멈추면 대구가 빠짐)
+    assert _rows(codes, "종로") == [ADDRESSES[3], ADDRESSES[4]]
+    # 강남구 + 진주 강남로
+    assert _rows(codes, "강남") == [ADDRESSES[5], ADDRESSES[6]]
+    assert _rows(codes, "성수") == [ADDRESSES[9]]
+
+
+def test_multi_token_within(codes):
+    assert _rows(codes, "서울 종로") == [ADDRESSES[3]]
+    assert _rows(codes, "대구 중구") == [ADDRESSES[4], ADDRESSES[10]]
+
+
+def test_covers_ignores_roads():
+    seoul, jongno = address.resolve("서울"), address.resolve("종로")
+    assert seoul.covers(jongno) and jongno.covers(seoul)
+    assert not address.resolve("부산").covers(address.resolve("강남"))
+
+
+def test_road_keys_same_building():
+    a = ["서울특별시 중구 세종대로 110 서울특별시 중구 태평로1가 31",
+         "서울특별시 중구 서울특별시 중구 세종대로 110, 1층 (태평로1가)",
+         "서울특별시 중구 세종대로 112"]
+    keys = address.road_keys(a, address.parse(a)).tolist()
+    assert keys[0] == keys[1] != keys[2]
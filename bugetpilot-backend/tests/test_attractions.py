@@ -0,0 +1,37 @@
+# tests/test_attractions.py
+# 관광지 적재: 주소/소개 일부가 비어도 응답에 "nan" 이 새지 않는지 (예전엔 location 이 "nan 부산광역시 ..." 였음)
+import json
+
+import pytest
+
+from app.routers import attractions
+
+HEADER = "관광지명,소재지도로명주소,소재지지번주소,관광지소개,주차가능수,관리기관전화번호\n"
+ROWS = [
+    "오륙도,,부산광역시 남구 용호동 산205,섬 여섯 개,10,051-000-0000",
+    "만장굴,제주특별자치도 제주시 구좌읍 만장굴길 182,,,,",
+    "이름만,,,,,",
+    "둘다,서울특별시 중구 세종대로 110,서울특별시 중구 태평로1가 31,시청,x,",
+]
+
+
+@pytest.fixture
+def items(tmp_path, monkeypatch):
+    path = tmp_path / attractions.ATTR_CSV
+    path.write_text(HEADER + "\n".join(ROWS) + "\n", encoding="utf-8")
+    monkeypatch.setattr(attractions, "ATTR_CANDIDATES", [path])
+    df = attractions.build_attraction_tables()[0]["attractions"]
+    return {it["name"]: it for it in (json.loads(frag) for _, frag in attractions._items(df))}
+
+
+def test_missing_address_part_is_empty_not_nan(items):
+    assert items["오륙도"]["location"] == "부산광역시 남구 용호동 산205"
+    assert items["만장굴"]["location"] == "제주특별자치도 제주시 구좌읍 만장굴길 182"
+    assert items["둘다"]["location"] == "서울특별시 중구 세종대로 110 서울특별시 중구 태평로1가 31"
+
+
+def test_missing_text_falls_back(items):
+    assert items["이름만"]["location"] == "이름만"
+    assert items["만장굴"]["description"] == "만장굴 관광명소입니다."
+    assert items["둘다"]["parkingCount"] == 0
+    assert not any("nan" in json.dumps(it, ensure_ascii=False) for it in items.values())
@@ -0,0 +1,88 @@
+# tests/test_bm25.py
+# BM25 역색인 회귀 테스트 — 문서마다 파이썬으로 직접 계산한 점수/순위와 비교
+import math
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from app import bm25
+
+NAMES = ["해운대 케이블카", "송도 해상케이블카", "남산타워", "광안리 해변", "태종대", "감천문화마을", None, "야경 명소 전망대"]
+DESCS = [
+    "바다 위를 지나는 케이블카, 야경이 아름답다", "케이블카를 타고 바다 야경을", "서울 야경 명소",
+    "광안대교 야경과 해변", "절벽과 바다", "골목 벽화 마을", "이름 없는 문서", None,
+]
+WEIGHTS = [2.0, 1.0]
+
+
+def _reference(query, names, descs, weights, k1=bm25.K1, b=bm25.B):
+    """문서마다 Counter 로 직접 계산한 BM25F 점수 (질의 용어 하나라도 있는 문서만)"""
+    fields = [names, descs]
+    n = len(names)
+    tfs, lengths = [], []
+    for i in range(n):
+        tf, length = Counter(), 0.0
+        for field, weight in zip(fields, weights):
+            toks = bm25.tokens(field[i])
+            length += weight * len(toks)
+            for t in toks:
+                tf[t] += weight
+        tfs.append(tf)
+        lengths.append(length)
+    avgdl = sum(lengths) / n or 1.0
+    out = {}
+    for term in dict.fromkeys(bm25.tokens(query)):
+        df = sum(term in tf for tf in tfs)
+        if df == 0:
+            continue
+        idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+        for i, tf in enumerate(tfs):
+            if term in tf:
+                norm = k1 * (1 - b + b * lengths[i] / avgdl)
+                out[i] = out.get(i, 0.0) + idf * tf[term] * (k1 + 1) / (tf[term] + norm)
+    return out
+
+
+@pytest.fixture(scope="module")
+def index():
+    return bm25.BM25Index([NAMES, DESCS], weights=WEIGHTS)
+
+
+def test_tokens():
+    assert bm25.tokens("케이블카를 타요") == ["케이", "이블", "블카", "카를", "타요"]
+    assert bm25.tokens("N서울타워 2F") == ["n", "서울", "울타", "타워", "2f"]
+    assert bm25.tokens(None) == []
+
+
+@pytest.mark.parametrize("query", ["케이블카 야경", "바다", "야경 명소", "해변", "없는말", "마을 벽화 골목"])
+def test_scores_match_reference(index, query):
+    want = _reference(query, NAMES, DESCS, WEIGHTS)
+    docs, scores = index.scores(query)
+    assert docs.tolist() == sorted(want)
+    assert np.allclose(scores, [want[d] for d in docs.tolist()], rtol=1e-5)
+
+
+@pytest.mark.parametrize("k", [1, 3, 10])
+def test_search_top_k(index, k):
+    want = _reference("케이블카 야경", NAMES, DESCS, WEIGHTS)
+    docs, _ = index.search("케이블카 야경", k=k)
+    # 점수 높은 순, 같으면 위치 오름차순 (float32 tf 차이로 순서가 바뀌지 않을 만큼 점수 차가 큼)
+    assert docs.tolist() == sorted(want, key=lambda d: (-want[d], d))[:k]
+
+
+def test_search_large_matches_reference():
+    rng = random.Random(3)
+    words = ["케이블카", "야경", "바다", "해변", "전망대", "시장", "카페", "공원", "박물관", "다리"]
+    names = [" ".join(rng.sample(words, 2)) for _ in range(300)]
+    descs = [" ".join(rng.choices(words, k=rng.randint(0, 8))) for _ in range(300)]
+    index = bm25.BM25Index([names, descs], weights=WEIGHTS)
+    allowed = np.array([i % 3 != 0 for i in range(300)])
+    for query in ["야경 바다", "박물관", "카페 시장 공원"]:
+        want = _reference(query, names, descs, WEIGHTS)
+        docs, scores = index.scores(query)
+        assert docs.tolist() == sorted(want)
+        assert np.allclose(scores, [want[d] for d in docs.tolist()], rtol=1e-5)
+        top, _ = index.search(query, k=20, allowed=allowed)
+        assert all(allowed[top]) and len(top) == min(20, sum(allowed[d] for d in want))
@@ -0,0 +1,35 @@
+# tests/test_csv_loader.py
+# 청크 스트리밍 인코딩: 앞부분만 보고 고른 인코딩이 뒤에서 깨지면 후보로 다시 (U+FFFD 치환 없이)
+from app import csv_loader
+
+
+def _write(path, head_rows, tail_rows, encoding):
+    # 앞부분(판별 샘플 크기 이상)은 ASCII 만 → utf-8 로 판별됨
+    lines = ["name,addr"] + [f"shop{i},addr{i}" for i in range(head_rows)]
+    data = ("\n".join(lines) + "\n").encode("ascii") + "".join(tail_rows).encode(encoding)
+    path.write_bytes(data)
+    return path
+
+
+def _read(path):
+    chunks = csv_loader.iter_columns(path, ["name", "addr"], chunksize=1000)
+    return None if chunks is None else [row for chunk in chunks for row in chunk.itertuples(index=False)]
+
+
+def test_stream_falls_back_to_cp949_after_sniff_window(tmp_path):
+    path = _write(tmp_path / "x.csv", 8000, ["강릉횟집,강원특별자치도 강릉시 교동\n"], "cp949")
+    assert csv_loader.sniff_encoding(path) == "utf-8"
+    rows = _read(path)
+    assert rows[-1] == ("강릉횟집", "강원특별자치도 강릉시 교동")
+    assert not any("�" in str(v) for row in rows for v in row)
+
+
+def test_stream_keeps_utf8(tmp_path):
+    path = _write(tmp_path / "x.csv", 10, ["해운대국밥,부산광역시 해운대구 우동\n"], "utf-8")
+    assert _read(path)[-1] == ("해운대국밥", "부산광역시 해운대구 우동")
+
+
+def test_stream_rejects_undecodable_file(tmp_path):
+    path = tmp_path / "x.csv"
+    path.write_bytes(b"name,addr\nshop,addr\n" + b"\xff\xff,\x80\n")
+    assert _read(path) is None
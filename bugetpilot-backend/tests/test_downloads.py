@@ -0,0 +1,64 @@
+# tests/test_downloads.py
+# 다운로드 매니저: .part 이어받기(206), Range 무시 서버면 처음부터, sha256 불일치 거절, on_ready 콜백
+import hashlib
+
+import pytest
+
+from app import downloads
+
+BODY = bytes(range(256)) * 4096  # 1MB
+
+
+@pytest.fixture
+def dest(tmp_path):
+    return tmp_path / "cache" / "hotels.csv"
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def test_resumes_part_file_with_206(file_server, dest):
+    file_server.files["/hotels.csv"] = BODY
+    dest.parent.mkdir(parents=True)
+    part = dest.with_name(dest.name + ".part")
+    part.write_bytes(BODY[:300_000])
+
+    dl = downloads.Download(file_server.url("/hotels.csv"), dest, _sha(BODY))
+    assert dl.run()
+    assert file_server.requests == [("/hotels.csv", "bytes=300000-")]
+    assert dest.read_bytes() == BODY and not part.exists()
+    assert dl.status() == {"state": downloads.DONE, "received": len(BODY), "total": len(BODY), "error": None}
+
+
+def test_restarts_when_server_ignores_range(file_server, dest):
+    file_server.files["/hotels.csv"] = BODY
+    file_server.ignore_range = True
+    dest.parent.mkdir(parents=True)
+    # 서버가 200 으로 전체를 보내면 .part 뒤에 붙이지 않고 덮어써야 함
+    dest.with_name(dest.name + ".part").write_bytes(b"garbage" * 1000)
+
+    dl = downloads.Download(file_server.url("/hotels.csv"), dest, _sha(BODY))
+    assert dl.run()
+    assert file_server.requests == [("/hotels.csv", "bytes=7000-")]
+    assert dest.read_bytes() == BODY
+
+
+def test_checksum_mismatch_is_not_promoted(file_server, dest):
+    file_server.files["/hotels.csv"] = BODY
+    dl = downloads.Download(file_server.url("/hotels.csv"), dest, _sha(b"something else"))
+    assert not dl.run()
+    assert dl.state == downloads.FAILED and dl.error == "sha256 mismatch"
+    assert not dest.exists() and not dest.with_name(dest.name + ".part").exists()
+
+
+def test_on_ready_called_after_background_download(file_server, dest):
+    file_server.files["/hotels.csv"] = BODY
+    ready = []
+    dl = downloads.Download(file_server.url("/hotels.csv"), dest)
+    dl.start(on_ready=ready.append)
+    assert dl.wait(timeout=30)
+    assert ready == [dest]
+    # 캐시에 있으면 네트워크 없이 DONE
+    again = downloads.Download(file_server.url("/hotels.csv"), dest)
+    assert again.cached() and len(file_server.requests) == 1
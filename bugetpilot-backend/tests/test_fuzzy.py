@@ -0,0 +1,86 @@
+# tests/test_fuzzy.py
+# 오타 검색(자모 trigram + Myers 비트 병렬) 회귀 테스트 — 편집 거리는 파이썬 DP 와 비교
+import random
+
+import numpy as np
+import pytest
+
+from app import fuzzy
+
+NAMES = [
+    "스타벅스 강남점", "스타벅스 해운대점", "투썸플레이스 서면", "카페 봄날", "카패 여름", "롯데호텔 서울",
+    "신라호텔", "해운대 암소갈비", "Blue Bottle 성수", "", None, "빽다방", "이디야커피 역삼", "메가MGC커피",
+]
+
+
+def _substring_distance(pattern: str, text: str) -> int:
+    # 이름 안 아무 부분 문자열과의 최소 편집 거리 (첫 행 0)
+    prev = [0] * (len(text) + 1)
+    for i, p in enumerate(pattern, 1):
+        cur = [i] + [0] * len(text)
+        for j, t in enumerate(text, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (p != t))
+        prev = cur
+    return min(prev)
+
+
+@pytest.fixture(scope="module")
+def index():
+    return fuzzy.FuzzyIndex(NAMES)
+
+
+def test_jamo():
+    assert fuzzy.jamo("벅") == "ㅂㅓㄱ"
+    assert fuzzy.jamo("Blue Bottle!") == "bluebottle"
+    assert fuzzy.jamo(None) == ""
+
+
+@pytest.mark.parametrize("length, edits", [(0, 0), (3, 0), (4, 1), (9, 1), (10, min(fuzzy.MAX_EDITS, 2))])
+def test_max_edits(length, edits):
+    assert fuzzy.max_edits(length) == edits
+
+
+@pytest.mark.parametrize("query, name", [
+    ("스타벅수", "스타벅스 강남점"),
+    ("카페", "카페 봄날"),
+    ("롯대호텔", "롯데호텔 서울"),
+    ("blue botle", "Blue Bottle 성수"),
+])
+def test_search_finds_typo(index, query, name):
+    positions, _ = index.search(query, limit=5)
+    assert name in [NAMES[p] for p in positions]
+
+
+def test_search_respects_allowed(index):
+    allowed = np.zeros(len(NAMES), dtype=bool)
+    allowed[1] = True
+    positions, _ = index.search("스타벅스", limit=5, allowed=allowed)
+    assert positions.tolist() == [1]
+
+
+def test_distances_match_dp(index):
+    rng = random.Random(7)
+    docs = np.arange(len(NAMES), dtype=np.int64)
+    for _ in range(50):
+        name = fuzzy.jamo(rng.choice([n for n in NAMES if n]))
+        pattern = list(name[:rng.randint(3, min(12, len(name)))])
+        for _ in range(rng.randint(0, 2)):
+            pattern[rng.randrange(len(pattern))] = rng.choice("ㄱㅏㅂㅓㅅㅡ")
+        pattern = "".join(pattern)
+        want = [_substring_distance(pattern, t) for t in index.texts]
+        assert index.distances(pattern, docs).tolist() == want, pattern
+
+
+
+@pytest.mark.parametrize("names", [[], ["ab"], [None, ""]])
+def test_index_without_trigrams(names):
+    # 빈 카탈로그(샤딩으로 해당 지역 행이 없을 때)나 짧은 이름뿐이면 trigram 이 없음 → 빈 결과 (IndexError 아님)
+    index = fuzzy.FuzzyIndex(names)
+    positions, distances = index.search("스타벅스", limit=5)
+    assert positions.tolist() == [] and distances.tolist() == []
+
+
+def test_short_names_still_match_short_query():
+    # 자모 3개 미만 질의는 trigram 없이 부분 문자열 일치
+    positions, _ = fuzzy.FuzzyIndex(["ab"]).search("ab", limit=5)
+    assert positions.tolist() == [0]
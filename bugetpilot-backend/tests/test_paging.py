@@ -0,0 +1,77 @@
+# tests/test_paging.py
+# 정렬 + 커서 페이지네이션 회귀 테스트 — 커서로 끝까지 넘긴 결과 == 한 번에 정렬한 결과
+import random
+
+import numpy as np
+import pytest
+
+from app import geo, paging
+
+N = 500
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = random.Random(11)
+    price = [rng.choice([5000, 8000, 12000, float("nan")]) for _ in range(N)]
+    rating = [rng.choice([3.5, 4.0, 4.5, 5.0]) for _ in range(N)]
+    reviews = [rng.randint(0, 30) for _ in range(N)]
+    lat = [rng.uniform(35.0, 35.2) if rng.random() > 0.1 else float("nan") for _ in range(N)]
+    lng = [rng.uniform(129.0, 129.2) for _ in range(N)]
+    index = paging.SortIndex({"price": price, "rating": rating, "reviewCount": reviews}, lat, lng)
+    return index, {"price": price, "rating": rating, "reviewCount": reviews}, lat, lng
+
+
+def _walk(index, sort, members, limit, origin=None):
+    out, cursor, pages = [], None, 0
+    while True:
+        positions, cursor = index.page(sort, members, cursor, limit, origin)
+        out.extend(positions.tolist())
+        pages += 1
+        if cursor is None:
+            return out, pages
+        # 커서는 문자열로 왕복해도 같아야 함
+        cursor = paging.Cursor.decode(cursor.encode())
+
+
+def _expected(columns, sort, members, lat, lng, origin):
+    if not sort:
+        return list(members)
+    if sort == "distance":
+        dist = geo.haversine_km(np.asarray(lat)[members], np.asarray(lng)[members], *origin)
+        keys = np.where(np.isnan(dist), np.inf, dist).tolist()
+    else:
+        values = np.asarray(columns[sort], dtype=np.float64)[members]
+        keys = (-values if sort in paging.DESCENDING else values).tolist()
+    # NaN 은 np.lexsort 처럼 맨 뒤
+    return [m for _, m in sorted(zip(keys, members), key=lambda t: (np.isnan(t[0]), t[0], t[1]))]
+
+
+@pytest.mark.parametrize("sort", ["", "price", "rating", "reviewCount", "distance"])
+@pytest.mark.parametrize("filtered", [False, True])
+@pytest.mark.parametrize("limit", [1, 7, 100, 1000])
+def test_cursor_walk_equals_full_sort(data, sort, filtered, limit):
+    index, columns, lat, lng = data
+    members = np.arange(N, dtype=np.int64)[np.arange(N) % 3 != 1] if filtered else None
+    origin = (35.1, 129.1)
+    got, pages = _walk(index, sort, members, limit, origin)
+    want = _expected(columns, sort, list(range(N)) if members is None else members.tolist(), lat, lng, origin)
+    assert got == want
+    assert pages == max(1, -(-len(want) // limit))
+
+
+def test_cursor_roundtrip():
+    cursor = paging.Cursor("price", 12000.0, 42, 80)
+    assert paging.Cursor.decode(cursor.encode()) == cursor
+    with pytest.raises(ValueError):
+        paging.Cursor.decode("not-a-cursor")
+
+
+def test_check_sort():
+    assert paging.check_sort(None, None, None) == ""
+    with pytest.raises(ValueError):
+        paging.check_sort("name", None, None)
+    with pytest.raises(ValueError):
+        paging.check_sort("price", paging.Cursor("rating", 4.0, 1, 1), None)
+    with pytest.raises(ValueError):
+        paging.check_sort("distance", None, None)
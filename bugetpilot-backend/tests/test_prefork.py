@@ -0,0 +1,79 @@
+# tests/test_prefork.py
+# pre-fork: 워커의 /admin/reload 는 마스터가 처리 → 마스터에서 새 세대 빌드 후 워커를 다시 fork (모든 워커가 같은 세대)
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork") or not Path("/proc/self/task").exists(),
+                                reason="pre-fork 는 os.fork + /proc 필요")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _workers(pid: int):
+    task = Path(f"/proc/{pid}/task")
+    return sorted(int(c) for t in task.iterdir() for c in (t / "children").read_text().split())
+
+
+def _wait(cond, timeout: float = 60.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        try:
+            value = cond()
+            if value:
+                return value
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise AssertionError("timed out")
+
+
+@pytest.fixture
+def server(tmp_path):
+    port = _free_port()
+    env = {**os.environ, "ADMIN_TOKEN": "test-token", "DATASET_SNAPSHOT_DIR": str(tmp_path), "DATASET_WATCH_INTERVAL": "0"}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "app.prefork", "--workers", "2", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=BACKEND_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+    def request(path, method="GET", headers=None):
+        req = urllib.request.Request(f"http://127.0.0.1:{port}{path}", method=method, headers=headers or {})
+        with urllib.request.urlopen(req, timeout=10) as r:
+            return r.status, json.loads(r.read())
+
+    try:
+        _wait(lambda: request("/ready")[0] == 200)
+        yield proc, request
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=30)
+
+
+def test_worker_reload_goes_through_master(server):
+    proc, request = server
+    before = _wait(lambda: len(_workers(proc.pid)) == 2 and _workers(proc.pid))
+    assert request("/ready")[1]["version"] == 1
+
+    status, body = request("/admin/reload", "POST", {"X-Admin-Token": "test-token"})
+    assert status == 202 and body["started"]
+
+    # 마스터가 gen 2 를 빌드한 뒤 워커를 새로 fork → 예전 워커는 모두 종료
+    after = _wait(lambda: (w := _workers(proc.pid)) and len(w) == 2 and not set(w) & set(before) and w)
+    assert len(after) == 2
+    assert {request("/ready")[1]["version"] for _ in range(20)} == {2}
@@ -0,0 +1,50 @@
+# tests/test_projection.py
+# EPSG:5174 (Korean 1985 / Modified Central Belt) 변환을 코드 밖 기준값과 비교 — 왕복만으로는 원점/측지계 실수를 못 잡음
+import math
+
+import numpy as np
+import pytest
+
+from app import geo, projection
+
+# 좌표계 정의에 적힌 원점: Bessel 38°N 127°00'10.405"E → E 200000 N 500000
+ORIGIN_LAT, ORIGIN_LNG = 38.0, 127 + 10.405 / 3600
+
+# WGS84 위경도 → EPSG:5174 (E, N)
+# 기준값: PROJ 9.5.1 (EPSG 레지스트리 정의 + 기본 변환 "Korean 1985 to WGS 84 (1)", Molodensky-Badekas)
+#   pyproj.Transformer.from_crs("EPSG:4326", "EPSG:5174").transform(lat, lng) → (N, E)
+# 경위도원점: 국토지리정보원 고시 세계측지계 37°16'33.3659"N 127°03'14.8913"E (수원)
+EPSG5174_LANDMARKS = {
+    "서울시청": (37.566535, 126.977969, 197984.008, 451583.736),
+    "부산시청": (35.179816, 129.075022, 388951.030, 188706.652),
+    "제주국제공항": (33.506920, 126.492800, 152796.770, 1279.705),
+    "강릉역": (37.763860, 128.899740, 367332.294, 475181.885),
+    "전주한옥마을": (35.815200, 127.153000, 213754.631, 257243.685),
+    "독도": (37.241300, 131.864800, 631724.414, 426588.025),
+    "경위도원점": (37 + 16 / 60 + 33.3659 / 3600, 127 + 3 / 60 + 14.8913 / 3600, 204731.224, 419332.107),
+}
+
+# 우리 Helmert(7-파라미터 position vector)와 EPSG 변환 파라미터 차이 → 국내 전역 10cm 안쪽
+TOLERANCE_M = 0.15
+
+
+def test_origin_maps_to_false_origin():
+    tm = projection.CRS["5174"]
+    x, y = projection.tm_forward(tm, ORIGIN_LAT, ORIGIN_LNG)
+    assert abs(x - 200000.0) < 1e-6 and abs(y - 500000.0) < 1e-6
+    lat, lng = projection.tm_inverse(tm, 200000.0, 500000.0)
+    assert abs(lat - ORIGIN_LAT) < 1e-9 and abs(lng - ORIGIN_LNG) < 1e-9
+
+
+@pytest.mark.parametrize("name", list(EPSG5174_LANDMARKS))
+def test_forward_matches_reference(name):
+    lat, lng, e, n = EPSG5174_LANDMARKS[name]
+    x, y = projection.from_wgs84(np.array([lat]), np.array([lng]), "5174")
+    assert math.hypot(x[0] - e, y[0] - n) < TOLERANCE_M
+
+
+@pytest.mark.parametrize("name", list(EPSG5174_LANDMARKS))
+def test_inverse_matches_reference(name):
+    lat, lng, e, n = EPSG5174_LANDMARKS[name]
+    back_lat, back_lng = projection.to_wgs84(np.array([e]), np.array([n]), "5174")
+    assert float(geo.haversine_km(back_lat, back_lng, lat, lng)[0]) * 1000 < TOLERANCE_M
@@ -0,0 +1,170 @@
+# tests/test_responses.py
+"""
+목록/상세 API 응답 바이트 비교
+
+    python -m pytest tests/test_responses.py                        # 비교
+    python bench/record_baseline.py                                 # 기준 응답을 기준 커밋에서 다시 기록
+    UPDATE_SNAPSHOTS=1 python -m pytest tests/test_responses.py     # 의도한 응답 변경 후 현재 스냅샷 다시 기록
+
+- snapshots/baseline_responses.json: 기준(백로그 이전) 커밋의 응답 — BASELINE_REQUESTS
+  현재 응답 == 기준 응답 (INTENDED_DIFFERENCES 에 적은 요청만 예외, 그 차이도 기준 응답에서 재현해 확인)
+- snapshots/responses.json: 현재 트리의 응답 — 기준이 없는 새 기능(FEATURE_REQUESTS) 회귀 확인용
+- 저장소에 있는 데이터만 사용 (식당 원본 CSV 는 저장소 밖이라 빼고 카페 데이터만, 컴파일된 스냅샷 안 씀)
+- 비교: 본문 바이트 + content-type + X-Next-Cursor + status
+
+의도한 차이 중 이 조건에서 안 보이는 것:
+- user-025 식당+카페 POI 병합: 이름이 같은 다른 주소 지점이 더는 숨지 않음 — 식당 원본 CSV 가 있어야 드러남
+  (bench/poi_dedup.py 가 행 단위 기준 키와 비교)
+"""
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+SNAPSHOT_FILE = Path(__file__).resolve().parent / "snapshots" / "responses.json"
+
+BASELINE_FILE = Path(__file__).resolve().parent / "snapshots" / "baseline_responses.json"
+
+# 기준 커밋에도 있던 경로/파라미터 → baseline_responses.json 과 비교
+BASELINE_REQUESTS = [
+    ("/rooms", {"city_keyword": "강릉"}),
+    ("/rooms", {"city_keyword": "서울", "include_images": 3}),
+    ("/rooms", {"city_keyword": "부산", "max_price": 90000, "min_rating": 4}),
+    ("/rooms", {"city_keyword": "제주", "include_images": 0}),
+    ("/rooms/1", {}),
+    ("/rooms/5", {}),
+    ("/rooms/99999", {}),
+    ("/restaurants", {}),
+    ("/restaurants", {"city_keyword": "서귀포", "limit": 80}),
+    ("/restaurants", {"city_keyword": "달서구", "max_price": 10000, "limit": 200}),
+    ("/restaurants", {"city_keyword": "중구", "limit": 30}),
+    ("/restaurants", {"city_keyword": "xyz"}),
+    ("/attractions", {}),
+    ("/attractions", {"city_keyword": "제주", "max_price": 0}),
+    ("/attractions", {"city_keyword": "중구"}),
+]
+
+# 백로그에서 새로 생긴 기능(sort/name/q/format/nearby) → 기준이 없으므로 responses.json 회귀 스냅샷만
+FEATURE_REQUESTS = [
+    ("/rooms", {"sort": "rating", "limit": 20}),
+    ("/rooms", {"city_keyword": "부산", "sort": "price", "limit": 10}),
+    ("/rooms", {"name": "롯대호텔", "limit": 10}),
+    ("/restaurants", {"sort": "rating", "limit": 15}),
+    ("/restaurants", {"city_keyword": "진주", "sort": "price", "limit": 15}),
+    ("/restaurants", {"name": "스타벅수", "limit": 10}),
+    ("/restaurants", {"city_keyword": "가평", "format": "ndjson", "limit": 5}),
+    ("/attractions", {"q": "케이블카 야경", "limit": 10}),
+    ("/attractions", {"city_keyword": "부산", "sort": "price", "limit": 10}),
+    ("/nearby", {"lat": 35.8714, "lng": 128.6014, "radius_km": 1, "limit": 30}),
+    ("/nearby", {"lat": 33.2541, "lng": 126.5600, "radius_km": 5, "types": "cafe,attraction", "limit": 30}),
+]
+
+REQUESTS = BASELINE_REQUESTS + FEATURE_REQUESTS
+
+
+def _key(path, params):
+    return path + ("?" + "&".join(f"{k}={v}" for k, v in params.items()) if params else "")
+
+
+def _rooms_by_address(base, cur):
+    # 숙소 지역은 제목이 아니라 주소의 시도/시군구로 찾음 → 제목/건물명에만 "서울" 이 있는 경기/충북 숙소가 빠짐
+    assert len(cur) < len(base)
+    assert cur == [r for r in base if r["address"].startswith("서울특별시")]
+
+
+def _max_price_before_limit(base, cur):
+    # 예전: 앞 limit 행을 자르고 이름 중복을 거른 뒤 max_price → 79개만
+    # 지금: max_price 를 먼저 → limit 만큼 채움. 예전 항목은 같은 순서로 모두 들어 있음 (id 는 응답 내 순번이라 뺌)
+    def strip(r):
+        return {k: v for k, v in r.items() if k != "id"}
+    rest = iter(strip(r) for r in cur)
+    assert all(any(r == c for c in rest) for r in map(strip, base))
+    assert len(base) < len(cur) == 200 and all(r["price"] <= 10000 for r in cur)
+
+
+def _no_nan_location(base, cur):
+    # 주소 일부(도로명/지번)가 비면 예전엔 location 에 "nan" 이 그대로 붙었음 → 이제 빈 문자열로
+    def strip(r):
+        loc = r["location"]
+        loc = loc[4:] if loc.startswith("nan ") else loc
+        loc = loc[:-4] if loc.endswith(" nan") else loc
+        return dict(r, location=loc if loc != "nan" else r["name"])
+    assert any(r["location"].startswith("nan ") or r["location"].endswith(" nan") for r in base)
+    assert cur == [strip(r) for r in base]
+
+
+# 기준 응답과 일부러 달라진 요청: (요청 id, 기준 항목 → 현재 항목 확인)
+INTENDED_DIFFERENCES = {
+    _key("/rooms", {"city_keyword": "서울", "include_images": 3}): ("user-013", _rooms_by_address),
+    _key("/restaurants", {"city_keyword": "달서구", "max_price": 10000, "limit": 200}): ("user-021", _max_price_before_limit),
+    _key("/attractions", {}): ("user-022", _no_nan_location),
+    _key("/attractions", {"city_keyword": "제주", "max_price": 0}): ("user-022", _no_nan_location),
+}
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    from fastapi.testclient import TestClient
+
+    from app import datasets, snapshot
+    from app.main import app
+    from app.routers import restaurants
+
+    patch = pytest.MonkeyPatch()
+    patch.setattr(snapshot, "SNAPSHOT_DIR", tmp_path_factory.mktemp("no_snapshots"))
+    patch.setattr(restaurants, "REST_CANDIDATES", [])
+    datasets.reload()
+    yield TestClient(app)
+    patch.undo()
+
+
+@pytest.fixture(scope="module")
+def responses(client):
+    out = {}
+    for path, params in REQUESTS:
+        r = client.get(path, params=params)
+        out[_key(path, params)] = {
+            "status": r.status_code,
+            "content_type": r.headers.get("content-type"),
+            "next_cursor": r.headers.get("x-next-cursor"),
+            "body": r.content.decode("utf-8"),
+        }
+    if os.getenv("UPDATE_SNAPSHOTS"):
+        SNAPSHOT_FILE.write_text(json.dumps(out, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+    return out
+
+
+@pytest.fixture(scope="module")
+def expected():
+    return json.loads(SNAPSHOT_FILE.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    return json.loads(BASELINE_FILE.read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("path, params", BASELINE_REQUESTS, ids=[_key(p, q) for p, q in BASELINE_REQUESTS])
+def test_response_matches_baseline(responses, baseline, path, params):
+    key = _key(path, params)
+    got, base = responses[key], baseline[key]
+    if key not in INTENDED_DIFFERENCES:
+        assert got == base
+        return
+    _, check = INTENDED_DIFFERENCES[key]
+    assert {k: v for k, v in got.items() if k != "body"} == {k: v for k, v in base.items() if k != "body"}
+    assert got["body"] != base["body"]
+    check(json.loads(base["body"]), json.loads(got["body"]))
+
+
+@pytest.mark.parametrize("path, params", REQUESTS, ids=[_key(p, q) for p, q in REQUESTS])
+def test_response_matches_snapshot(responses, expected, path, params):
+    key = _key(path, params)
+    assert responses[key] == expected[key]
+
+
+def test_snapshot_has_no_stale_requests(expected, baseline):
+    assert set(expected) == {_key(p, q) for p, q in REQUESTS}
+    assert set(baseline) == {_key(p, q) for p, q in BASELINE_REQUESTS}
+    assert set(INTENDED_DIFFERENCES) <= set(baseline)
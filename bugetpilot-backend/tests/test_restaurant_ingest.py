@@ -0,0 +1,39 @@
+# tests/test_restaurant_ingest.py
+# 식당 CSV 적재: full / stream 방식이 같은 행(영업 중 + 여행 지역)을 남기는지
+import pytest
+
+from app.routers import restaurants
+
+HEADER = "번호,영업상태명,지번주소,도로명주소,사업장명,업태구분명,좌표정보(x),좌표정보(y)\n"
+ROWS = [
+    "1,영업/정상,강원특별자치도 강릉시 교동 1,강원특별자치도 강릉시 경강로 2100,강릉횟집,횟집,,",
+    "2,폐업,대구광역시 중구 삼덕동1가 1,대구광역시 중구 동성로 1,폐업식당,한식,,",
+    "3,영업/정상,서울특별시 중구 명동2가 25-2,서울특별시 중구 명동10길 29,명동교자,한식,,",
+    "4,영업/정상,부산광역시 해운대구 우동 1,부산광역시 해운대구 해운대로 1,해운대국밥,한식,,",
+]
+
+
+@pytest.fixture
+def rest_csv(tmp_path, monkeypatch):
+    path = tmp_path / restaurants.REST_MAIN_NAME
+    path.write_text(HEADER + "\n".join(ROWS) + "\n", encoding="utf-8")
+    monkeypatch.setattr(restaurants, "REST_CANDIDATES", [path])
+    monkeypatch.setenv("TRAVEL_REGIONS", "강릉,부산")
+    monkeypatch.delenv("SERVED_REGIONS", raising=False)
+    return path
+
+
+@pytest.mark.parametrize("mode", ["full", "stream"])
+def test_ingest_keeps_open_rows_in_travel_regions(rest_csv, monkeypatch, mode):
+    monkeypatch.setattr(restaurants, "REST_INGEST", mode)
+    df = restaurants.build_restaurant_tables()[0]["restaurants"]
+    assert df["사업장명"].astype(str).tolist() == ["강릉횟집", "해운대국밥"]
+
+
+def test_ingest_modes_same_rows(rest_csv, monkeypatch):
+    out = {}
+    for mode in ("full", "stream"):
+        monkeypatch.setattr(restaurants, "REST_INGEST", mode)
+        df = restaurants.build_restaurant_tables()[0]["restaurants"]
+        out[mode] = (df.index.tolist(), df["_addr"].astype(str).tolist())
+    assert out["full"] == out["stream"]
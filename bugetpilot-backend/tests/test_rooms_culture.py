@@ -0,0 +1,52 @@
+# tests/test_rooms_culture.py
+# 문화 CSV 없이 compile 한(dummy) 숙소 스냅샷이 있어도 CULTURE_CSV_URL 다운로드가 시작되고, 끝나면 문화 데이터로
+import pytest
+
+from app import downloads, snapshot
+from app.routers import rooms
+
+CULTURE_CSV = (
+    "등급 인정처,호텔업 구분,결정 등급,등급 결정일,지역,호텔명,객실수,주소\n"
+    "한국관광협회중앙회,관광호텔업,4성,2023-01-01,강원,테스트강릉호텔,120,강원특별자치도 강릉시 경강로 2100\n"
+    "한국관광협회중앙회,관광호텔업,2성,2023-01-01,부산,테스트해운대호텔,40,부산광역시 해운대구 해운대해변로 1\n"
+)
+
+
+@pytest.fixture
+def no_local_culture(tmp_path, monkeypatch):
+    for name in ("CULTURE_CSV", "CULTURE_CSV_IN_DATA", "CULTURE_CSV_IN_APP_DATA"):
+        monkeypatch.setattr(rooms, name, tmp_path / "missing" / rooms.CULTURE_CSV_NAME)
+    monkeypatch.setattr(snapshot, "SNAPSHOT_DIR", tmp_path / "snapshots")
+    monkeypatch.setattr(downloads, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.delenv("CULTURE_CSV_URL", raising=False)
+    monkeypatch.delenv("CULTURE_CSV_SHA256", raising=False)
+    # 이미지 빌드 때처럼 문화 CSV 없이 compile → dummy 원본만 기록된 스냅샷
+    snapshot.compile_all(["rooms"])
+    assert rooms.CULTURE_CSV_NAME not in snapshot.source_names("rooms")
+
+
+def _titles(catalog):
+    return set(catalog.store.strings("title"))
+
+
+def test_dummy_snapshot_used_without_culture_source(no_local_culture):
+    titles = _titles(rooms.load_data())
+    assert titles and "테스트강릉호텔" not in titles
+
+
+def test_culture_download_replaces_dummy_snapshot(no_local_culture, file_server, monkeypatch):
+    file_server.files["/hotels.csv"] = CULTURE_CSV.encode("utf-8")
+    url = file_server.url("/hotels.csv")
+    monkeypatch.setenv("CULTURE_CSV_URL", url)
+    reloads = []
+    monkeypatch.setattr(rooms, "_on_culture_downloaded", reloads.append)
+
+    # 다운로드 중인 세대는 dummy, 백그라운드 다운로드가 시작됨
+    first = rooms.load_data()
+    assert "테스트강릉호텔" not in _titles(first)
+    dl = downloads.get(url, rooms.CULTURE_CSV_NAME)
+    assert dl.wait(timeout=30)
+    assert reloads == [dl.dest]
+
+    # 완료 후 reload 가 부르는 load_data → 문화 데이터셋
+    assert _titles(rooms.load_data()) == {"테스트강릉호텔", "테스트해운대호텔"}
@@ -0,0 +1,44 @@
+# tests/test_sharding.py
+# 지역 샤딩(SERVED_REGIONS): 다른 노드 담당 지역 요청은 목록 API 든 /nearby 든 같은 421
+import pytest
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    from fastapi.testclient import TestClient
+
+    from app import datasets, snapshot
+    from app.main import app
+    from app.routers import restaurants
+
+    patch = pytest.MonkeyPatch()
+    patch.setenv("SERVED_REGIONS", "부산")
+    patch.setattr(snapshot, "SNAPSHOT_DIR", tmp_path_factory.mktemp("no_snapshots"))
+    patch.setattr(restaurants, "REST_CANDIDATES", [])
+    datasets.reload()
+    yield TestClient(app)
+    patch.undo()
+    datasets.reload()
+
+
+def test_keyword_outside_served_regions(client):
+    r = client.get("/rooms", params={"city_keyword": "대구"})
+    assert r.status_code == 421
+    assert r.json() == {"detail": "region not served by this node: 대구", "served_regions": ["부산"]}
+
+
+@pytest.mark.parametrize("lat, lng, radius_km", [
+    (35.8714, 128.6014, 2),     # 대구 중구
+    (33.2541, 126.5600, 50),    # 서귀포
+    (37.5665, 126.9780, 5),     # 서울
+])
+def test_nearby_outside_served_regions(client, lat, lng, radius_km):
+    r = client.get("/nearby", params={"lat": lat, "lng": lng, "radius_km": radius_km})
+    assert r.status_code == 421
+    assert r.json() == {"detail": f"region not served by this node: {lat},{lng}", "served_regions": ["부산"]}
+
+
+def test_nearby_inside_served_regions(client):
+    r = client.get("/nearby", params={"lat": 35.1587, "lng": 129.1604, "radius_km": 5})
+    assert r.status_code == 200
+    assert r.json()
@@ -0,0 +1,48 @@
+# tests/test_snapshot.py
+# 스냅샷 쓰기/읽기 왕복 + 서빙 경로는 크기만, sha256 은 verify 때만
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app import snapshot
+
+
+@pytest.fixture
+def snap_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, "SNAPSHOT_DIR", tmp_path)
+    df = pd.DataFrame(
+        {
+            "name": ["강릉횟집", None, "해운대국밥"],
+            "type": pd.Categorical(["한식", "한식", "분식"]),
+            "price": [8000.0, np.nan, 9000.0],
+        },
+        index=[3, 7, 11],
+    )
+    entry = snapshot.write_dataset("demo", {"demo": df}, [])
+    manifest = {"format_version": snapshot.FORMAT_VERSION, "datasets": {"demo": entry}}
+    (tmp_path / snapshot.MANIFEST_NAME).write_text(json.dumps(manifest), encoding="utf-8")
+    return tmp_path, df
+
+
+def test_roundtrip(snap_dir):
+    _, df = snap_dir
+    pd.testing.assert_frame_equal(snapshot.load_dataset("demo")["demo"], df, check_index_type=False)
+
+
+def test_same_size_corruption_is_caught_only_by_verify(snap_dir):
+    base, _ = snap_dir
+    path = base / "demo" / "demo.1.data.npy"
+    data = bytearray(path.read_bytes())
+    data[-2] ^= 1
+    path.write_bytes(bytes(data))
+    assert snapshot.load_dataset("demo") is not None
+    assert snapshot.load_dataset("demo", verify=True) is None
+
+
+def test_truncated_file_is_ignored(snap_dir):
+    base, _ = snap_dir
+    path = base / "demo" / "demo.3.npy"
+    path.write_bytes(path.read_bytes()[:-8])
+    assert snapshot.load_dataset("demo") is None
@@ -0,0 +1,41 @@
+# tests/test_spatial.py
+# 격자 공간 인덱스 회귀 테스트 — 전체 점 haversine 과 같은 결과/순서
+import random
+
+import numpy as np
+import pytest
+
+from app import geo, spatial
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = random.Random(5)
+    lat = [rng.uniform(33.0, 38.5) for _ in range(3000)]
+    lng = [rng.uniform(125.0, 130.0) for _ in range(3000)]
+    # 좌표 없는 점, 같은 좌표 점
+    lat[:20] = [float("nan")] * 20
+    lat[20:30], lng[20:30] = [37.5665] * 10, [126.9780] * 10
+    return np.array(lat), np.array(lng)
+
+
+@pytest.mark.parametrize("cell_deg", [0.02, 0.5])
+@pytest.mark.parametrize("lat0, lng0, radius_km", [
+    (37.5665, 126.9780, 0.5), (37.5665, 126.9780, 30), (35.1796, 129.0756, 10),
+    (33.4996, 126.5312, 80), (36.0, 127.5, 300), (38.49, 129.99, 5),
+])
+def test_within_matches_brute_force(points, cell_deg, lat0, lng0, radius_km):
+    lat, lng = points
+    grid = spatial.GridIndex(lat, lng, cell_deg=cell_deg)
+    positions, dist = grid.within(lat0, lng0, radius_km)
+    all_dist = geo.haversine_km(lat, lng, lat0, lng0)
+    want = np.flatnonzero(all_dist <= radius_km)
+    want = want[np.lexsort((want, all_dist[want]))]
+    assert positions.tolist() == want.tolist()
+    assert np.allclose(dist, all_dist[want])
+
+
+def test_nan_points_are_skipped(points):
+    lat, lng = points
+    grid = spatial.GridIndex(lat, lng)
+    assert len(grid) == int(np.isfinite(lat).sum())